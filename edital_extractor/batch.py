@@ -0,0 +1,420 @@
+"""
+Processamento em lote de editais.
+
+Os PDFs de um diretório (ou de uma lista de arquivos) são distribuídos entre
+processos que importam os módulos e carregam o modelo OCR uma única vez e
+então processam um documento após o outro. Cada documento tem um tempo
+limite; o processo que passa do limite é encerrado e substituído.
+
+O resultado de cada documento (sucesso, erro ou tempo esgotado) é acrescentado
+a um manifesto JSONL assim que o documento termina. Ao rodar de novo com o
+mesmo manifesto, os documentos já registrados (e não modificados desde então)
+são pulados, de modo que um lote interrompido continua de onde parou.
+"""
+
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import time
+from collections import deque
+from datetime import datetime
+from multiprocessing.connection import wait
+from .processors.pdf_processor import PDFProcessor
+from .utils.ocr_processor import OCRProcessor
+from .utils.ocr_pool import limit_threads
+from .utils.ocr_cache import OCRCache
+from .utils.gazetteer import load_gazetteer
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Status registrados no manifesto
+STATUS_OK = 'ok'
+STATUS_ERROR = 'erro'
+STATUS_TIMEOUT = 'tempo_esgotado'
+
+# Nome do manifesto dentro do diretório de saída, quando não indicado
+MANIFEST_NAME = 'manifesto.jsonl'
+
+# Estado de cada processo do lote
+_worker_ocr = None
+_worker_options = {}
+
+
+def _init_worker(options, debug):
+    """Inicializa um processo do lote: carrega o modelo OCR e os dicionários de entidades."""
+    global _worker_ocr, _worker_options
+    
+    # Os registros de cada documento ficam no manifesto; os processos só mostram avisos
+    if not debug:
+        logging.getLogger().setLevel(logging.WARNING)
+    
+    _worker_options = dict(options)
+    ocr_threads = _worker_options.pop('ocr_threads', None)
+    cache_dir = _worker_options.pop('ocr_cache_dir', None)
+    cache_size_mb = _worker_options.pop('ocr_cache_size_mb', 1024)
+    if _worker_options.get('use_ocr', True):
+        limit_threads(ocr_threads)
+        cache = OCRCache(cache_dir, cache_size_mb) if cache_dir else None
+        _worker_ocr = OCRProcessor(cache=cache)
+    
+    for name in ('bancas', 'orgaos', 'cargos'):
+        load_gazetteer(name)
+
+
+def _process_document(pdf_path, output_dir):
+    """Processa um documento no processo do lote e resume o resultado."""
+    start = time.perf_counter()
+    try:
+        processor = PDFProcessor(pdf_path, output_dir=output_dir, ocr_processor=_worker_ocr,
+                                 **_worker_options)
+        data = processor.process()
+    except Exception as e:
+        return {
+            'status': STATUS_ERROR,
+            'segundos': round(time.perf_counter() - start, 3),
+            'erro': f"{type(e).__name__}: {e}"
+        }
+    
+    return {
+        'status': STATUS_OK,
+        'segundos': round(time.perf_counter() - start, 3),
+        'paginas': processor.document_info['total_pages'],
+        'cargos': len(data.get('cargos', [])),
+        'eventos': len(data.get('cronograma', []))
+    }
+
+
+def _worker_main(conn, options, debug):
+    """Laço de um processo do lote: recebe (PDF, diretório de saída) e devolve o resumo."""
+    _init_worker(options, debug)
+    conn.send(os.getpid())  # Pronto para receber documentos
+    
+    while True:
+        try:
+            task = conn.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+        conn.send(_process_document(*task))
+
+
+def collect_pdfs(inputs):
+    """
+    Reúne os PDFs a processar.
+    
+    Args:
+        inputs (list): Diretórios (percorridos recursivamente), arquivos PDF ou
+            listas de arquivos (um caminho por linha; linhas vazias e iniciadas
+            por "#" são ignoradas).
+            
+    Returns:
+        list: Pares (caminho absoluto do PDF, nome do diretório de saída), sem
+            repetições e na ordem das entradas. O nome é o caminho relativo ao
+            diretório de entrada, sem a extensão; nomes repetidos recebem um
+            sufixo com o hash do caminho.
+    """
+    found = []
+    for item in inputs:
+        if os.path.isdir(item):
+            root = os.path.abspath(item)
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames.sort()
+                for filename in sorted(filenames):
+                    if filename.lower().endswith('.pdf'):
+                        path = os.path.join(dirpath, filename)
+                        found.append((path, os.path.splitext(os.path.relpath(path, root))[0]))
+        elif item.lower().endswith('.pdf'):
+            path = os.path.abspath(item)
+            found.append((path, os.path.splitext(os.path.basename(path))[0]))
+        else:
+            with open(item, encoding='utf-8') as f:
+                for line in f:
+                    line = line.strip()
+                    if line and not line.startswith('#'):
+                        path = os.path.abspath(line)
+                        found.append((path, os.path.splitext(os.path.basename(path))[0]))
+    
+    pdfs = []
+    seen = set()
+    counts = {}
+    for path, name in found:
+        if path not in seen:
+            seen.add(path)
+            pdfs.append((path, name))
+            counts[name] = counts.get(name, 0) + 1
+    return [
+        (path, name if counts[name] == 1 else f"{name}-{hashlib.sha1(path.encode('utf-8')).hexdigest()[:8]}")
+        for path, name in pdfs
+    ]
+
+
+def read_manifest(manifest_path):
+    """
+    Lê o manifesto de um lote.
+    
+    Args:
+        manifest_path (str): Caminho do manifesto JSONL.
+        
+    Returns:
+        dict: Caminho do PDF -> último registro do documento. Linhas
+            incompletas (de uma execução interrompida no meio da escrita) são
+            ignoradas.
+    """
+    records = {}
+    if not os.path.exists(manifest_path):
+        return records
+    
+    with open(manifest_path, encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Linha {line_number} do manifesto ignorada (incompleta).")
+                continue
+            records[record['pdf']] = record
+    return records
+
+
+class WorkerProcess:
+    """
+    Processo de extração (do lote ou do serviço) e o documento que ele está processando.
+    
+    O processo carrega os modelos ao iniciar, avisa quando está pronto (pid) e
+    então processa os documentos recebidos pelo pipe, um por vez.
+    """
+    
+    __slots__ = ('process', 'conn', 'pid', 'task', 'started')
+    
+    def __init__(self, context, options, debug):
+        """
+        Inicia o processo.
+        
+        Args:
+            context: Contexto do multiprocessing usado para criar o processo.
+            options (dict): Opções do PDFProcessor.
+            debug (bool): Se True, o processo mostra os logs de cada documento.
+        """
+        parent_conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, options, debug))
+        self.process.start()
+        child_conn.close()
+        self.conn = parent_conn
+        self.pid = None     # Definido quando o processo termina de carregar
+        self.task = None    # Documento em processamento
+        self.started = None
+    
+    @property
+    def idle(self):
+        return self.pid is not None and self.task is None
+    
+    def wait_ready(self):
+        """Aguarda o processo terminar de carregar os modelos."""
+        try:
+            self.pid = self.conn.recv()
+        except EOFError:
+            self.process.join()
+            raise RuntimeError(f"Falha ao iniciar processo de extração (código {self.process.exitcode}).")
+    
+    def assign(self, task):
+        """Envia um documento ao processo."""
+        self.task = task
+        self.started = time.perf_counter()
+        self.conn.send((task['pdf'], task['saida']))
+    
+    def stop(self, graceful=True):
+        """Encerra o processo (aguardando o documento atual, se graceful)."""
+        if graceful and self.process.is_alive():
+            try:
+                self.conn.send(None)
+            except OSError:
+                pass
+            self.process.join(5)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.process.join()
+        self.conn.close()
+
+
+class BatchProcessor:
+    """Processa um lote de editais em processos com os modelos carregados, com manifesto retomável."""
+    
+    def __init__(self, output_dir, manifest_path=None, jobs=1, timeout=600,
+                 retry_failed=False, debug=False, **processor_options):
+        """
+        Inicializa o processador em lote.
+        
+        Os processos são iniciados com o método "spawn" (como no pool OCR) e cada
+        um processa um documento por vez, com o PDFProcessor configurado por
+        processor_options e o mesmo OCRProcessor para todos os documentos.
+        
+        Args:
+            output_dir (str): Diretório de saída; cada documento é gravado em um subdiretório.
+            manifest_path (str): Caminho do manifesto JSONL. Padrão: manifesto.jsonl
+                no diretório de saída.
+            jobs (int): Número de processos (documentos processados ao mesmo tempo).
+            timeout (float): Tempo limite por documento em segundos (0 ou None: sem limite).
+            retry_failed (bool): Se True, documentos registrados com erro ou tempo
+                esgotado são processados de novo.
+            debug (bool): Se True, os processos mostram os logs de cada documento.
+            **processor_options: Opções repassadas ao PDFProcessor (use_ocr,
+                ocr_threads, ocr_cache_dir, cache_dir, table_engine, streaming etc.).
+        """
+        self.output_dir = os.path.abspath(output_dir)
+        self.manifest_path = manifest_path or os.path.join(output_dir, MANIFEST_NAME)
+        self.jobs = max(1, jobs or 1)
+        self.timeout = timeout or None
+        self.retry_failed = retry_failed
+        self.debug = debug
+        self.processor_options = processor_options
+        self.context = multiprocessing.get_context('spawn')
+    
+    def pending(self, pdfs):
+        """
+        Seleciona os documentos que ainda precisam ser processados.
+        
+        Um documento é pulado se o manifesto já o registra com o mesmo tamanho e
+        data de modificação e com sucesso (ou com qualquer status, se retry_failed
+        é False).
+        
+        Args:
+            pdfs (list): Pares (caminho do PDF, nome do diretório de saída), como em collect_pdfs.
+            
+        Returns:
+            list: Tarefas (dicionários com pdf, saida, tamanho e modificado_ns).
+        """
+        done = read_manifest(self.manifest_path)
+        tasks = []
+        for path, name in pdfs:
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                logger.error(f"PDF não encontrado: {path} ({e})")
+                continue
+            
+            record = done.get(path)
+            if (record and record.get('tamanho') == stat.st_size
+                    and record.get('modificado_ns') == stat.st_mtime_ns
+                    and (record['status'] == STATUS_OK or not self.retry_failed)):
+                continue
+            
+            tasks.append({
+                'pdf': path,
+                'saida': os.path.join(self.output_dir, name),
+                'tamanho': stat.st_size,
+                'modificado_ns': stat.st_mtime_ns
+            })
+        return tasks
+    
+    def run(self, pdfs):
+        """
+        Processa os documentos pendentes do lote.
+        
+        Args:
+            pdfs (list): Pares (caminho do PDF, nome do diretório de saída), como em collect_pdfs.
+            
+        Returns:
+            dict: Número de documentos por status nesta execução, além de
+                "pulados" (já registrados no manifesto) e "segundos" (duração total).
+        """
+        start = time.perf_counter()
+        tasks = deque(self.pending(pdfs))
+        summary = {STATUS_OK: 0, STATUS_ERROR: 0, STATUS_TIMEOUT: 0,
+                   'pulados': len(pdfs) - len(tasks), 'segundos': 0.0}
+        total = len(tasks)
+        logger.info(f"Lote: {len(pdfs)} documentos, {summary['pulados']} já registrados no manifesto, "
+                    f"{total} a processar em {min(self.jobs, total)} processo(s).")
+        if not tasks:
+            return summary
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.manifest_path)), exist_ok=True)
+        workers = []
+        with open(self.manifest_path, 'a', encoding='utf-8') as manifest:
+            
+            def record(worker, result):
+                """Acrescenta o resultado do documento ao manifesto."""
+                entry = dict(worker.task, processo=worker.pid, **result,
+                             concluido_em=datetime.now().isoformat(timespec='seconds'))
+                manifest.write(json.dumps(entry, ensure_ascii=False) + '\n')
+                manifest.flush()
+                summary[entry['status']] += 1
+                done = sum(summary[status] for status in (STATUS_OK, STATUS_ERROR, STATUS_TIMEOUT))
+                log = logger.info if entry['status'] == STATUS_OK else logger.error
+                log(f"[{done}/{total}] {entry['status']} em {entry['segundos']:.1f}s: {entry['pdf']}"
+                    + (f" ({entry['erro']})" if 'erro' in entry else ''))
+                worker.task = None
+            
+            def replace(worker):
+                """Substitui um processo encerrado ou interrompido por um novo."""
+                worker.stop(graceful=False)
+                workers[workers.index(worker)] = WorkerProcess(self.context, self.processor_options, self.debug)
+            
+            finished = False
+            try:
+                for _ in range(min(self.jobs, total)):
+                    workers.append(WorkerProcess(self.context, self.processor_options, self.debug))
+                
+                while tasks or any(worker.task for worker in workers):
+                    for worker in workers:
+                        if worker.idle and tasks:
+                            worker.assign(tasks.popleft())
+                    
+                    # Aguardar um resultado, o fim de um processo ou o próximo tempo limite
+                    wait_time = None
+                    if self.timeout:
+                        deadlines = [worker.started + self.timeout for worker in workers if worker.task]
+                        if deadlines:
+                            wait_time = max(0, min(deadlines) - time.perf_counter())
+                    ready = wait([worker.conn for worker in workers]
+                                 + [worker.process.sentinel for worker in workers], wait_time)
+                    
+                    for worker in list(workers):
+                        if worker.conn in ready:
+                            try:
+                                message = worker.conn.recv()
+                            except EOFError:
+                                message = None
+                            if message is not None:
+                                if worker.pid is None:
+                                    worker.pid = message
+                                else:
+                                    record(worker, message)
+                                continue
+                        
+                        if worker.process.sentinel in ready or worker.conn in ready:
+                            # O processo terminou sem responder
+                            worker.process.join()
+                            if worker.pid is None:
+                                raise RuntimeError(f"Falha ao iniciar processo de extração "
+                                                   f"(código {worker.process.exitcode}).")
+                            if worker.task:
+                                record(worker, {
+                                    'status': STATUS_ERROR,
+                                    'segundos': round(time.perf_counter() - worker.started, 3),
+                                    'erro': f"processo encerrado (código {worker.process.exitcode})"
+                                })
+                            replace(worker)
+                        elif (worker.task and self.timeout
+                              and time.perf_counter() - worker.started >= self.timeout):
+                            record(worker, {
+                                'status': STATUS_TIMEOUT,
+                                'segundos': round(time.perf_counter() - worker.started, 3)
+                            })
+                            replace(worker)
+                finished = True
+            finally:
+                # Interrompido (erro ou Ctrl+C): os documentos em andamento não são aguardados
+                for worker in workers:
+                    worker.stop(graceful=finished)
+        
+        summary['segundos'] = round(time.perf_counter() - start, 3)
+        logger.info(f"Lote concluído em {summary['segundos']:.1f}s: {summary[STATUS_OK]} ok, "
+                    f"{summary[STATUS_ERROR]} com erro, {summary[STATUS_TIMEOUT]} com tempo esgotado.")
+        return summary
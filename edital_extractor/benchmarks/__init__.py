@@ -0,0 +1,3 @@
+"""
+Benchmarks e geradores de editais sintéticos para medir o desempenho do extrator.
+"""
@@ -0,0 +1,75 @@
+"""
+Benchmark do processamento em lote: uma execução da linha de comando por
+edital (cada uma pagando a inicialização do interpretador, as importações e
+o carregamento dos modelos) contra o subcomando "batch", com processos que
+carregam tudo uma única vez.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_batch --docs 20 --pages 10 --jobs 1 2
+"""
+
+import argparse
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from ..batch import STATUS_OK, BatchProcessor, collect_pdfs
+from .synthetic import generate_edital
+
+
+def run_per_document(pdfs, output_dir, cli_args):
+    """Executa a linha de comando uma vez por edital, em sequência."""
+    start = time.perf_counter()
+    for path, name in pdfs:
+        subprocess.run([sys.executable, '-m', 'edital_extractor.cli', path,
+                        '-o', os.path.join(output_dir, name), *cli_args],
+                       check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def run_batch(pdfs, output_dir, jobs, use_ocr):
+    """Processa os editais com o BatchProcessor (manifesto novo)."""
+    start = time.perf_counter()
+    summary = BatchProcessor(output_dir, jobs=jobs, timeout=0, use_ocr=use_ocr).run(pdfs)
+    elapsed = time.perf_counter() - start
+    if summary[STATUS_OK] != len(pdfs):
+        raise RuntimeError(f"Lote com falhas: {summary}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do processamento em lote.')
+    parser.add_argument('--docs', type=int, default=20, help='Número de editais sintéticos.')
+    parser.add_argument('--pages', type=int, default=10, help='Páginas de cada edital.')
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1, 2], help='Números de processos do lote.')
+    parser.add_argument('--ocr', action='store_true',
+                        help='Usa OCR (com uma página digitalizada a cada 5); inclui o carregamento do modelo.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    cli_args = [] if args.ocr else ['--no-ocr']
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        input_dir = os.path.join(tmp, 'editais')
+        os.makedirs(input_dir)
+        for i in range(args.docs):
+            generate_edital(os.path.join(input_dir, f'edital_{i:04d}.pdf'), args.pages,
+                            scanned_every=5 if args.ocr else 0, table_every=3, seed=i)
+        pdfs = collect_pdfs([input_dir])
+        
+        print(f"{args.docs} editais de {args.pages} páginas")
+        print(f"{'modo':<22}{'tempo (s)':>11}{'editais/s':>11}{'ganho':>8}")
+        
+        baseline = run_per_document(pdfs, os.path.join(tmp, 'cli'), cli_args)
+        print(f"{'um processo por PDF':<22}{baseline:>11.2f}{args.docs / baseline:>11.2f}{1:>7.1f}x")
+        
+        for jobs in args.jobs:
+            elapsed = run_batch(pdfs, os.path.join(tmp, f'lote_{jobs}'), jobs, args.ocr)
+            print(f"{f'batch --jobs {jobs}':<22}{elapsed:>11.2f}{args.docs / elapsed:>11.2f}"
+                  f"{baseline / elapsed:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
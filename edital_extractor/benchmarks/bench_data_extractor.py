@@ -0,0 +1,65 @@
+"""
+Micro-benchmark da extração de dados estruturados: tempo de cada método
+extract_* do DataExtractor sobre textos sintéticos grandes de cada seção.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_data_extractor --cargos 500 --repeat 5
+    python -m edital_extractor.benchmarks.bench_data_extractor --cargos 500 --heading FUNÇÃO
+"""
+
+import argparse
+import logging
+import time
+from ..extractors.data_extractor import DataExtractor
+from .synthetic import generate_section_texts
+
+# Método do DataExtractor -> seção cujo texto ele recebe
+METHODS = [
+    ('extract_identification', 'header'),
+    ('extract_schedule', 'cronograma'),
+    ('extract_registration_info', 'inscricao'),
+    ('extract_positions', 'cargos'),
+    ('extract_vacancies', 'vagas'),
+    ('extract_syllabus', 'conteudo_programatico'),
+]
+
+
+def time_method(method, text, repeat):
+    """
+    Executa o método `repeat` vezes, cada vez com um extrator novo.
+    
+    Returns:
+        tuple: (melhor tempo em segundos, resultado da última execução)
+    """
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        extractor = DataExtractor()
+        start = time.perf_counter()
+        result = getattr(extractor, method)(text)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Micro-benchmark da extração de dados estruturados.')
+    parser.add_argument('--cargos', type=int, default=500, help='Número de cargos dos textos sintéticos.')
+    parser.add_argument('--events', type=int, default=200, help='Número de eventos do cronograma.')
+    parser.add_argument('--heading', default='CARGO', choices=['CARGO', 'FUNÇÃO'],
+                        help='Palavra que abre os títulos de cargo. Com "FUNÇÃO", nenhum título '
+                             'encerra a seção do cargo anterior.')
+    parser.add_argument('--repeat', type=int, default=5, help='Execuções de cada método (vale a melhor).')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    texts = generate_section_texts(cargos=args.cargos, events=args.events, heading=args.heading)
+    
+    print(f"{'método':<28}{'texto (KiB)':>12}{'tempo (ms)':>12}{'itens':>8}")
+    for method, section in METHODS:
+        text = texts[section]
+        elapsed, result = time_method(method, text, args.repeat)
+        print(f"{method:<28}{len(text) / 1024:>12.1f}{elapsed * 1000:>12.2f}{len(result):>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Benchmark do reconhecimento de entidades: o laço antigo, com uma busca de
+expressão regular por nome, contra o autômato do Gazetteer, com os
+dicionários de DATA_DIR e com dicionários ampliados por nomes fictícios.
+Antes da medição, confere o órgão reconhecido por
+DataExtractor.extract_identification em cabeçalhos reais que já levaram a
+resultados errados; termina com código 1 se algum divergir.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_gazetteer --extra 0 1000 5000
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+from ..utils.gazetteer import DATA_DIR, Gazetteer
+from ..extractors.data_extractor import DataExtractor
+from .synthetic import WORDS, generate_section_texts
+
+# Cabeçalhos de editais e o órgão esperado: siglas citadas em minúsculas ou
+# fora da linha do órgão não podem substituí-lo
+IDENTIFICATION_CASES = [
+    ("PREFEITURA MUNICIPAL DE ITABUNA\nEDITAL Nº 01/2024\n"
+     "A Prefeita Ana Maria Souza, no uso de suas atribuições legais, torna público...",
+     "PREFEITURA MUNICIPAL DE ITABUNA"),
+    ("GOVERNO DO ESTADO DO PIAUÍ\nSECRETARIA DE ESTADO DA EDUCAÇÃO\nEDITAL Nº 02/2024\n"
+     "O Secretário torna pública a abertura do concurso, conforme parecer do MEC...",
+     "GOVERNO DO ESTADO DO PIAUÍ"),
+    ("MINISTÉRIO DA EDUCAÇÃO - MEC\nEDITAL Nº 3/2024", "Ministério da Educação"),
+]
+
+
+def check_identification():
+    """
+    Confere o órgão reconhecido em cada cabeçalho de IDENTIFICATION_CASES.
+    
+    Returns:
+        int: Número de cabeçalhos com resultado errado.
+    """
+    failures = 0
+    for header, expected in IDENTIFICATION_CASES:
+        orgao = DataExtractor().extract_identification(header).get('orgao')
+        if orgao != expected:
+            failures += 1
+            print(f"ERRO: {header.splitlines()[0]!r}: órgão {orgao!r}, esperado {expected!r}")
+    print(f"Órgãos: {len(IDENTIFICATION_CASES) - failures} de {len(IDENTIFICATION_CASES)} cabeçalhos corretos")
+    return failures
+
+
+def load_entries():
+    """Lê as entidades de todos os dicionários de DATA_DIR, como (nome, nomes alternativos)."""
+    entries = []
+    for filename in sorted(os.listdir(DATA_DIR)):
+        if not filename.endswith('.txt'):
+            continue
+        with open(os.path.join(DATA_DIR, filename), encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    names = [name.strip() for name in line.split('|')]
+                    entries.append((names[0], names[1:]))
+    return entries
+
+
+def extra_entries(count, seed=0):
+    """Gera entidades fictícias, como os órgãos municipais de um dicionário nacional."""
+    rng = random.Random(seed)
+    return [(f"Prefeitura Municipal de {' '.join(rng.choice(WORDS) for _ in range(2)).title()} {i}", [])
+            for i in range(count)]
+
+
+def legacy_find(patterns, text):
+    """Reproduz o laço antigo: uma busca por nome (e por nome alternativo)."""
+    found = []
+    for name, alias_patterns in patterns:
+        if any(pattern.search(text) for pattern in alias_patterns):
+            found.append(name)
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do reconhecimento de entidades.')
+    parser.add_argument('--extra', type=int, nargs='+', default=[0, 1000, 5000],
+                        help='Números de entidades fictícias adicionadas aos dicionários.')
+    parser.add_argument('--paragraphs', type=int, default=200, help='Parágrafos do cabeçalho sintético.')
+    args = parser.parse_args()
+    
+    failures = check_identification()
+    
+    text = generate_section_texts(cargos=1, paragraphs=args.paragraphs)['header']
+    entries = load_entries()
+    
+    print(f"Texto: {len(text) / 1024:.1f} KiB")
+    print(f"{'entidades':>10}{'laço (s)':>10}{'autômato (s)':>14}{'ganho':>8}{'cobre o laço':>14}")
+    for extra in args.extra:
+        all_entries = entries + extra_entries(extra)
+        patterns = [
+            (name, [re.compile(r'\b' + re.escape(alias) + r'\b', re.IGNORECASE) for alias in [name, *aliases]])
+            for name, aliases in all_entries
+        ]
+        gazetteer = Gazetteer(all_entries)
+        gazetteer.find_all('')  # Monta o autômato fora da medição
+        
+        start = time.perf_counter()
+        legacy = legacy_find(patterns, text)
+        legacy_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        mentions = gazetteer.find_all(text)
+        gazetteer_time = time.perf_counter() - start
+        
+        # O autômato ignora acentos; os nomes encontrados pelo laço também devem estar lá
+        same = set(legacy) <= {mention.name for mention in mentions}
+        print(f"{len(all_entries):>10}{legacy_time:>10.3f}{gazetteer_time:>14.3f}"
+              f"{legacy_time / gazetteer_time:>7.1f}x{'sim' if same else 'não':>14}")
+    
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
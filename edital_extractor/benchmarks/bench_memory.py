@@ -0,0 +1,132 @@
+"""
+Benchmark de memória do pipeline: pico de memória residente (RSS) ao
+processar editais sintéticos grandes, medido em um processo novo para cada
+tamanho.
+
+Com --max-slope, o benchmark verifica o limite de memória: ajusta uma reta
+de mínimos quadrados ao pico de RSS em função do número de páginas (com pelo
+menos três tamanhos) e termina com erro se a inclinação, em KiB por página,
+passar do valor indicado.
+
+Mesmo no modo streaming, em que nenhuma estrutura do pipeline cresce com o
+documento, o pico de RSS não é constante: os leitores de PDF mantêm suas
+tabelas de objetos enquanto o documento está aberto. Nos editais sintéticos
+(generate_edital, uma tabela a cada 10 páginas), medidos entre 200 e 900
+páginas:
+
+    MuPDF (texto, imagens e desenhos de todas as páginas)     ~15 KiB/página
+    pdfplumber/pdfminer (lista de páginas e cache de objetos)  ~23 KiB/página
+    modo streaming completo                                   ~55 KiB/página
+    modo padrão                                               ~95 KiB/página
+
+O limite de 64 KiB/página cobre os leitores e a fragmentação do heap, com
+margem, e falha se o pipeline voltar a reter dados de cada página.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_memory --pages 900
+    python -m edital_extractor.benchmarks.bench_memory --stream --pages 200 550 900 --max-slope 64
+"""
+
+import argparse
+import logging
+import os
+import pickle
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from .synthetic import generate_edital
+
+
+def run_child(pdf_path, output_dir, streaming=False):
+    """Processa o PDF e imprime o pico de RSS e o tamanho do resultado da etapa de texto."""
+    from ..processors.pdf_processor import PDFProcessor
+    
+    logging.disable(logging.CRITICAL)
+    start = time.perf_counter()
+    processor = PDFProcessor(pdf_path, output_dir=output_dir, use_ocr=False, streaming=streaming)
+    processor.process()
+    elapsed = time.perf_counter() - start
+    
+    # No modo streaming nenhuma página fica retida
+    text_stage = {'extracted_text': processor.extracted_text,
+                  'document': processor.document}
+    retained = len(pickle.dumps(text_stage, protocol=pickle.HIGHEST_PROTOCOL))
+    # ru_maxrss é dado em KiB no Linux
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{peak_kib} {retained} {elapsed:.3f}")
+
+
+def measure(pdf_path, output_dir, streaming):
+    """
+    Processa o PDF em um processo novo.
+    
+    Returns:
+        tuple: (pico de RSS em MiB, etapa de texto serializada em MiB, tempo em segundos)
+    """
+    command = [sys.executable, '-m', __spec__.name, '--child', pdf_path, output_dir]
+    if streaming:
+        command.append('--stream')
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+    peak_kib, retained, elapsed = result.stdout.split()
+    return int(peak_kib) / 1024, int(retained) / 1024 / 1024, float(elapsed)
+
+
+def rss_slope(sizes, peaks):
+    """
+    Inclinação da reta de mínimos quadrados do pico de RSS contra o número de páginas.
+    
+    Args:
+        sizes (list): Números de páginas.
+        peaks (list): Picos de RSS em MiB, na ordem de sizes.
+        
+    Returns:
+        float: Crescimento em KiB por página.
+    """
+    mean_x, mean_y = sum(sizes) / len(sizes), sum(peaks) / len(peaks)
+    variance = sum((x - mean_x) ** 2 for x in sizes)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(sizes, peaks)) / variance * 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark de memória do pipeline.')
+    parser.add_argument('--pages', type=int, nargs='+', default=[900],
+                        help='Números de páginas dos editais sintéticos.')
+    parser.add_argument('--table-every', type=int, default=10, help='Uma tabela a cada N páginas.')
+    parser.add_argument('--stream', action='store_true', help='Processa no modo streaming.')
+    parser.add_argument('--max-slope', type=float, metavar='KIB',
+                        help='Crescimento máximo do pico de RSS, em KiB por página (exige três tamanhos ou mais).')
+    parser.add_argument('--child', nargs=2, metavar=('PDF', 'SAIDA'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        run_child(*args.child, streaming=args.stream)
+        return
+    
+    sizes = sorted(set(args.pages))
+    if args.max_slope is not None and len(sizes) < 3:
+        parser.error('--max-slope exige pelo menos três tamanhos em --pages.')
+    peaks = {}
+    
+    print(f"Modo: {'streaming' if args.stream else 'padrão'}")
+    print(f"{'páginas':>8}{'pico de RSS (MiB)':>19}{'etapa de texto (MiB)':>22}{'tempo (s)':>11}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in sizes:
+            pdf_path = generate_edital(os.path.join(tmp, f'edital_{pages}.pdf'), pages,
+                                       table_every=args.table_every)
+            peak, retained, elapsed = measure(pdf_path, os.path.join(tmp, f'saida_{pages}'), args.stream)
+            peaks[pages] = peak
+            print(f"{pages:>8}{peak:>19.1f}{retained:>22.1f}{elapsed:>11.2f}")
+    
+    if args.max_slope is not None:
+        slope = rss_slope(sizes, [peaks[pages] for pages in sizes])
+        print(f"Crescimento de {sizes[0]} a {sizes[-1]} páginas: {slope:.1f} KiB/página "
+              f"(limite: {args.max_slope:.1f} KiB/página)")
+        if slope > args.max_slope:
+            print("Limite de memória excedido.")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
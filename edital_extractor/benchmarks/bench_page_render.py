@@ -0,0 +1,58 @@
+"""
+Benchmark da renderização de páginas para OCR: caminho PNG (RGB, codificação
+e decodificação, conversão para cinza) contra o pixmap em cinza sem cópias.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_page_render --pages 20 --dpi 300
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import fitz  # PyMuPDF
+from ..utils.pdf_loader import render_page, render_page_array
+from .synthetic import generate_edital
+
+
+def png_path(page, dpi):
+    """Caminho antigo: pixmap RGB -> PNG -> PIL -> escala de cinza."""
+    return render_page(page, dpi).convert('L')
+
+
+def gray_path(page, dpi):
+    """Pixmap em cinza envolvido como imagem PIL."""
+    return render_page(page, dpi, grayscale=True)
+
+
+def array_path(page, dpi):
+    """Pixmap em cinza como array NumPy."""
+    return render_page_array(page, dpi)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da renderização de páginas para OCR.')
+    parser.add_argument('--pages', type=int, default=20, help='Número de páginas digitalizadas.')
+    parser.add_argument('--dpi', type=int, default=300, help='Resolução da renderização.')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = generate_edital(os.path.join(tmp, 'edital.pdf'), args.pages, scanned_every=1)
+        doc = fitz.open(pdf_path)
+        
+        print(f"Páginas: {args.pages} a {args.dpi} DPI")
+        print(f"{'caminho':<12}{'ms/página':>12}{'speedup':>10}")
+        reference = None
+        for name, func in (('png', png_path), ('cinza', gray_path), ('array', array_path)):
+            start = time.perf_counter()
+            for page_num in range(len(doc)):
+                func(doc[page_num], args.dpi)
+            elapsed = (time.perf_counter() - start) / len(doc) * 1000
+            reference = reference or elapsed
+            print(f"{name:<12}{elapsed:>12.1f}{reference / elapsed:>10.2f}")
+        
+        doc.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark da leitura de páginas: caminho antigo (duas leituras por página)
+contra a leitura única de PDFLoader.analyze_document().
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_page_walk --pages 400
+"""
+
+import argparse
+import os
+import tempfile
+import time
+import fitz  # PyMuPDF
+from ..utils.pdf_loader import PDFLoader, build_page_record
+from .synthetic import generate_edital
+
+
+def legacy_two_pass(pdf_path):
+    """Reproduz o caminho antigo: get_text("text") + imagens e depois get_text("dict", clip)."""
+    doc = fitz.open(pdf_path)
+    
+    for page_num in range(len(doc)):
+        page = doc[page_num]
+        text = page.get_text("text")
+        if len(text.strip()) < 50:
+            for img_info in page.get_images(full=True):
+                try:
+                    page.get_image_bbox(img_info)
+                except Exception:
+                    pass
+        
+        page = doc[page_num]
+        rect = page.rect
+        clip = fitz.Rect(rect.x0, rect.y0 + 50, rect.x1, rect.y1 - 50)
+        page.get_text("dict", clip=clip, sort=True)
+    
+    doc.close()
+
+
+def single_pass(pdf_path):
+    """Leitura única: build_page_record() em cada página."""
+    doc = fitz.open(pdf_path)
+    
+    for page_num in range(len(doc)):
+        build_page_record(doc[page_num], page_num)
+    
+    doc.close()
+
+
+def _time(func, pdf_path, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(pdf_path)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _time_loader(pdf_path, repeat):
+    """Mede apenas analyze_document(), sem a abertura do documento."""
+    best = float('inf')
+    for _ in range(repeat):
+        loader = PDFLoader(pdf_path)
+        start = time.perf_counter()
+        loader.analyze_document()
+        best = min(best, time.perf_counter() - start)
+        loader.close()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da leitura de páginas do PDFLoader.')
+    parser.add_argument('--pages', type=int, default=400, help='Número de páginas do edital sintético.')
+    parser.add_argument('--scanned-every', type=int, default=20, help='Uma página digitalizada a cada N.')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetições (é reportado o melhor tempo).')
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = generate_edital(os.path.join(tmp, 'edital.pdf'), args.pages, args.scanned_every)
+        
+        legacy = _time(legacy_two_pass, pdf_path, args.repeat)
+        single = _time(single_pass, pdf_path, args.repeat)
+        analyze = _time_loader(pdf_path, args.repeat)
+    
+    print(f"Páginas: {args.pages}")
+    print(f"{'caminho':<20}{'tempo (s)':>12}{'páginas/s':>12}{'ms/página':>12}")
+    for name, elapsed in (('duas leituras', legacy), ('leitura única', single), ('analyze_document', analyze)):
+        print(f"{name:<20}{elapsed:>12.3f}{args.pages / elapsed:>12.1f}{elapsed / args.pages * 1000:>12.2f}")
+    print(f"Redução de custo por página: {(1 - single / legacy) * 100:.1f}%")
+
+
+if __name__ == '__main__':
+    main()
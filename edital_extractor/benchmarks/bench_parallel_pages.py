@@ -0,0 +1,58 @@
+"""
+Benchmark de escalabilidade da leitura paralela de páginas.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_parallel_pages --pages 600 --workers 1 2 4 8
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from ..utils.pdf_loader import PDFLoader
+from .synthetic import generate_edital
+
+
+def _run(pdf_path, workers):
+    loader = PDFLoader(pdf_path)
+    start = time.perf_counter()
+    loader.analyze_document(workers=workers)
+    elapsed = time.perf_counter() - start
+    records = loader.page_records
+    loader.close()
+    return elapsed, records
+
+
+def _fingerprint(records):
+    """Resume os registros em ordem para comparar saídas entre execuções."""
+    return [(r.page_num, r.char_count, r.is_scanned, r.page.text,
+             [(b.bbox, b.text, [(s.start, s.end, s.size, s.font) for s in b.spans]) for b in r.page.blocks])
+            for r in records.values()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da leitura paralela de páginas.')
+    parser.add_argument('--pages', type=int, default=600, help='Número de páginas do edital sintético.')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8], help='Números de processos a medir.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = generate_edital(os.path.join(tmp, 'edital.pdf'), args.pages, scanned_every=25)
+        
+        baseline_time, baseline_records = _run(pdf_path, 1)
+        reference = _fingerprint(baseline_records)
+        
+        print(f"Páginas: {args.pages} (CPUs disponíveis: {os.cpu_count()})")
+        print(f"{'processos':>10}{'tempo (s)':>12}{'páginas/s':>12}{'speedup':>10}{'saída':>10}")
+        for workers in args.workers:
+            elapsed, records = (baseline_time, baseline_records) if workers == 1 else _run(pdf_path, workers)
+            same = 'igual' if _fingerprint(records) == reference else 'DIFERENTE'
+            print(f"{workers:>10}{elapsed:>12.3f}{args.pages / elapsed:>12.1f}"
+                  f"{baseline_time / elapsed:>10.2f}{same:>10}")
+
+
+if __name__ == '__main__':
+    main()
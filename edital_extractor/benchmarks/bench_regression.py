@@ -0,0 +1,265 @@
+"""
+Verificação de regressões de desempenho do pipeline completo: processa um
+conjunto fixo de editais sintéticos com PDFProcessor.process(), cada um em um
+processo novo, e compara o tempo total, o tempo de CPU, o pico de memória
+residente (RSS) e o tempo de cada etapa (PDFProcessor.stage_timings) com uma
+linha de base gravada em JSON.
+
+Com --update, as medidas são gravadas como a nova linha de base. Caso
+contrário, o relatório mostra a variação de cada medida e o script termina
+com código 1 se alguma passar da tolerância ou se a linha de base não
+existir. Os tempos dependem da máquina: a linha de base não faz parte do
+pacote e deve ser gravada, fora dele, na mesma máquina em que a verificação
+será feita (linha_de_base_desempenho.json, na raiz do repositório, é
+ignorado pelo git). Cada edital é processado --repeat vezes e vale o
+menor valor de cada medida; as execuções dos editais são intercaladas, de
+modo que uma lentidão passageira da máquina afete todos por igual em vez de
+todas as execuções de um só.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_regression --baseline linha_de_base_desempenho.json --update
+    python -m edital_extractor.benchmarks.bench_regression --baseline linha_de_base_desempenho.json \
+        --tolerance 0.25 --min-delta-ms 50
+"""
+
+import argparse
+import json
+import logging
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from .synthetic import generate_edital, generate_structured_edital
+
+BASELINE_VERSION = 1
+
+# Conjunto fixo de editais: (nome, gerador, argumentos do gerador, opções do
+# PDFProcessor). As sementes são fixas, de modo que o conjunto é o mesmo em
+# todas as execuções.
+CORPUS = [
+    ('estruturado_60', generate_structured_edital, {'pages': 60, 'scanned_every': 10}, {}),
+    ('tabelas_80', generate_edital, {'pages': 80, 'table_every': 5}, {}),
+    ('estruturado_240', generate_structured_edital, {'pages': 240, 'scanned_every': 10}, {}),
+    ('estruturado_240_streaming', generate_structured_edital, {'pages': 240, 'scanned_every': 10},
+     {'streaming': True}),
+]
+
+# Medidas globais de cada edital: (chave, rótulo, unidade)
+TIME_METRICS = [
+    ('tempo_total', 'tempo total', 's'),
+    ('tempo_cpu', 'tempo de CPU', 's'),
+]
+
+
+def run_child(pdf_path, output_dir, options):
+    """Processa o PDF e imprime as medidas em JSON."""
+    from ..processors.pdf_processor import PDFProcessor
+    
+    logging.disable(logging.CRITICAL)
+    processor = PDFProcessor(pdf_path, output_dir=output_dir, use_ocr=False, **options)
+    wall_start = time.perf_counter()
+    cpu_start = time.process_time()
+    processor.process()
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    
+    # ru_maxrss é dado em KiB no Linux
+    peak_kib = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        'paginas': processor.document_info['total_pages'],
+        'tempo_total': wall,
+        'tempo_cpu': cpu,
+        'pico_rss_mib': peak_kib / 1024,
+        'etapas': processor.stage_timings,
+    }))
+
+
+def run_once(pdf_path, output_dir, options):
+    """
+    Processa o PDF uma vez, em um processo novo.
+    
+    Returns:
+        dict: Medidas da execução.
+    """
+    command = [sys.executable, '-m', __spec__.name, '--child', pdf_path, output_dir,
+               '--options', json.dumps(options)]
+    result = subprocess.run(command, check=True, capture_output=True, text=True)
+    return json.loads(result.stdout)
+
+
+def best_of(runs):
+    """
+    Combina as execuções de um edital.
+    
+    Returns:
+        dict: Medidas do edital; de cada medida vale o menor valor entre as execuções.
+    """
+    best = {key: min(run[key] for run in runs) for key in ('tempo_total', 'tempo_cpu', 'pico_rss_mib')}
+    best['paginas'] = runs[0]['paginas']
+    best['etapas'] = {stage: min(run['etapas'][stage] for run in runs) for stage in runs[0]['etapas']}
+    return best
+
+
+def measure_corpus(repeat):
+    """
+    Gera o conjunto de editais e mede cada um `repeat` vezes, intercalando as
+    execuções dos editais.
+    
+    Returns:
+        dict: Nome do edital -> medidas.
+    """
+    runs = {name: [] for name, _, _, _ in CORPUS}
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_paths = {name: generator(os.path.join(tmp, f'{name}.pdf'), **generator_args)
+                     for name, generator, generator_args, _ in CORPUS}
+        for round_num in range(repeat):
+            print(f"Rodada {round_num + 1} de {repeat}...", file=sys.stderr)
+            for name, _, _, options in CORPUS:
+                runs[name].append(run_once(pdf_paths[name], os.path.join(tmp, name), options))
+    return {name: best_of(name_runs) for name, name_runs in runs.items()}
+
+
+def compare(baseline, current, tolerance, min_delta):
+    """
+    Compara uma medida com a linha de base.
+    
+    Args:
+        baseline (float): Valor da linha de base.
+        current (float): Valor atual.
+        tolerance (float): Aumento relativo tolerado (0.25 = 25%).
+        min_delta (float): Aumento absoluto abaixo do qual a variação é ignorada
+            (evita falsos alarmes em medidas pequenas e ruidosas).
+            
+    Returns:
+        str: 'REGRESSÃO', 'melhor' ou '' (dentro da tolerância).
+    """
+    if current > baseline * (1 + tolerance) and current - baseline > min_delta:
+        return 'REGRESSÃO'
+    if current < baseline * (1 - tolerance) and baseline - current > min_delta:
+        return 'melhor'
+    return ''
+
+
+def report(baseline, results, args):
+    """
+    Imprime a comparação de cada edital com a linha de base.
+    
+    Returns:
+        list: Regressões encontradas, como (edital, medida).
+    """
+    regressions = []
+    min_delta_s = args.min_delta_ms / 1000
+    
+    def row(name, label, base, value, tolerance, min_delta):
+        if base is None or value is None:
+            status = 'nova' if base is None else 'ausente'
+            base_text = '-' if base is None else f"{base:.3f}"
+            value_text = '-' if value is None else f"{value:.3f}"
+            print(f"  {label:<34}{base_text:>10}{value_text:>10}{'':>10}  {status}")
+            return
+        status = compare(base, value, tolerance, min_delta)
+        change = (value - base) / base * 100 if base else 0.0
+        print(f"  {label:<34}{base:>10.3f}{value:>10.3f}{change:>+9.1f}%  {status}")
+        if status == 'REGRESSÃO':
+            regressions.append((name, label))
+    
+    for name, current in results.items():
+        base = baseline['editais'].get(name)
+        if base is None:
+            print(f"\n{name}: sem linha de base (use --update para incluí-lo)")
+            continue
+        
+        print(f"\n{name} ({current['paginas']} páginas)")
+        print(f"  {'medida':<34}{'base':>10}{'atual':>10}{'variação':>10}")
+        for key, label, unit in TIME_METRICS:
+            row(name, f"{label} ({unit})", base[key], current[key], args.tolerance, min_delta_s)
+        row(name, 'pico de RSS (MiB)', base['pico_rss_mib'], current['pico_rss_mib'],
+            args.rss_tolerance, args.min_delta_mib)
+        
+        stages = list(base['etapas']) + [stage for stage in current['etapas'] if stage not in base['etapas']]
+        for stage in stages:
+            row(name, f"etapa {stage} (s)", base['etapas'].get(stage), current['etapas'].get(stage),
+                args.tolerance, min_delta_s)
+    
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Verificação de regressões de desempenho do pipeline.')
+    parser.add_argument('--baseline', help='Arquivo JSON da linha de base (obrigatório).')
+    parser.add_argument('--update', action='store_true', help='Grava as medidas como a nova linha de base.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Execuções de cada edital (vale o menor valor de cada medida).')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='Aumento relativo tolerado nos tempos (padrão: 0.25, ou 25%%).')
+    parser.add_argument('--min-delta-ms', type=float, default=50,
+                        help='Aumentos de tempo menores que este valor, em ms, não contam como regressão.')
+    parser.add_argument('--rss-tolerance', type=float, default=0.2,
+                        help='Aumento relativo tolerado no pico de RSS (padrão: 0.2, ou 20%%).')
+    parser.add_argument('--min-delta-mib', type=float, default=10,
+                        help='Aumentos do pico de RSS menores que este valor, em MiB, não contam como regressão.')
+    parser.add_argument('--output', help='Arquivo para gravar as medidas desta execução em JSON.')
+    parser.add_argument('--child', nargs=2, metavar=('PDF', 'SAIDA'), help=argparse.SUPPRESS)
+    parser.add_argument('--options', default='{}', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    if args.child:
+        run_child(*args.child, json.loads(args.options))
+        return 0
+    
+    if not args.baseline:
+        parser.error('informe o arquivo da linha de base com --baseline.')
+    if not args.update and not os.path.exists(args.baseline):
+        print(f"Linha de base não encontrada: {args.baseline}. Grave uma com --update.")
+        return 1
+    
+    measurements = {
+        'versao': BASELINE_VERSION,
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'repeticoes': args.repeat,
+        'editais': measure_corpus(args.repeat),
+    }
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(measurements, f, ensure_ascii=False, indent=2)
+    
+    if args.update:
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(measurements, f, ensure_ascii=False, indent=2)
+        print(f"Linha de base gravada em {args.baseline}")
+        return 0
+    
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('versao') != BASELINE_VERSION:
+        print(f"Linha de base em formato antigo: {args.baseline}. Grave uma nova com --update.")
+        return 1
+    
+    print(f"Linha de base: {args.baseline} ({baseline['data']}, Python {baseline['python']})")
+    if (baseline['python'], baseline['plataforma']) != (measurements['python'], measurements['plataforma']):
+        print(f"Aviso: a linha de base foi gravada em outro ambiente ({baseline['plataforma']}); "
+              f"os tempos podem não ser comparáveis.")
+    print(f"Tolerância: tempos +{args.tolerance:.0%} (mínimo de {args.min_delta_ms:.0f} ms), "
+          f"pico de RSS +{args.rss_tolerance:.0%} (mínimo de {args.min_delta_mib:.0f} MiB)")
+    
+    regressions = report(baseline, measurements['editais'], args)
+    
+    print()
+    if regressions:
+        print(f"FALHA: {len(regressions)} regressões de desempenho:")
+        for name, label in regressions:
+            print(f"  {name}: {label}")
+        return 1
+    print("Nenhuma regressão de desempenho.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
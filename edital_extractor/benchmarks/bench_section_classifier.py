@@ -0,0 +1,76 @@
+"""
+Benchmark da identificação de títulos de seção: o laço antigo, que testa
+cada padrão de SECTION_PATTERNS em ordem, contra o SectionClassifier, com o
+registro atual e com registros ampliados por títulos fictícios.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_section_classifier --extra 0 25 50 100
+"""
+
+import argparse
+import random
+import re
+import time
+from ..utils.regex_patterns import SECTION_RULES, SectionClassifier
+from .synthetic import HEADINGS, WORDS
+
+
+def legacy_classify(patterns, text):
+    """Reproduz o laço antigo: o primeiro padrão que casa define a seção."""
+    for section_type, pattern in patterns:
+        if pattern.search(text):
+            return section_type
+    return None
+
+
+def extra_rules(count):
+    """Gera regras fictícias, como os títulos adicionais de editais reais."""
+    rules = []
+    for i in range(count):
+        keyword = f"TITULO{i}"
+        rules.append((f"extra_{i}", rf'\b(DA\s+SE[ÇC][ÃA]O\s+{keyword}|{keyword})\b', [keyword]))
+    return rules
+
+
+def make_texts(count, seed=0):
+    """Gera textos curtos de blocos: títulos reais e frases de corpo de texto."""
+    rng = random.Random(seed)
+    texts = []
+    for i in range(count):
+        if i % 3 == 0:
+            texts.append(f"{rng.randint(1, 20)}. {rng.choice(HEADINGS)}")
+        else:
+            texts.append(' '.join(rng.choice(WORDS) for _ in range(rng.randint(4, 12))).capitalize())
+    return texts
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da identificação de títulos de seção.')
+    parser.add_argument('--texts', type=int, default=50000, help='Número de textos classificados.')
+    parser.add_argument('--extra', type=int, nargs='+', default=[0, 25, 50, 100],
+                        help='Números de regras fictícias adicionadas ao registro.')
+    args = parser.parse_args()
+    
+    texts = make_texts(args.texts)
+    
+    print(f"{'regras':>8}{'laço (s)':>10}{'classificador (s)':>19}{'ganho':>8}{'iguais':>16}")
+    for extra in args.extra:
+        rules = SECTION_RULES + extra_rules(extra)
+        patterns = [(section_type, re.compile(pattern, re.IGNORECASE)) for section_type, pattern, _ in rules]
+        classifier = SectionClassifier(rules)
+        
+        start = time.perf_counter()
+        legacy = [legacy_classify(patterns, text) for text in texts]
+        legacy_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        result = [classifier.classify(text) for text in texts]
+        classifier_time = time.perf_counter() - start
+        
+        same = sum(a == b for a, b in zip(legacy, result))
+        print(f"{len(rules):>8}{legacy_time:>10.3f}{classifier_time:>19.3f}"
+              f"{legacy_time / classifier_time:>7.1f}x{f'{same}/{len(texts)}':>16}")
+
+
+if __name__ == '__main__':
+    main()
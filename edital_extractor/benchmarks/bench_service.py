@@ -0,0 +1,107 @@
+"""
+Benchmark do serviço HTTP: latência de cada edital com uma execução da
+linha de comando por requisição contra o serviço local, com os modelos já
+carregados. O serviço roda em 127.0.0.1, sem acesso à rede; os dados
+devolvidos pelo serviço são comparados com os da linha de comando.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_service --docs 10 --pages 10
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from ..service import ExtractionService, make_server
+from .synthetic import generate_edital
+
+
+def request(base_url, path, data=None):
+    """Faz uma requisição ao serviço e devolve a resposta em JSON."""
+    req = urllib.request.Request(base_url + path, data=data,
+                                 headers={'Content-Type': 'application/pdf'} if data else {})
+    with urllib.request.urlopen(req) as response:
+        return json.loads(response.read())
+
+
+def run_service_job(base_url, pdf_path):
+    """Envia o edital, aguarda o fim do trabalho e devolve (latência, dados extraídos)."""
+    start = time.perf_counter()
+    with open(pdf_path, 'rb') as f:
+        job = request(base_url, '/jobs', f.read())
+    while job['status'] in ('na_fila', 'processando'):
+        time.sleep(0.02)
+        job = request(base_url, f"/jobs/{job['id']}")
+    if job['status'] != 'ok':
+        raise RuntimeError(f"Trabalho sem sucesso: {job}")
+    data = request(base_url, job['resultado'])
+    return time.perf_counter() - start, data
+
+
+def run_cli(pdf_path, output_dir):
+    """Executa a linha de comando para um edital e devolve (latência, dados extraídos)."""
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'edital_extractor.cli', pdf_path, '-o', output_dir, '--no-ocr'],
+                   check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    elapsed = time.perf_counter() - start
+    with open(os.path.join(output_dir, 'dados_extraidos.json'), encoding='utf-8') as f:
+        return elapsed, json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark do serviço HTTP de extração.')
+    parser.add_argument('--docs', type=int, default=10, help='Número de editais sintéticos.')
+    parser.add_argument('--pages', type=int, default=10, help='Páginas de cada edital.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        pdfs = []
+        for i in range(args.docs):
+            pdfs.append(generate_edital(os.path.join(tmp, f'edital_{i:04d}.pdf'), args.pages,
+                                        table_every=3, seed=i))
+        
+        service = ExtractionService(work_dir=os.path.join(tmp, 'servico'), use_ocr=False)
+        server = make_server(service, '127.0.0.1', 0)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        
+        start = time.perf_counter()
+        service.start()
+        while request(base_url, '/saude')['processos_prontos'] < 1:
+            time.sleep(0.05)
+        startup = time.perf_counter() - start
+        
+        cli_times, service_times, mismatches = [], [], 0
+        try:
+            for i, pdf_path in enumerate(pdfs):
+                cli_time, cli_data = run_cli(pdf_path, os.path.join(tmp, f'cli_{i}'))
+                service_time, service_data = run_service_job(base_url, pdf_path)
+                cli_times.append(cli_time)
+                service_times.append(service_time)
+                mismatches += cli_data != service_data
+        finally:
+            server.shutdown()
+            server.server_close()
+            service.close()
+        
+        cli_mean = sum(cli_times) / len(cli_times)
+        service_mean = sum(service_times) / len(service_times)
+        print(f"{args.docs} editais de {args.pages} páginas; serviço pronto em {startup:.2f}s")
+        print(f"{'modo':<24}{'média (s)':>11}{'máx. (s)':>10}")
+        print(f"{'linha de comando':<24}{cli_mean:>11.3f}{max(cli_times):>10.3f}")
+        print(f"{'serviço':<24}{service_mean:>11.3f}{max(service_times):>10.3f}")
+        print(f"Ganho: {cli_mean / service_mean:.1f}x; resultados diferentes: {mismatches}")
+    
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
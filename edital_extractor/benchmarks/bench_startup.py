@@ -0,0 +1,93 @@
+"""
+Benchmark da inicialização da linha de comando: tempo de importação
+(python -X importtime) e tempo total de `--help` e de um edital só de texto
+(sem páginas digitalizadas nem tabelas), cada um em um interpretador novo.
+
+No caminho só de texto, as dependências pesadas (pandas, pdfplumber, PIL,
+EasyOCR/torch) não devem ser importadas e o tempo de importação deve ficar
+dentro do orçamento; caso contrário, o script termina com código 1.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_startup --budget-ms 600 --repeat 5
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from .synthetic import generate_edital
+
+# Módulos que o caminho só de texto não deve importar
+HEAVY_MODULES = ('pandas', 'pdfplumber', 'PIL', 'easyocr', 'torch', 'pytesseract')
+
+# Módulos que --help não deve importar (além dos pesados)
+PIPELINE_MODULES = ('fitz', 'pymupdf', 'numpy')
+
+IMPORT_LINE = re.compile(r'^import time:\s+(\d+) \|\s+\d+ \| *(\S+)', re.MULTILINE)
+
+
+def run_cli(cli_args, repeat):
+    """
+    Executa a linha de comando com -X importtime em interpretadores novos.
+    
+    Returns:
+        tuple: (melhor tempo total em s, melhor tempo de importação em s,
+            módulos de primeiro nível importados na última execução)
+    """
+    best_wall = best_imports = float('inf')
+    modules = set()
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-m', 'edital_extractor.cli', *cli_args],
+                                stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+        wall = time.perf_counter() - start
+        if result.returncode != 0:
+            raise RuntimeError(f"A linha de comando terminou com código {result.returncode}:\n"
+                               f"{result.stderr[-2000:]}")
+        
+        entries = IMPORT_LINE.findall(result.stderr)
+        best_wall = min(best_wall, wall)
+        best_imports = min(best_imports, sum(int(self_us) for self_us, _ in entries) / 1e6)
+        modules = {name.split('.')[0] for _, name in entries}
+    return best_wall, best_imports, modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da inicialização da linha de comando.')
+    parser.add_argument('--pages', type=int, default=20, help='Páginas do edital só de texto.')
+    parser.add_argument('--repeat', type=int, default=5, help='Execuções de cada caso (vale a melhor).')
+    parser.add_argument('--budget-ms', type=float, default=600,
+                        help='Orçamento do tempo de importação no caminho só de texto, em ms.')
+    args = parser.parse_args()
+    
+    failures = []
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_path = generate_edital(os.path.join(tmp, 'edital_texto.pdf'), args.pages)
+        cases = [
+            ('--help', ['--help'], HEAVY_MODULES + PIPELINE_MODULES),
+            ('edital só de texto', [pdf_path, '-o', os.path.join(tmp, 'saida')], HEAVY_MODULES),
+        ]
+        
+        print(f"{'caso':<22}{'total (s)':>11}{'importação (s)':>16}  módulos pesados")
+        for name, cli_args, forbidden in cases:
+            wall, imports, modules = run_cli(cli_args, args.repeat)
+            loaded = sorted(set(forbidden) & modules)
+            print(f"{name:<22}{wall:>11.3f}{imports:>16.3f}  {', '.join(loaded) or '-'}")
+            if loaded:
+                failures.append(f"{name}: importou {', '.join(loaded)}")
+        
+        # Orçamento do caminho só de texto (o último caso)
+        if imports * 1000 > args.budget_ms:
+            failures.append(f"importação do caminho só de texto: {imports * 1000:.0f} ms "
+                            f"(orçamento: {args.budget_ms:.0f} ms)")
+    
+    for failure in failures:
+        print(f"FALHA: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
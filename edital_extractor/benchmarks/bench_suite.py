@@ -0,0 +1,186 @@
+"""
+Suíte de micro-benchmarks por etapa: tempo de PDFLoader.analyze_document,
+SectionExtractor.extract_sections_from_blocks, de cada método extract_* do
+DataExtractor e de TableExtractor.extract_all_tables sobre editais
+sintéticos estruturados (ver synthetic.generate_structured_edital) de
+vários tamanhos, com as páginas por segundo de cada etapa e o expoente de
+escala (inclinação de log(tempo) contra log(páginas): 1 indica crescimento
+linear; acima de 1, superlinear).
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_suite --sizes 25 50 100 200 --repeat 3
+    python -m edital_extractor.benchmarks.bench_suite --json resultados.json
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import tempfile
+import time
+from ..utils.pdf_loader import PDFLoader
+from ..utils.document_model import compute_font_statistics
+from ..extractors.section_extractor import SectionExtractor
+from ..extractors.data_extractor import DataExtractor
+from ..extractors.table_extractor import TableExtractor
+from .synthetic import generate_structured_edital
+
+# Método do DataExtractor -> seção cujo texto ele recebe (None: tabelas de cronograma)
+DATA_METHODS = [
+    ('extract_identification', 'header'),
+    ('extract_schedule', 'cronograma'),
+    ('extract_schedule_from_tables', None),
+    ('extract_registration_info', 'inscricao'),
+    ('extract_positions', 'cargos'),
+    ('extract_vacancies', 'vagas'),
+    ('extract_syllabus', 'conteudo_programatico'),
+]
+
+
+def best_of(repeat, setup, run):
+    """
+    Executa run(setup()) `repeat` vezes, medindo apenas run.
+    
+    Returns:
+        tuple: (melhor tempo em segundos, objeto criado por setup e resultado de
+            run na última execução)
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        target = setup()
+        start = time.perf_counter()
+        result = run(target)
+        best = min(best, time.perf_counter() - start)
+    return best, target, result
+
+
+def extract_sections(extractor, records):
+    """Passa os blocos de todas as páginas de texto ao extrator de seções."""
+    for record in records:
+        if record.page is not None and record.page.blocks:
+            extractor.extract_sections_from_blocks(record.page.blocks, record.page_num)
+    return extractor.get_all_sections()
+
+
+def measure(pdf_path, repeat):
+    """
+    Mede cada etapa sobre um edital, na ordem do pipeline.
+    
+    Cada etapa recebe os resultados da anterior (calculados fora da medição) e
+    cada execução usa um objeto novo.
+    
+    Returns:
+        dict: Etapa -> (melhor tempo em segundos, itens produzidos).
+    """
+    results = {}
+    
+    elapsed, loader, info = best_of(repeat, lambda: PDFLoader(pdf_path), lambda loader: loader.analyze_document())
+    results['analyze_document'] = (elapsed, info['total_pages'])
+    records = [loader.get_page_record(page_num) for page_num in range(loader.page_count)]
+    
+    # Estilo do corpo do texto, como em PDFProcessor._extract_sections
+    font_stats = compute_font_statistics(record.page for record in records
+                                         if record.page is not None and not record.is_scanned)
+    elapsed, _, sections = best_of(repeat, lambda: SectionExtractor(font_stats=font_stats),
+                                   lambda extractor: extract_sections(extractor, records))
+    results['extract_sections_from_blocks'] = (elapsed, len(sections))
+    
+    elapsed, table_extractor, tables = best_of(
+        repeat, lambda: TableExtractor(pdf_path, fitz_doc=loader.doc),
+        lambda extractor: extractor.extract_all_tables(skip_pages=loader.scanned_pages))
+    results['extract_all_tables'] = (elapsed, len(tables))
+    
+    # Tabelas de cronograma, como em PDFProcessor._classify_and_save_tables
+    table_dfs = [df_info['dataframe'] for df_info in table_extractor.tables_to_dataframes()]
+    schedule_tables = [df for df, table_type in zip(table_dfs, table_extractor.classify_tables(table_dfs))
+                       if table_type == 'cronograma']
+    table_extractor.close()
+    loader.close()
+    
+    for method, section in DATA_METHODS:
+        argument = schedule_tables if section is None else sections.get(section, '')
+        elapsed, _, result = best_of(repeat, DataExtractor,
+                                     lambda extractor: getattr(extractor, method)(argument))
+        results[method] = (elapsed, len(result))
+    
+    return results
+
+
+def scaling_exponent(sizes, times):
+    """
+    Inclinação da reta de mínimos quadrados de log(tempo) contra log(páginas).
+    
+    Returns:
+        float: Expoente de escala, ou None com menos de dois tamanhos.
+    """
+    if len(sizes) < 2:
+        return None
+    xs = [math.log(size) for size in sizes]
+    ys = [math.log(max(elapsed, 1e-9)) for elapsed in times]
+    mean_x, mean_y = sum(xs) / len(xs), sum(ys) / len(ys)
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / variance
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Suíte de micro-benchmarks por etapa do extrator.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25, 50, 100, 200],
+                        help='Números de páginas dos editais sintéticos.')
+    parser.add_argument('--scanned-every', type=int, default=10,
+                        help='Uma página digitalizada a cada N (0: nenhuma).')
+    parser.add_argument('--repeat', type=int, default=3, help='Execuções de cada etapa (vale a melhor).')
+    parser.add_argument('--json', help='Arquivo para gravar os resultados em JSON.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    sizes = sorted(set(args.sizes))
+    
+    measurements = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in sizes:
+            pdf_path = generate_structured_edital(os.path.join(tmp, f'edital_{pages}.pdf'), pages,
+                                                  scanned_every=args.scanned_every)
+            measurements.append(measure(pdf_path, args.repeat))
+    
+    stages = list(measurements[0])
+    report = {}
+    for stage in stages:
+        times = [measurement[stage][0] for measurement in measurements]
+        report[stage] = {
+            'segundos': times,
+            'paginas_por_segundo': [pages / elapsed for pages, elapsed in zip(sizes, times)],
+            'itens': [measurement[stage][1] for measurement in measurements],
+            'expoente': scaling_exponent(sizes, times),
+        }
+    totals = [sum(measurement[stage][0] for stage in stages) for measurement in measurements]
+    
+    columns = "".join(f"{f'{pages} pág.':>11}" for pages in sizes)
+    print(f"Tempo (ms) por etapa; uma página digitalizada a cada {args.scanned_every or '-'}")
+    print(f"{'etapa':<30}{columns}{'itens':>8}{'expoente':>10}")
+    for stage in stages:
+        entry = report[stage]
+        exponent = entry['expoente']
+        print(f"{stage:<30}" + "".join(f"{elapsed * 1000:>11.2f}" for elapsed in entry['segundos'])
+              + f"{entry['itens'][-1]:>8}" + (f"{exponent:>10.2f}" if exponent is not None else f"{'-':>10}"))
+    total_exponent = scaling_exponent(sizes, totals)
+    print(f"{'total':<30}" + "".join(f"{elapsed * 1000:>11.2f}" for elapsed in totals)
+          + f"{'':>8}" + (f"{total_exponent:>10.2f}" if total_exponent is not None else f"{'-':>10}"))
+    
+    print()
+    print("Páginas por segundo")
+    print(f"{'etapa':<30}{columns}")
+    for stage in stages:
+        print(f"{stage:<30}" + "".join(f"{rate:>11.0f}" for rate in report[stage]['paginas_por_segundo']))
+    print(f"{'total':<30}" + "".join(f"{pages / elapsed:>11.0f}" for pages, elapsed in zip(sizes, totals)))
+    
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({'paginas': sizes, 'repeticoes': args.repeat,
+                       'digitalizada_a_cada': args.scanned_every, 'etapas': report},
+                      f, ensure_ascii=False, indent=2)
+        print(f"\nResultados gravados em {args.json}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,102 @@
+"""
+Benchmark da classificação de tabelas: o classificador antigo, que junta
+todas as células de cada tabela em uma string Python, contra a classificação
+em lote com operações vetorizadas do pandas.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_table_classifier --tables 100 500 2000
+"""
+
+import argparse
+import logging
+import random
+import time
+import pandas as pd
+from ..extractors.table_extractor import TableExtractor
+from .synthetic import CARGOS, EVENTOS
+
+
+def legacy_identify_table_type(dataframe):
+    """Reproduz o classificador antigo, uma tabela por vez."""
+    df_str = dataframe.astype(str)
+    
+    if any('cargo' in col.lower() for col in df_str.columns):
+        if any('vaga' in col.lower() for col in df_str.columns):
+            return "cargos_vagas"
+        return "cargos"
+    
+    if any('data' in col.lower() for col in df_str.columns) and any('atividade' in col.lower() or 'evento' in col.lower() for col in df_str.columns):
+        return "cronograma"
+    
+    if any('remuneração' in col.lower() or 'salário' in col.lower() or 'vencimento' in col.lower() for col in df_str.columns):
+        return "remuneracao"
+    
+    all_text = ' '.join([' '.join(df_str[col].tolist()) for col in df_str.columns])
+    
+    if 'vaga' in all_text.lower() and ('ampla' in all_text.lower() or 'concorrência' in all_text.lower()):
+        return "vagas"
+    
+    if any(date_term in all_text.lower() for date_term in ['data', 'período', 'prazo']):
+        if any(event_term in all_text.lower() for event_term in ['atividade', 'evento', 'etapa']):
+            return "cronograma"
+    
+    return "desconhecido"
+
+
+def make_tables(count, seed=0):
+    """Gera DataFrames variados, como os de um edital com muitas tabelas de vagas."""
+    rng = random.Random(seed)
+    tables = []
+    for i in range(count):
+        kind = i % 6
+        cargos = rng.sample(CARGOS, rng.randint(4, 8))
+        if kind == 0:
+            rows = [[c, str(rng.randint(1, 30)), str(rng.randint(0, 3))] for c in cargos]
+            df = pd.DataFrame(rows, columns=['Cargo', 'Vagas AC', 'PcD'])
+        elif kind == 1:
+            rows = [[f"{d:02d}/05/2025", e] for d, e in zip(range(1, 29), EVENTOS)]
+            df = pd.DataFrame(rows, columns=['Data', 'Evento'])
+        elif kind == 2:
+            rows = [[c, f"R$ {rng.randint(2, 15)}.000,00"] for c in cargos]
+            df = pd.DataFrame(rows, columns=['Função', 'Remuneração'])
+        elif kind == 3:
+            rows = [[c, 'Ampla concorrência', f"{rng.randint(1, 9)} vagas"] for c in cargos]
+            df = pd.DataFrame(rows, columns=['Col0', 'Col1', 'Col2'])
+        elif kind == 4:
+            rows = [['Período de inscrição', 'Etapa 1'], ['Prazo de recurso', '']]
+            df = pd.DataFrame(rows, columns=['Item', 'Descrição'])
+        else:
+            rows = [[c, str(rng.randint(1, 100))] for c in cargos]
+            df = pd.DataFrame(rows, columns=['Nome', 'Código'])
+        tables.append(df)
+    return tables
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da classificação de tabelas.')
+    parser.add_argument('--tables', type=int, nargs='+', default=[100, 500, 2000],
+                        help='Números de tabelas classificadas.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    extractor = TableExtractor('')
+    
+    print(f"{'tabelas':>8}{'antigo (s)':>12}{'lote (s)':>10}{'ganho':>8}{'iguais':>12}")
+    for count in args.tables:
+        tables = make_tables(count)
+        
+        start = time.perf_counter()
+        legacy = [legacy_identify_table_type(df) for df in tables]
+        legacy_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        batch = extractor.classify_tables(tables)
+        batch_time = time.perf_counter() - start
+        
+        same = sum(a == b for a, b in zip(legacy, batch))
+        print(f"{count:>8}{legacy_time:>12.3f}{batch_time:>10.3f}{legacy_time / batch_time:>7.1f}x"
+              f"{f'{same}/{count}':>12}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark dos motores de extração de tabelas: pdfplumber contra o
+page.find_tables() do PyMuPDF, medindo o tempo (incluindo a abertura do
+documento) e a concordância entre as tabelas e células extraídas.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_table_engines --sizes 50 200 500
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from ..extractors.table_extractor import TableExtractor
+from .synthetic import generate_edital
+
+
+def run_engine(pdf_path, engine, prefilter=True):
+    """Extrai todas as tabelas com o motor indicado."""
+    extractor = TableExtractor(pdf_path, prefilter=prefilter, engine=engine)
+    tables = extractor.extract_all_tables()
+    extractor.close()
+    return tables
+
+
+def normalize_cell(cell):
+    """Normaliza uma célula para comparação (None e espaços extras)."""
+    return ' '.join((cell or '').split())
+
+
+def agreement(reference, candidate):
+    """
+    Compara as tabelas de dois motores.
+    
+    Returns:
+        tuple: (tabelas idênticas, total de tabelas, células idênticas, total de células)
+    """
+    by_page = {}
+    for table in candidate:
+        by_page.setdefault(table['page'], []).append(table['data'])
+    
+    same_tables = same_cells = total_cells = 0
+    for table in reference:
+        others = by_page.get(table['page'], [])
+        other = others.pop(0) if others else []
+        
+        table_equal = True
+        for row_idx, row in enumerate(table['data']):
+            other_row = other[row_idx] if row_idx < len(other) else []
+            for col_idx, cell in enumerate(row):
+                total_cells += 1
+                other_cell = other_row[col_idx] if col_idx < len(other_row) else None
+                if normalize_cell(cell) == normalize_cell(other_cell):
+                    same_cells += 1
+                else:
+                    table_equal = False
+        if table_equal and len(other) == len(table['data']):
+            same_tables += 1
+    
+    return same_tables, len(reference), same_cells, total_cells
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark dos motores de extração de tabelas.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 200, 500],
+                        help='Números de páginas dos editais sintéticos.')
+    parser.add_argument('--no-prefilter', action='store_true',
+                        help='Processa todas as páginas, sem o pré-filtro de linhas de grade.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    prefilter = not args.no_prefilter
+    
+    print(f"{'páginas':>8}{'pdfplumber (s)':>16}{'fitz (s)':>11}{'ganho':>8}"
+          f"{'tabelas iguais':>16}{'células iguais':>16}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.sizes:
+            pdf_path = generate_edital(os.path.join(tmp, f'edital_{pages}.pdf'), pages, table_every=4)
+            
+            start = time.perf_counter()
+            reference = run_engine(pdf_path, 'pdfplumber', prefilter)
+            plumber_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            candidate = run_engine(pdf_path, 'fitz', prefilter)
+            fitz_time = time.perf_counter() - start
+            
+            same_tables, total_tables, same_cells, total_cells = agreement(reference, candidate)
+            print(f"{pages:>8}{plumber_time:>16.2f}{fitz_time:>11.2f}{plumber_time / fitz_time:>7.1f}x"
+                  f"{f'{same_tables}/{total_tables}':>16}{f'{same_cells}/{total_cells}':>16}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark da extração de tabelas: reabertura do PDF a cada página (caminho
+antigo, quadrático no tamanho do arquivo) contra o documento compartilhado,
+com e sem o pré-filtro de páginas.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_table_extraction --sizes 50 100 200 500
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+import pdfplumber
+from ..extractors.table_extractor import TableExtractor
+from .synthetic import generate_edital
+
+
+def legacy_reopen_per_page(pdf_path, settings):
+    """Reproduz o caminho antigo: pdfplumber.open() para cada página."""
+    with pdfplumber.open(pdf_path) as pdf:
+        total_pages = len(pdf.pages)
+    
+    count = 0
+    for page_num in range(total_pages):
+        with pdfplumber.open(pdf_path) as pdf:
+            count += len(pdf.pages[page_num].extract_tables(table_settings=settings))
+    return count
+
+
+def shared_document(pdf_path, settings, prefilter=False):
+    """Caminho atual: TableExtractor com um único documento aberto."""
+    extractor = TableExtractor(pdf_path, prefilter=prefilter)
+    count = len(extractor.extract_all_tables(settings=settings))
+    report = extractor.prefilter_report
+    extractor.close()
+    return count, report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da extração de tabelas.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[50, 100, 200, 500],
+                        help='Números de páginas dos editais sintéticos.')
+    parser.add_argument('--legacy-max', type=int, default=200,
+                        help='Maior documento medido no caminho antigo (que é quadrático).')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    settings = TableExtractor('').table_settings
+    
+    print(f"{'páginas':>8}{'antigo (s)':>12}{'ms/pág':>9}{'atual (s)':>12}{'ms/pág':>9}"
+          f"{'filtro (s)':>12}{'ms/pág':>9}{'ignoradas':>11}{'tabelas':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for pages in args.sizes:
+            pdf_path = generate_edital(os.path.join(tmp, f'edital_{pages}.pdf'), pages, table_every=5)
+            
+            legacy = None
+            if pages <= args.legacy_max:
+                start = time.perf_counter()
+                legacy_reopen_per_page(pdf_path, settings)
+                legacy = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            count, _ = shared_document(pdf_path, settings)
+            shared = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            filtered_count, report = shared_document(pdf_path, settings, prefilter=True)
+            filtered = time.perf_counter() - start
+            
+            legacy_cols = (f"{legacy:>12.2f}{legacy / pages * 1000:>9.1f}" if legacy is not None
+                           else f"{'-':>12}{'-':>9}")
+            tables = f"{filtered_count}/{count}"
+            print(f"{pages:>8}{legacy_cols}{shared:>12.2f}{shared / pages * 1000:>9.1f}"
+                  f"{filtered:>12.2f}{filtered / pages * 1000:>9.1f}{report['skipped']:>11}{tables:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+Benchmark da detecção de títulos: regra fixa (fonte maior que 12pt ou em
+negrito) contra a comparação com o estilo do corpo do texto do documento,
+em editais com corpo de 10pt e de 13pt.
+
+Uso:
+    python -m edital_extractor.benchmarks.bench_title_detection --pages 100 --body-sizes 10 13
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+from ..extractors.section_extractor import SectionExtractor
+from ..utils.document_model import Document, compute_font_statistics
+from ..utils.pdf_loader import PDFLoader
+from .synthetic import generate_edital
+
+
+def load_document(pdf_path):
+    """Lê o PDF e monta o documento compacto."""
+    loader = PDFLoader(pdf_path)
+    loader.analyze_document()
+    document = Document([record.page for record in loader.page_records.values()
+                         if record.page is not None and not record.is_scanned])
+    loader.close()
+    return document
+
+
+def count_candidates(extractor, document):
+    """Conta os blocos curtos que passam pelo teste de formato e chegam às regex."""
+    candidates = 0
+    for page in document:
+        for block in page.blocks:
+            text = block.text
+            if len(text) < 100 and (text.upper() == text or extractor._check_title_format(block)):
+                candidates += 1
+    return candidates
+
+
+def run_sections(document, use_stats):
+    """Executa a extração de seções e mede o tempo (incluindo o cálculo das estatísticas)."""
+    start = time.perf_counter()
+    font_stats = compute_font_statistics(document) if use_stats else None
+    extractor = SectionExtractor(font_stats=font_stats)
+    for page in document:
+        extractor.extract_sections_from_blocks(page.blocks, page.number)
+    sections = extractor.get_all_sections()
+    return time.perf_counter() - start, extractor, sections
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark da detecção de títulos.')
+    parser.add_argument('--pages', type=int, default=100, help='Número de páginas dos editais sintéticos.')
+    parser.add_argument('--body-sizes', type=float, nargs='+', default=[10, 13],
+                        help='Tamanhos da fonte do corpo do texto.')
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)
+    
+    print(f"{'corpo':>6}{'modo':>14}{'candidatos':>12}{'tempo (s)':>11}{'seções':>8}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for body_size in args.body_sizes:
+            pdf_path = generate_edital(os.path.join(tmp, f'edital_{body_size}.pdf'), args.pages,
+                                       table_every=5, body_size=body_size)
+            document = load_document(pdf_path)
+            
+            for mode, use_stats in (('regra fixa', False), ('estatísticas', True)):
+                elapsed, extractor, sections = run_sections(document, use_stats)
+                candidates = count_candidates(extractor, document)
+                print(f"{body_size:>6.1f}{mode:>14}{candidates:>12}{elapsed:>11.3f}{len(sections):>8}")
+
+
+if __name__ == '__main__':
+    main()
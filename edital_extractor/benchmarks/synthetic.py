@@ -0,0 +1,505 @@
+"""
+Gerador determinístico de editais sintéticos em PDF.
+"""
+
+import itertools
+import random
+import fitz  # PyMuPDF
+
+PAGE_WIDTH = 595
+PAGE_HEIGHT = 842
+MARGIN_X = 60
+TOP_Y = 90
+BOTTOM_Y = 770
+
+HEADINGS = [
+    "DAS DISPOSIÇÕES PRELIMINARES",
+    "DOS CARGOS",
+    "DAS VAGAS",
+    "DOS REQUISITOS",
+    "DA REMUNERAÇÃO",
+    "DAS INSCRIÇÕES",
+    "CRONOGRAMA",
+    "CONTEÚDO PROGRAMÁTICO",
+]
+
+WORDS = (
+    "candidato inscrição concurso público edital cargo vaga prova objetiva "
+    "discursiva títulos classificação homologação recurso banca organizadora "
+    "prefeitura municipal secretaria nível superior médio fundamental "
+    "remuneração vencimento carga horária semanal atribuições requisitos "
+    "documentação posse nomeação convocação período prazo publicação"
+).split()
+
+
+CARGOS = [
+    "AGENTE ADMINISTRATIVO", "ANALISTA DE SISTEMAS", "ASSISTENTE SOCIAL",
+    "AUXILIAR DE SERVIÇOS GERAIS", "CONTADOR", "ENFERMEIRO", "ENGENHEIRO CIVIL",
+    "FISCAL DE TRIBUTOS", "MÉDICO CLÍNICO GERAL", "MOTORISTA", "PROCURADOR MUNICIPAL",
+    "PROFESSOR DE EDUCAÇÃO BÁSICA", "PSICÓLOGO", "TÉCNICO EM ENFERMAGEM",
+]
+
+EVENTOS = [
+    "Publicação do edital", "Período de inscrições", "Pedido de isenção da taxa",
+    "Resultado dos pedidos de isenção", "Homologação das inscrições",
+    "Aplicação da prova objetiva", "Divulgação do gabarito preliminar",
+    "Prazo para recursos", "Resultado final",
+]
+
+
+def _paragraph(rng, words=40):
+    """Gera um parágrafo pseudoaleatório com palavras típicas de editais."""
+    text = " ".join(rng.choice(WORDS) for _ in range(words))
+    return text[0].upper() + text[1:] + "."
+
+
+def _wrap(text, width=95):
+    """Quebra o texto em linhas de até `width` caracteres."""
+    lines = []
+    current = ""
+    for word in text.split():
+        if current and len(current) + len(word) + 1 > width:
+            lines.append(current)
+            current = word
+        else:
+            current = f"{current} {word}" if current else word
+    if current:
+        lines.append(current)
+    return lines
+
+
+def _table_rows(rng, kind):
+    """Gera as linhas de uma tabela de vagas ou de cronograma."""
+    if kind == 'vagas':
+        rows = [["Cargo", "Vagas AC", "PcD", "Negros", "Total"]]
+        for cargo in rng.sample(CARGOS, rng.randint(4, 8)):
+            ac, pcd, negros = rng.randint(1, 30), rng.randint(0, 3), rng.randint(0, 6)
+            rows.append([cargo, str(ac), str(pcd), str(negros), str(ac + pcd + negros)])
+        return rows
+    
+    rows = [["Data", "Evento"]]
+    for i, evento in enumerate(EVENTOS):
+        rows.append([f"{(i * 3) % 28 + 1:02d}/{i % 12 + 1:02d}/2025", evento])
+    return rows
+
+
+def _write_table(page, y, rows):
+    """
+    Desenha uma tabela com linhas de grade (detectável pela estratégia "lines").
+    
+    Returns:
+        float: Posição vertical logo abaixo da tabela.
+    """
+    row_height = 16
+    width = PAGE_WIDTH - 2 * MARGIN_X
+    columns = len(rows[0])
+    first_width = width * (0.45 if columns > 2 else 0.25)
+    other_width = (width - first_width) / (columns - 1)
+    xs = [MARGIN_X, MARGIN_X + first_width]
+    for _ in range(columns - 1):
+        xs.append(xs[-1] + other_width)
+    
+    bottom = y + row_height * len(rows)
+    for i in range(len(rows) + 1):
+        page.draw_line((MARGIN_X, y + i * row_height), (xs[-1], y + i * row_height), width=0.8)
+    for x in xs:
+        page.draw_line((x, y), (x, bottom), width=0.8)
+    
+    for i, row in enumerate(rows):
+        fontname = "hebo" if i == 0 else "helv"
+        for j, cell in enumerate(row):
+            page.insert_text((xs[j] + 3, y + i * row_height + 11.5), cell, fontsize=8, fontname=fontname)
+    
+    return bottom + 12
+
+
+def _write_page_furniture(page, page_num):
+    """Escreve o cabeçalho e o rodapé da página."""
+    page.insert_text((MARGIN_X, 40), "DIÁRIO OFICIAL - EDIÇÃO EXTRAORDINÁRIA", fontsize=8)
+    page.insert_text((MARGIN_X, PAGE_HEIGHT - 30), f"Página {page_num + 1}", fontsize=8)
+
+
+def _write_text_page(page, page_num, rng, table=None, body_size=10):
+    """Escreve o conteúdo de uma página de texto, opcionalmente com uma tabela."""
+    _write_page_furniture(page, page_num)
+    
+    y = TOP_Y
+    if page_num == 0:
+        page.insert_text((MARGIN_X, y), "PREFEITURA MUNICIPAL DE SÃO JOSÉ DO NORTE", fontsize=14, fontname="hebo")
+        y += 24
+        page.insert_text((MARGIN_X, y), "EDITAL Nº 01/2025 - CONCURSO PÚBLICO 2025", fontsize=14, fontname="hebo")
+        y += 30
+    
+    if table:
+        page.insert_text((MARGIN_X, y), "QUADRO DE VAGAS" if table == 'vagas' else "CRONOGRAMA",
+                         fontsize=13, fontname="hebo")
+        y = _write_table(page, y + 10, _table_rows(rng, table))
+    
+    while y < BOTTOM_Y - 40:
+        if rng.random() < 0.2:
+            heading = f"{rng.randint(1, 20)}. {rng.choice(HEADINGS)}"
+            page.insert_text((MARGIN_X, y), heading, fontsize=13, fontname="hebo")
+            y += 22
+        for line in _wrap(_paragraph(rng, rng.randint(25, 70))):
+            if y >= BOTTOM_Y:
+                break
+            page.insert_text((MARGIN_X, y), line, fontsize=body_size)
+            y += body_size * 1.3
+        y += 8
+        
+        # Alíneas curtas, cada uma em seu próprio bloco
+        if rng.random() < 0.3:
+            for letter in "abcd"[:rng.randint(2, 4)]:
+                if y >= BOTTOM_Y:
+                    break
+                item = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8)))
+                page.insert_text((MARGIN_X + 15, y), f"{letter}) {item};", fontsize=body_size)
+                y += body_size * 1.3 + 8
+
+
+def _write_scanned_page(doc, page, page_num, rng, body_size=10):
+    """Escreve uma página "digitalizada": o texto é rasterizado e inserido como imagem."""
+    scratch = fitz.open()
+    source = scratch.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    _write_text_page(source, page_num, rng, body_size=body_size)
+    pix = source.get_pixmap(dpi=100, colorspace=fitz.csGRAY)
+    page.insert_image(page.rect, pixmap=pix)
+    scratch.close()
+
+
+def generate_edital(path, pages=100, scanned_every=0, table_every=0, seed=0, body_size=10):
+    """
+    Gera um edital sintético em PDF.
+    
+    Args:
+        path (str): Caminho do PDF a ser gerado.
+        pages (int): Número de páginas.
+        scanned_every (int): Se maior que zero, uma a cada N páginas é digitalizada.
+        table_every (int): Se maior que zero, uma a cada N páginas traz uma tabela
+            (alternando quadro de vagas e cronograma).
+        seed (int): Semente do gerador pseudoaleatório (a saída é determinística).
+        body_size (float): Tamanho da fonte do corpo do texto (os títulos usam 13pt).
+    
+    Returns:
+        str: Caminho do PDF gerado.
+    """
+    rng = random.Random(seed)
+    doc = fitz.open()
+    
+    for page_num in range(pages):
+        page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+        if scanned_every and page_num % scanned_every == scanned_every - 1:
+            _write_scanned_page(doc, page, page_num, rng, body_size)
+        elif table_every and page_num % table_every == 0:
+            kind = 'vagas' if (page_num // table_every) % 2 == 0 else 'cronograma'
+            _write_text_page(page, page_num, rng, table=kind, body_size=body_size)
+        else:
+            _write_text_page(page, page_num, rng, body_size=body_size)
+    
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return path
+
+
+DISCIPLINAS = [
+    "LÍNGUA PORTUGUESA", "MATEMÁTICA", "NOÇÕES DE INFORMÁTICA",
+    "LEGISLAÇÃO MUNICIPAL", "CONHECIMENTOS GERAIS", "ÉTICA NO SERVIÇO PÚBLICO",
+]
+
+
+def cargo_name(index):
+    """Gera o nome do cargo de número `index` (nomes distintos, apenas letras)."""
+    label = ""
+    number = index + 1
+    while number:
+        number, rest = divmod(number - 1, 26)
+        label = chr(ord('A') + rest) + label
+    return f"{CARGOS[index % len(CARGOS)]} CLASSE {label}"
+
+
+def generate_section_texts(cargos=300, events=200, paragraphs=200, seed=0, heading="CARGO"):
+    """
+    Gera textos sintéticos das seções usadas pela extração de dados estruturados.
+    
+    Args:
+        cargos (int): Número de cargos (seções de cargos, vagas e conhecimentos específicos).
+        events (int): Número de eventos do cronograma.
+        paragraphs (int): Parágrafos de corpo de texto no cabeçalho e na seção de inscrição.
+        seed (int): Semente do gerador pseudoaleatório (a saída é determinística).
+        heading (str): Palavra que abre o título de cada cargo ("CARGO" ou "FUNÇÃO").
+        
+    Returns:
+        dict: Seção -> texto ('header', 'cronograma', 'inscricao', 'cargos', 'vagas',
+            'conteudo_programatico').
+    """
+    rng = random.Random(seed)
+    names = [cargo_name(i) for i in range(cargos)]
+    
+    header = ["PREFEITURA MUNICIPAL DE SÃO JOSÉ DO NORTE", "EDITAL Nº 01/2025",
+              "CONCURSO PÚBLICO 2025"]
+    header += [_paragraph(rng) for _ in range(paragraphs)]
+    header.append("A organização do concurso está a cargo da banca FGV.")
+    
+    schedule = []
+    for i in range(events):
+        day, month = i % 28 + 1, i % 12 + 1
+        if i % 5 == 0:
+            schedule.append(f"{day:02d}/{month:02d}/2025 a {day:02d}/{month % 12 + 1:02d}/2025 "
+                            f"{rng.choice(EVENTOS)}")
+        else:
+            schedule.append(f"{day:02d}/{month:02d}/2025 - {rng.choice(EVENTOS)}")
+        if i % 4 == 0:
+            schedule.append(_paragraph(rng, 20))
+    
+    registration = [_paragraph(rng) for _ in range(paragraphs)]
+    registration.append("O período de inscrição será de 01/03/2025 a 31/03/2025, pela internet.")
+    registration += [_paragraph(rng) for _ in range(paragraphs // 4)]
+    registration.append("O valor da taxa de inscrição será de R$ 120,00 para todos os cargos.")
+    
+    positions = []
+    vacancies = []
+    for name in names:
+        salary = f"{rng.randint(1, 15)}.{rng.randint(0, 999):03d},{rng.randint(0, 99):02d}"
+        positions += [
+            f"{heading}: {name}",
+            f"Requisitos: {_paragraph(rng, 15)}",
+            "",
+            f"Remuneração: R$ {salary}",
+            f"Carga horária: {rng.choice([20, 30, 40])} horas semanais.",
+            f"Atribuições: {_paragraph(rng, 30)}",
+            "",
+        ]
+        
+        ac, pcd, negros = rng.randint(1, 30), rng.randint(0, 3), rng.randint(0, 6)
+        vacancies += [
+            f"{heading}: {name} - {ac + pcd + negros} vagas, sendo {ac} para ampla concorrência, "
+            f"{pcd} para pessoa com deficiência e {negros} vagas para negros.",
+            _paragraph(rng, 20),
+        ]
+    
+    syllabus = ["CONHECIMENTOS BÁSICOS"]
+    for disciplina in DISCIPLINAS:
+        syllabus.append(disciplina)
+        syllabus += [f"{i}. {_paragraph(rng, 10)}" for i in range(1, 6)]
+    for name in names:
+        syllabus.append(f"CONHECIMENTOS ESPECÍFICOS PARA {name}")
+        for disciplina in rng.sample(DISCIPLINAS, 2):
+            syllabus.append(disciplina)
+            syllabus += [f"{i}. {_paragraph(rng, 10)}" for i in range(1, 4)]
+    
+    return {
+        'header': "\n".join(header),
+        'cronograma': "\n".join(schedule),
+        'inscricao': "\n".join(registration),
+        'cargos': "\n".join(positions),
+        'vagas': "\n".join(vacancies),
+        'conteudo_programatico': "\n".join(syllabus),
+    }
+
+
+# Partes do edital estruturado, na ordem do documento: (parte, título, fração das páginas)
+STRUCTURED_PARTS = [
+    ('preambulo', None, 0.1),
+    ('inscricao', "2. DAS INSCRIÇÕES", 0.1),
+    ('cronograma', "3. CRONOGRAMA", 0.1),
+    ('cargos', "4. DOS CARGOS", 0.3),
+    ('vagas', "5. DAS VAGAS", 0.1),
+    ('conteudo_programatico', "ANEXO I - CONTEÚDO PROGRAMÁTICO", 0.3),
+]
+
+# "CONHECIMENTOS GERAIS" abriria uma seção de conhecimentos básicos no meio do anexo
+ANNEX_DISCIPLINAS = [disciplina for disciplina in DISCIPLINAS if disciplina != "CONHECIMENTOS GERAIS"]
+
+
+def _filler_blocks(rng):
+    """Gera indefinidamente blocos de corpo de texto (parágrafos e alíneas), sem títulos."""
+    while True:
+        yield 'text', _wrap(_paragraph(rng, rng.randint(25, 70)))
+        if rng.random() < 0.3:
+            for letter in "abcd"[:rng.randint(2, 4)]:
+                item = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8)))
+                yield 'text', [f"{letter}) {item};"]
+
+
+def _preamble_blocks(rng):
+    """Blocos do preâmbulo: órgão, número do edital, banca e disposições preliminares."""
+    yield 'heading', "PREFEITURA MUNICIPAL DE SÃO JOSÉ DO NORTE"
+    # O número do edital fica no parágrafo de abertura, para não abrir uma seção própria
+    yield 'text', _wrap(
+        "EDITAL Nº 01/2025 - CONCURSO PÚBLICO 2025. O Prefeito Municipal de São José do Norte "
+        "torna pública a abertura das inscrições do concurso público para provimento de cargos "
+        "efetivos. A organização do concurso está a cargo da banca FGV.")
+    yield 'heading', "1. DAS DISPOSIÇÕES PRELIMINARES"
+    yield from _filler_blocks(rng)
+
+
+def _registration_blocks(rng):
+    """Blocos da seção de inscrições: período, taxa e instruções."""
+    yield 'text', _wrap("2.1. O período de inscrição será de 01/03/2025 a 31/03/2025, pela internet.")
+    yield 'text', _wrap(_paragraph(rng))
+    yield 'text', _wrap("2.2. O valor da taxa de inscrição será de R$ 120,00 para todos os cargos.")
+    yield from _filler_blocks(rng)
+
+
+def _schedule_blocks(rng):
+    """Blocos do cronograma: a tabela de eventos seguida de um evento por linha."""
+    yield 'table', _table_rows(rng, 'cronograma')
+    for i in itertools.count():
+        day, month = i % 28 + 1, i % 12 + 1
+        yield 'text', [f"{day:02d}/{month:02d}/2025 - {rng.choice(EVENTOS)}"]
+        if i % 4 == 3:
+            yield 'text', _wrap(_paragraph(rng, 20))
+
+
+def _position_blocks(rng):
+    """Blocos da seção de cargos: título, requisitos, jornada, remuneração e atribuições de cada cargo."""
+    for index in itertools.count():
+        salary = f"{rng.randint(1, 15)}.{rng.randint(0, 999):03d},{rng.randint(0, 99):02d}"
+        yield 'text', [f"CARGO: {cargo_name(index)}"]
+        yield 'text', _wrap(f"Requisitos: {_paragraph(rng, 15)}")
+        yield 'text', [f"Jornada: {rng.choice([20, 30, 40])} horas semanais."]
+        yield 'text', [f"Remuneração: R$ {salary}"]
+        yield 'text', _wrap(f"Atribuições: {_paragraph(rng, 30)}")
+
+
+def _vacancy_blocks(rng):
+    """Blocos da seção de vagas: o quadro de vagas seguido da distribuição por cargo."""
+    yield 'table', _table_rows(rng, 'vagas')
+    for index in itertools.count():
+        ac, pcd, negros = rng.randint(1, 30), rng.randint(0, 3), rng.randint(0, 6)
+        yield 'text', [f"CARGO: {cargo_name(index)} - {ac + pcd + negros} vagas"]
+        yield 'text', [f"Distribuição: {ac} para ampla concorrência, {pcd} para pessoa com "
+                       f"deficiência e {negros} para negros."]
+
+
+def _syllabus_blocks(rng):
+    """Blocos do anexo de conteúdo programático: conhecimentos básicos e específicos de cada cargo."""
+    # Os títulos de conhecimentos em caixa mista e na fonte do corpo não abrem seções próprias
+    yield 'text', ["Conhecimentos Básicos"]
+    for index in itertools.count(-1):
+        if index >= 0:
+            yield 'text', [f"Conhecimentos Específicos - {cargo_name(index).title()}"]
+        for disciplina in (ANNEX_DISCIPLINAS if index < 0 else rng.sample(ANNEX_DISCIPLINAS, 2)):
+            yield 'text', [disciplina]
+            for i in range(1, 4):
+                yield 'text', _wrap(f"{i}. {_paragraph(rng, 10)}")
+
+
+PART_BLOCKS = {
+    'preambulo': _preamble_blocks,
+    'inscricao': _registration_blocks,
+    'cronograma': _schedule_blocks,
+    'cargos': _position_blocks,
+    'vagas': _vacancy_blocks,
+    'conteudo_programatico': _syllabus_blocks,
+}
+
+
+def _fill_page(page, blocks, pending, body_size, y=TOP_Y):
+    """
+    Escreve blocos na página até preenchê-la.
+    
+    Blocos de texto que não cabem no fim da página continuam na página seguinte,
+    desde que pelo menos três linhas fiquem na página atual; títulos e tabelas
+    nunca são divididos.
+    
+    Args:
+        page (fitz.Page): Página a preencher.
+        blocks (iterator): Blocos da parte atual: ('heading', texto), ('text', linhas)
+            ou ('table', linhas da tabela).
+        pending (tuple): Bloco (ou restante de bloco) que não coube na página anterior.
+        body_size (float): Tamanho da fonte do corpo do texto.
+        y (float): Posição vertical do primeiro bloco.
+        
+    Returns:
+        tuple: Bloco (ou restante de bloco) que não coube na página.
+    """
+    line_height = body_size * 1.3
+    while True:
+        kind, content = pending or next(blocks)
+        pending = None
+        
+        if kind == 'heading':
+            # O título fica na mesma página que o início do texto que o segue
+            if y + 22 + 3 * line_height > BOTTOM_Y:
+                return kind, content
+            page.insert_text((MARGIN_X, y), content, fontsize=13, fontname="hebo")
+            y += 22
+        elif kind == 'table':
+            if y + 16 * len(content) > BOTTOM_Y:
+                return kind, content
+            y = _write_table(page, y, content)
+        else:
+            fits = max(0, int((BOTTOM_Y - y) // line_height))
+            if fits < min(3, len(content)):
+                return kind, content
+            for line in content[:fits]:
+                page.insert_text((MARGIN_X, y), line, fontsize=body_size)
+                y += line_height
+            if fits < len(content):
+                return kind, content[fits:]
+            y += 8
+
+
+def _rasterize_last_page(doc):
+    """Substitui a última página do documento por uma imagem dela ("digitalizada")."""
+    pix = doc[-1].get_pixmap(dpi=100, colorspace=fitz.csGRAY)
+    doc.delete_page(-1)
+    page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+    page.insert_image(page.rect, pixmap=pix)
+
+
+def generate_structured_edital(path, pages=50, scanned_every=0, seed=0, body_size=10):
+    """
+    Gera um edital sintético com a estrutura de um edital real.
+    
+    O documento traz, nessa ordem, o preâmbulo, as inscrições, o cronograma (com
+    uma tabela de eventos), os cargos, as vagas (com o quadro de vagas) e o anexo
+    de conteúdo programático, cada parte com uma fração fixa das páginas (ver
+    STRUCTURED_PARTS). Cada página de uma parte começa pelo título da parte (o
+    extrator de seções recomeça cada página no cabeçalho) e cada registro (evento,
+    cargo, vaga, disciplina ou tópico) ocupa um bloco próprio. Assim, o texto de
+    cada seção, e o trabalho de cada método extract_* do DataExtractor, cresce com
+    o número de páginas.
+    
+    Args:
+        path (str): Caminho do PDF a ser gerado.
+        pages (int): Número de páginas (pelo menos uma por parte).
+        scanned_every (int): Se maior que zero, uma a cada N páginas é digitalizada.
+        seed (int): Semente do gerador pseudoaleatório (a saída é determinística).
+        body_size (float): Tamanho da fonte do corpo do texto (os títulos usam 13pt).
+        
+    Returns:
+        str: Caminho do PDF gerado.
+    """
+    if pages < len(STRUCTURED_PARTS):
+        raise ValueError(f"O edital estruturado precisa de pelo menos {len(STRUCTURED_PARTS)} páginas.")
+    
+    # Uma página por parte e as demais divididas pelas frações; as que sobram do
+    # arredondamento ficam com os cargos
+    extra = pages - len(STRUCTURED_PARTS)
+    budgets = {part: 1 + int(extra * share) for part, _, share in STRUCTURED_PARTS}
+    budgets['cargos'] += pages - sum(budgets.values())
+    
+    rng = random.Random(seed)
+    doc = fitz.open()
+    page_num = 0
+    for part, title, _ in STRUCTURED_PARTS:
+        blocks = PART_BLOCKS[part](rng)
+        pending = None
+        for part_page in range(budgets[part]):
+            page = doc.new_page(width=PAGE_WIDTH, height=PAGE_HEIGHT)
+            _write_page_furniture(page, page_num)
+            y = TOP_Y
+            if title:
+                page.insert_text((MARGIN_X, y), f"{title} (CONTINUAÇÃO)" if part_page else title,
+                                 fontsize=13, fontname="hebo")
+                y += 22
+            pending = _fill_page(page, blocks, pending, body_size, y)
+            if scanned_every and page_num % scanned_every == scanned_every - 1:
+                _rasterize_last_page(doc)
+            page_num += 1
+    
+    doc.save(path, garbage=3, deflate=True)
+    doc.close()
+    return path
@@ -7,7 +7,9 @@ import logging
 import os
 import sys
 import json
-from .processors.pdf_processor import PDFProcessor
+
+# O pipeline (PyMuPDF, NumPy etc.) é importado apenas pelo subcomando que o
+# usa, de modo que --help e erros de argumentos respondem de imediato
 
 # Configuração de logging
 logging.basicConfig(
@@ -16,15 +18,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def parse_args():
+def parse_args(argv=None):
     """
     Analisa os argumentos da linha de comando.
     
+    Args:
+        argv (list): Argumentos (padrão: sys.argv[1:]).
+    
     Returns:
         argparse.Namespace: Argumentos analisados.
     """
     parser = argparse.ArgumentParser(
-        description='Extrator de dados de editais de concursos públicos em PDF.'
+        description='Extrator de dados de editais de concursos públicos em PDF. '
+                    'Para processar vários editais, use o subcomando "batch"; para o serviço HTTP, "serve".'
     )
     
     parser.add_argument(
@@ -37,23 +43,351 @@ def parse_args():
         help='Diretório de saída para os arquivos gerados. Padrão: mesmo diretório do PDF.'
     )
     
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=1,
+        help='Número de processos para extrair texto e tabelas das páginas em paralelo. Padrão: 1.'
+    )
+    
+    parser.add_argument(
+        '--ocr-workers',
+        type=int,
+        default=1,
+        help='Número de processos OCR; cada processo carrega o modelo uma única vez. Padrão: 1.'
+    )
+    
+    _add_processing_arguments(parser)
+    
+    return parser.parse_args(argv)
+
+def parse_batch_args(argv=None):
+    """
+    Analisa os argumentos do subcomando "batch".
+    
+    Args:
+        argv (list): Argumentos após "batch".
+        
+    Returns:
+        argparse.Namespace: Argumentos analisados.
+    """
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} batch",
+        description='Processa um lote de editais em processos que carregam os modelos uma única vez, '
+                    'registrando o resultado de cada documento em um manifesto retomável.'
+    )
+    
+    parser.add_argument(
+        'inputs',
+        nargs='+',
+        help='Diretórios com PDFs (percorridos recursivamente), arquivos PDF ou listas de arquivos (um caminho por linha).'
+    )
+    
+    parser.add_argument(
+        '-o', '--output-dir',
+        required=True,
+        help='Diretório de saída; cada edital é gravado em um subdiretório com o nome do PDF.'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Número de editais processados ao mesmo tempo (um processo por edital). Padrão: 1.'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=600,
+        metavar='SEGUNDOS',
+        help='Tempo limite por edital; o processo que passa do limite é encerrado. 0 desativa. Padrão: 600.'
+    )
+    
+    parser.add_argument(
+        '--manifest',
+        metavar='ARQUIVO',
+        help='Manifesto JSONL com o resultado de cada edital. Padrão: manifesto.jsonl no diretório de saída.'
+    )
+    
+    parser.add_argument(
+        '--retry-failed',
+        action='store_true',
+        help='Processa de novo os editais registrados no manifesto com erro ou tempo esgotado.'
+    )
+    
+    _add_processing_arguments(parser)
+    
+    return parser.parse_args(argv)
+
+def parse_serve_args(argv=None):
+    """
+    Analisa os argumentos do subcomando "serve".
+    
+    Args:
+        argv (list): Argumentos após "serve".
+        
+    Returns:
+        argparse.Namespace: Argumentos analisados.
+    """
+    parser = argparse.ArgumentParser(
+        prog=f"{os.path.basename(sys.argv[0])} serve",
+        description='Inicia o serviço HTTP local de extração, com fila de trabalhos e processos '
+                    'que mantêm os modelos carregados entre os editais.'
+    )
+    
+    parser.add_argument(
+        '--host',
+        default='127.0.0.1',
+        help='Endereço de escuta. Padrão: 127.0.0.1 (apenas a máquina local).'
+    )
+    
+    parser.add_argument(
+        '--port',
+        type=int,
+        default=8765,
+        help='Porta de escuta. Padrão: 8765.'
+    )
+    
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=1,
+        help='Número de editais processados ao mesmo tempo (um processo por edital). Padrão: 1.'
+    )
+    
+    parser.add_argument(
+        '--max-queue',
+        type=int,
+        default=16,
+        help='Número máximo de editais aguardando na fila; além dele, o envio é recusado (503). Padrão: 16.'
+    )
+    
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=600,
+        metavar='SEGUNDOS',
+        help='Tempo limite por edital; o processo que passa do limite é encerrado. 0 desativa. Padrão: 600.'
+    )
+    
+    parser.add_argument(
+        '--max-upload',
+        type=int,
+        default=100,
+        metavar='MB',
+        help='Tamanho máximo do PDF enviado. Padrão: 100.'
+    )
+    
+    parser.add_argument(
+        '--work-dir',
+        metavar='DIR',
+        help='Diretório dos trabalhos (PDFs enviados e resultados). Padrão: diretório temporário, '
+             'removido ao encerrar o serviço.'
+    )
+    
+    _add_processing_arguments(parser)
+    
+    return parser.parse_args(argv)
+
+def _add_processing_arguments(parser):
+    """Adiciona as opções de processamento comuns ao edital único e ao lote."""
     parser.add_argument(
         '--no-ocr',
         action='store_true',
         help='Desativa o uso de OCR para páginas digitalizadas.'
     )
     
+    parser.add_argument(
+        '--ocr-threads',
+        type=int,
+        help='Limite de threads (torch/OpenMP) por processo OCR.'
+    )
+    
+    parser.add_argument(
+        '--ocr-cache',
+        metavar='DIR',
+        help='Diretório do cache de OCR; páginas já reconhecidas são reaproveitadas.'
+    )
+    
+    parser.add_argument(
+        '--ocr-cache-size',
+        type=int,
+        default=1024,
+        metavar='MB',
+        help='Tamanho máximo do cache de OCR em MB. Padrão: 1024.'
+    )
+    
+    parser.add_argument(
+        '--cache',
+        metavar='DIR',
+        help='Diretório do cache de etapas; etapas cujo código não mudou são reaproveitadas entre execuções.'
+    )
+    
+    parser.add_argument(
+        '--no-table-prefilter',
+        action='store_true',
+        help='Desativa o pré-filtro de páginas e procura tabelas em todas as páginas.'
+    )
+    
+    parser.add_argument(
+        '--table-fallback',
+        action='store_true',
+        help='Reexamina com configurações alternativas as páginas candidatas em que nenhuma tabela foi encontrada.'
+    )
+    
+    parser.add_argument(
+        '--table-engine',
+        choices=['pdfplumber', 'fitz'],
+        default='pdfplumber',
+        help='Motor de extração de tabelas. "fitz" usa o PyMuPDF já carregado e dispensa o pdfplumber. Padrão: pdfplumber.'
+    )
+    
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='Processa o PDF página a página em uma única passagem, com memória limitada (sem cache de etapas).'
+    )
+    
     parser.add_argument(
         '--debug',
         action='store_true',
         help='Ativa o modo de depuração (logs mais detalhados).'
     )
     
-    return parser.parse_args()
+def _processor_options(args):
+    """Converte as opções de processamento comuns nos argumentos do PDFProcessor."""
+    return {
+        'use_ocr': not args.no_ocr,
+        'ocr_threads': args.ocr_threads,
+        'ocr_cache_dir': args.ocr_cache,
+        'ocr_cache_size_mb': args.ocr_cache_size,
+        'cache_dir': args.cache,
+        'table_prefilter': not args.no_table_prefilter,
+        'table_fallback': args.table_fallback,
+        'table_engine': args.table_engine,
+        'streaming': args.stream
+    }
+
+def batch_main(argv=None):
+    """
+    Função principal do subcomando "batch".
+    
+    Args:
+        argv (list): Argumentos após "batch".
+        
+    Returns:
+        int: 0 se todos os editais processados nesta execução terminaram com
+            sucesso, 1 caso contrário.
+    """
+    args = parse_batch_args(argv)
+    
+    from .batch import BatchProcessor, collect_pdfs
+    
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    try:
+        pdfs = collect_pdfs(args.inputs)
+    except OSError as e:
+        logger.error(f"Erro ao ler as entradas do lote: {e}")
+        return 1
+    
+    if not pdfs:
+        logger.error("Nenhum PDF encontrado nas entradas do lote.")
+        return 1
+    
+    batch = BatchProcessor(
+        output_dir=args.output_dir,
+        manifest_path=args.manifest,
+        jobs=args.jobs,
+        timeout=args.timeout,
+        retry_failed=args.retry_failed,
+        debug=args.debug,
+        **_processor_options(args)
+    )
+    try:
+        summary = batch.run(pdfs)
+    except KeyboardInterrupt:
+        logger.error(f"Lote interrompido; execute o mesmo comando para continuar de onde parou "
+                     f"(manifesto: {batch.manifest_path}).")
+        return 130
+    
+    print("\n=== RESUMO DO LOTE ===")
+    print(f"  Processados com sucesso: {summary['ok']}")
+    print(f"  Com erro: {summary['erro']}")
+    print(f"  Com tempo esgotado: {summary['tempo_esgotado']}")
+    print(f"  Já registrados (pulados): {summary['pulados']}")
+    print(f"  Manifesto: {batch.manifest_path}")
+    
+    return 0 if summary['erro'] == 0 and summary['tempo_esgotado'] == 0 else 1
 
-def main():
-    """Função principal da interface de linha de comando."""
-    args = parse_args()
+def serve_main(argv=None):
+    """
+    Função principal do subcomando "serve": atende requisições até Ctrl+C.
+    
+    Args:
+        argv (list): Argumentos após "serve".
+        
+    Returns:
+        int: Código de saída.
+    """
+    args = parse_serve_args(argv)
+    
+    from .service import ExtractionService, make_server
+    
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    
+    service = ExtractionService(
+        work_dir=args.work_dir,
+        workers=args.jobs,
+        max_queue=args.max_queue,
+        timeout=args.timeout,
+        max_upload_mb=args.max_upload,
+        debug=args.debug,
+        **_processor_options(args)
+    )
+    
+    try:
+        server = make_server(service, args.host, args.port)
+    except OSError as e:
+        logger.error(f"Erro ao abrir {args.host}:{args.port}: {e}")
+        return 1
+    
+    service.start()
+    host, port = server.server_address[:2]
+    logger.info(f"Serviço de extração em http://{host}:{port} "
+                f"({service.workers} processo(s), fila de até {service.max_queue} editais).")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Encerrando o serviço...")
+    finally:
+        server.server_close()
+        service.close()
+    
+    return 0
+
+def main(argv=None):
+    """
+    Função principal da interface de linha de comando.
+    
+    Args:
+        argv (list): Argumentos (padrão: sys.argv[1:]). Se o primeiro é "batch"
+            ou "serve", os demais são tratados pelo subcomando (ver batch_main e
+            serve_main).
+            
+    Returns:
+        int: Código de saída dos subcomandos (None para um edital único).
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'batch':
+        return batch_main(argv[1:])
+    if argv and argv[0] == 'serve':
+        return serve_main(argv[1:])
+    
+    args = parse_args(argv)
     
     # Configurar nível de log
     if args.debug:
@@ -64,12 +398,16 @@ def main():
         logger.error(f"Arquivo PDF não encontrado: {args.pdf_path}")
         sys.exit(1)
     
+    from .processors.pdf_processor import PDFProcessor
+    
     try:
         # Processar o PDF
         processor = PDFProcessor(
             pdf_path=args.pdf_path,
             output_dir=args.output_dir,
-            use_ocr=not args.no_ocr
+            workers=args.workers,
+            ocr_workers=args.ocr_workers,
+            **_processor_options(args)
         )
         
         # Extrair dados
@@ -129,4 +467,4 @@ def main():
         sys.exit(1)
 
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
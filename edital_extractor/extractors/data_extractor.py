@@ -3,11 +3,11 @@ Extrator de dados estruturados de editais.
 """
 
 import logging
-import re
+from bisect import bisect_left, bisect_right
 from ..utils.regex_patterns import (
-    find_all_dates, find_all_money_values, KEYWORDS,
-    DATE_PATTERN_SLASH, DATE_PATTERN_DASH, DATE_RANGE_PATTERN, MONEY_PATTERN
+    find_all_dates, find_all_money_values, KEYWORDS, DATA_PATTERNS, KEYWORD_PATTERNS, MONEY_PATTERN
 )
+from ..utils.gazetteer import load_gazetteer
 
 # Configuração de logging
 logging.basicConfig(
@@ -17,7 +17,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 class DataExtractor:
-    """Classe para extrair dados estruturados de editais."""
+    """
+    Classe para extrair dados estruturados de editais.
+    
+    Todos os padrões vêm de regex_patterns (DATA_PATTERNS e KEYWORD_PATTERNS),
+    compilados uma única vez na importação; nenhum padrão é construído durante
+    a extração. Bancas, órgãos e cargos são reconhecidos pelos dicionários de
+    utils.gazetteer, carregados uma única vez por processo.
+    """
+    
+    # Distância máxima (em caracteres) entre o título do cargo e a contagem de vagas
+    VACANCY_CARGO_WINDOW = 200
+    
+    # Distância máxima (em caracteres) entre a contagem de vagas e o fim de cada cota
+    VACANCY_QUOTA_WINDOW = 500
+    
+    # Campo de cada cota -> padrão em DATA_PATTERNS
+    QUOTA_PATTERNS = (
+        ('ampla_concorrencia', 'vagas_ac'),
+        ('pcd', 'vagas_pcd'),
+        ('negros', 'vagas_negros'),
+    )
     
     def __init__(self):
         """Inicializa o extrator de dados."""
@@ -45,32 +65,32 @@ class DataExtractor:
         identification = {}
         
         # Extrair número do edital
-        edital_pattern = re.compile(r'EDITAL\s+(?:N[º°\.])?\s*(\d+[/-]\d{4})', re.IGNORECASE)
-        edital_match = edital_pattern.search(text)
+        edital_match = DATA_PATTERNS['numero_edital'].search(text)
         if edital_match:
             identification['numero_edital'] = edital_match.group(1)
         
         # Extrair nome do órgão/instituição
-        # Geralmente está nas primeiras linhas do documento
+        # Geralmente está na primeira linha com texto do documento; se ela cita um
+        # órgão conhecido, vale o nome canônico do órgão
         lines = text.split('\n')[:10]  # Primeiras 10 linhas
+        line_start = 0
         for line in lines:
-            line = line.strip()
-            if len(line) > 5 and not line.startswith('EDITAL'):
-                identification['orgao'] = line
+            stripped = line.strip()
+            if len(stripped) > 5 and not stripped.startswith('EDITAL'):
+                orgaos = load_gazetteer('orgaos').find_all(text, line_start, line_start + len(line))
+                identification['orgao'] = orgaos[0].name if orgaos else stripped
                 break
+            line_start += len(line) + 1
         
         # Extrair ano do concurso (do número do edital ou do texto)
-        year_pattern = re.compile(r'(?:CONCURSO|SELE[ÇC][ÃA]O).*?(\d{4})', re.IGNORECASE)
-        year_match = year_pattern.search(text)
+        year_match = DATA_PATTERNS['ano'].search(text)
         if year_match:
             identification['ano'] = year_match.group(1)
         
-        # Extrair banca organizadora
-        bancas = ['FGV', 'CEBRASPE', 'CESPE', 'FCC', 'VUNESP', 'CESGRANRIO', 'IBFC', 'IADES', 'AOCP']
-        for banca in bancas:
-            if re.search(r'\b' + re.escape(banca) + r'\b', text, re.IGNORECASE):
-                identification['banca'] = banca
-                break
+        # Extrair banca organizadora (a de maior prioridade entre as citadas)
+        bancas = load_gazetteer('bancas').find_all(text)
+        if bancas:
+            identification['banca'] = min(bancas, key=lambda mention: mention.priority).name
         
         self.extracted_data['identificacao'] = identification
         return identification
@@ -79,6 +99,11 @@ class DataExtractor:
         """
         Extrai informações de cronograma do edital.
         
+        As datas de todo o texto são encontradas em uma única passagem (ver
+        find_all_dates) e agrupadas por linha; apenas as linhas com datas são
+        examinadas. Em cada linha vale o primeiro intervalo ou, se não houver,
+        a primeira data.
+        
         Args:
             text (str): Texto a ser analisado.
             
@@ -87,44 +112,89 @@ class DataExtractor:
         """
         schedule = []
         
-        # Procurar por padrões de data
-        dates = find_all_dates(text)
-        
         # Procurar por linhas que contêm datas e descrições de eventos
-        lines = text.split('\n')
-        for line in lines:
-            line = line.strip()
+        for line_start, line_dates in _group_dates(find_all_dates(text), text):
+            line_end = text.find('\n', line_start)
+            line = text[line_start:line_end if line_end != -1 else len(text)].strip()
             
-            # Verificar se a linha contém uma data
-            date_match_slash = DATE_PATTERN_SLASH.search(line)
-            date_match_dash = DATE_PATTERN_DASH.search(line)
-            date_range_match = DATE_RANGE_PATTERN.search(line)
+            # Extrair a data e remover a data da linha para obter a descrição
+            date = _pick_date(line_dates)
+            description = line.replace(date.text, '').strip()
             
-            if date_match_slash or date_match_dash or date_range_match:
-                # Extrair a data e a descrição do evento
-                if date_range_match:
-                    date = date_range_match.group(0)
-                    # Remover a data da linha para obter a descrição
-                    description = line.replace(date, '').strip()
-                elif date_match_slash:
-                    date = date_match_slash.group(0)
-                    description = line.replace(date, '').strip()
-                else:
-                    date = date_match_dash.group(0)
-                    description = line.replace(date, '').strip()
-                
-                # Limpar a descrição (remover pontuação no início)
-                description = re.sub(r'^[:\-–—\s]+', '', description)
-                
-                if description:  # Só adicionar se tiver uma descrição
-                    schedule.append({
-                        'data': date,
-                        'descricao': description
-                    })
+            # Limpar a descrição (remover pontuação no início)
+            description = DATA_PATTERNS['prefixo_descricao'].sub('', description)
+            
+            if description:  # Só adicionar se tiver uma descrição
+                schedule.append({
+                    'data': date.text,
+                    'data_iso': date.value,
+                    'descricao': description
+                })
         
         self.extracted_data['cronograma'] = schedule
         return schedule
     
+    def extract_schedule_from_tables(self, dataframes):
+        """
+        Extrai eventos de tabelas de cronograma e os acrescenta ao cronograma.
+        
+        As células de todas as tabelas são reunidas em um único texto, uma por
+        linha, para que as datas sejam encontradas em uma única passagem. Cada
+        linha de tabela com data gera um evento, cuja descrição é formada pelas
+        demais células; eventos já obtidos do texto não são repetidos.
+        
+        Args:
+            dataframes (list): DataFrames das tabelas identificadas como cronograma.
+            
+        Returns:
+            list: Eventos acrescentados.
+        """
+        cells = []
+        cell_rows = []
+        rows = []
+        for dataframe in dataframes:
+            for row in dataframe.to_numpy(dtype=object):
+                for value in row:
+                    # Células vazias são None; quebras de linha viram espaços
+                    cells.append(' '.join(str(value).split()) if value is not None else '')
+                    cell_rows.append(len(rows))
+                rows.append((len(cells) - len(row), len(cells)))
+        
+        text = '\n'.join(cells)
+        cell_starts = []
+        position = 0
+        for cell in cells:
+            cell_starts.append(position)
+            position += len(cell) + 1
+        
+        schedule = self.extracted_data['cronograma']
+        seen = {(event['data_iso'], _event_key(event['descricao'])) for event in schedule}
+        added = []
+        
+        dates_by_row = {}
+        for date in find_all_dates(text):
+            row = cell_rows[bisect_right(cell_starts, date.start) - 1]
+            dates_by_row.setdefault(row, []).append(date)
+        
+        for row, row_dates in dates_by_row.items():
+            date = _pick_date(row_dates)
+            first_cell, last_cell = rows[row]
+            pieces = (cells[i].replace(date.text, '').strip() for i in range(first_cell, last_cell))
+            description = ' '.join(piece for piece in pieces if piece)
+            description = DATA_PATTERNS['prefixo_descricao'].sub('', description)
+            
+            key = (date.value, _event_key(description))
+            if description and key not in seen:
+                seen.add(key)
+                added.append({
+                    'data': date.text,
+                    'data_iso': date.value,
+                    'descricao': description
+                })
+        
+        schedule.extend(added)
+        return added
+    
     def extract_registration_info(self, text):
         """
         Extrai informações de inscrição do edital.
@@ -137,18 +207,28 @@ class DataExtractor:
         """
         registration_info = {}
         
-        # Extrair período de inscrição
+        # Extrair período de inscrição: o primeiro par de datas depois de uma
+        # palavra-chave, na mesma linha (apenas essas linhas são percorridas)
+        lower = _lower_preserving_offsets(text)
+        period = None
         for keyword in KEYWORDS['periodo_inscricao']:
-            pattern = re.compile(r'(?:' + re.escape(keyword) + r').*?(\d{1,2}/\d{1,2}/\d{4})\s*(?:a|até|e)\s*(\d{1,2}/\d{1,2}/\d{4})', re.IGNORECASE)
-            match = pattern.search(text)
-            if match:
-                registration_info['periodo_inicio'] = match.group(1)
-                registration_info['periodo_fim'] = match.group(2)
+            keyword = keyword.lower()
+            for keyword_pos in _find_all(lower, keyword):
+                line_end = text.find('\n', keyword_pos)
+                dates = find_all_dates(text, keyword_pos + len(keyword),
+                                       line_end if line_end != -1 else len(text))
+                period = _date_period(text, dates)
+                if period:
+                    break
+            if period:
                 break
+        if period:
+            registration_info['periodo_inicio'] = period[0].text
+            registration_info['periodo_fim'] = period[1].text
+            registration_info['periodo_iso'] = f"{period[0].value}/{period[1].value}"
         
         # Extrair taxa de inscrição
-        for keyword in KEYWORDS['taxa_inscricao']:
-            pattern = re.compile(r'(?:' + re.escape(keyword) + r').*?R\$\s?(\d{1,3}(?:\.\d{3})*,\d{2})', re.IGNORECASE)
+        for pattern in KEYWORD_PATTERNS['taxa_inscricao']:
             match = pattern.search(text)
             if match:
                 registration_info['taxa'] = match.group(1)
@@ -158,7 +238,8 @@ class DataExtractor:
         if 'taxa' not in registration_info:
             lines = text.split('\n')
             for i, line in enumerate(lines):
-                if any(keyword in line.lower() for keyword in ['taxa', 'inscrição', 'pagamento']):
+                line_lower = line.lower()
+                if any(keyword in line_lower for keyword in ('taxa', 'inscrição', 'pagamento')):
                     # Verificar esta linha e as próximas 3 linhas
                     for j in range(i, min(i+4, len(lines))):
                         money_match = MONEY_PATTERN.search(lines[j])
@@ -175,6 +256,14 @@ class DataExtractor:
         """
         Extrai informações sobre cargos do edital.
         
+        A seção de cada cargo vai do fim do seu título até a próxima ocorrência
+        de "CARGO". Os limites de todas as seções, as posições das palavras-chave
+        (no texto convertido uma única vez para minúsculas) e as dos valores
+        monetários são calculados antes do laço; cada cargo consulta essas listas
+        por busca binária, sem recortar ou percorrer novamente o texto. O nome
+        padronizado do cargo ('cargo_padrao') é o primeiro cargo do dicionário
+        de cargos citado no título.
+        
         Args:
             text (str): Texto a ser analisado.
             
@@ -183,58 +272,76 @@ class DataExtractor:
         """
         positions = []
         
-        # Padrão para identificar cargos (geralmente em maiúsculas ou com formatação específica)
-        cargo_pattern = re.compile(r'(?:CARGO|FUNÇÃO)(?:\s*:|\s+DE|\s+)\s*([A-ZÁÀÂÃÉÈÊÍÏÓÔÕÖÚÇÑ\s]+)(?:\s*-|\s*:|\s*\n)', re.IGNORECASE)
-        cargo_matches = cargo_pattern.finditer(text)
+        lower = _lower_preserving_offsets(text)
+        
+        # Limites das seções: inícios das ocorrências de "CARGO"
+        boundaries = _find_all(text, 'CARGO')
+        
+        # Posições das palavras-chave de requisitos e de remuneração
+        requirement_keywords = [
+            (keyword.lower(), _find_all(lower, keyword.lower()), pattern)
+            for keyword, pattern in zip(KEYWORDS['requisitos'], KEYWORD_PATTERNS['requisitos'])
+        ]
+        salary_keywords = [
+            (keyword.lower(), _find_all(lower, keyword.lower()))
+            for keyword in KEYWORDS['remuneracao']
+        ]
+        
+        # Valores monetários escritos como "R$ valor" (os demais não têm posição
+        # associada à palavra-chave). Cada trecho entre ocorrências de "CARGO" é
+        # percorrido uma vez, com os mesmos limites de texto das seções.
+        money_positions = []
+        money_values = []
+        for segment_start, segment_end in zip([0] + boundaries, boundaries + [len(text)]):
+            for money_match in MONEY_PATTERN.finditer(text, segment_start, segment_end):
+                if money_match.start(1) == money_match.start() + 3 and text[money_match.start() + 2] == ' ':
+                    money_positions.append(money_match.start())
+                    money_values.append(money_match.group(1))
+        
+        cargo_gazetteer = load_gazetteer('cargos')
         
-        for match in cargo_matches:
+        # Padrão para identificar cargos (geralmente em maiúsculas ou com formatação específica)
+        for match in _cargo_matches(text, lower):
             cargo_nome = match.group(1).strip()
             
             # Evitar falsos positivos (linhas muito curtas ou muito longas)
             if 3 < len(cargo_nome) < 100:
                 # Procurar requisitos e remuneração próximos ao cargo
                 start_pos = match.end()
-                end_pos = text.find('CARGO', start_pos)
-                if end_pos == -1:
-                    end_pos = len(text)
+                boundary = bisect_left(boundaries, start_pos)
+                end_pos = boundaries[boundary] if boundary < len(boundaries) else len(text)
                 
-                cargo_section = text[start_pos:end_pos]
-                
-                # Extrair requisitos
+                # Extrair requisitos: a busca começa na primeira ocorrência da
+                # palavra-chave dentro da seção
                 requisitos = ""
-                for keyword in KEYWORDS['requisitos']:
-                    req_pattern = re.compile(r'(?:' + re.escape(keyword) + r')(?:\s*:|\s*-|\s*)\s*(.*?)(?:\n\s*\n|\n(?:[A-Z][a-z]+:))', re.IGNORECASE | re.DOTALL)
-                    req_match = req_pattern.search(cargo_section)
+                for keyword, keyword_positions, req_pattern in requirement_keywords:
+                    keyword_pos = _first_within(keyword_positions, start_pos, end_pos - len(keyword))
+                    if keyword_pos is None:
+                        continue
+                    req_match = req_pattern.search(text, keyword_pos, end_pos)
                     if req_match:
                         requisitos = req_match.group(1).strip()
                         break
                 
-                # Extrair remuneração
+                # Extrair remuneração: valor monetário mais próximo da primeira
+                # palavra-chave encontrada na seção
                 remuneracao = ""
-                money_matches = MONEY_PATTERN.findall(cargo_section)
-                if money_matches:
-                    for keyword in KEYWORDS['remuneracao']:
-                        if keyword.lower() in cargo_section.lower():
-                            # Encontrar o valor monetário mais próximo da palavra-chave
-                            keyword_pos = cargo_section.lower().find(keyword.lower())
-                            closest_money = None
-                            min_distance = float('inf')
-                            
-                            for money_match in money_matches:
-                                money_str = f"R$ {money_match[0]}"
-                                money_pos = cargo_section.find(money_str)
-                                if money_pos != -1:
-                                    distance = abs(money_pos - keyword_pos)
-                                    if distance < min_distance:
-                                        min_distance = distance
-                                        closest_money = money_match[0]
-                            
-                            if closest_money:
-                                remuneracao = closest_money
-                                break
+                first_money = bisect_left(money_positions, start_pos)
+                last_money = bisect_left(money_positions, end_pos)
+                if first_money < last_money:
+                    for keyword, keyword_positions in salary_keywords:
+                        keyword_pos = _first_within(keyword_positions, start_pos, end_pos - len(keyword))
+                        if keyword_pos is not None:
+                            closest = _closest(money_positions, first_money, last_money, keyword_pos)
+                            remuneracao = money_values[closest]
+                            break
+                
+                # Nome padronizado do cargo
+                cargos = cargo_gazetteer.find_all(text, match.start(1), match.end(1))
                 
                 positions.append({
                     'nome': cargo_nome,
+                    'cargo_padrao': cargos[0].name if cargos else "",
                     'requisitos': requisitos,
                     'remuneracao': remuneracao
                 })
@@ -246,6 +353,14 @@ class DataExtractor:
         """
         Extrai informações sobre vagas do edital.
         
+        O texto é percorrido uma vez para os títulos de cargo e uma vez para os
+        números: as posições dos títulos, das contagens de vagas e das cotas (AC,
+        PcD e negros) são coletadas em listas ordenadas e cada contagem é
+        associada, por busca binária, ao
+        título de cargo mais próximo que a precede (até VACANCY_CARGO_WINDOW
+        caracteres antes) e à primeira cota de cada tipo que a segue (até
+        VACANCY_QUOTA_WINDOW caracteres depois).
+        
         Args:
             text (str): Texto a ser analisado.
             
@@ -254,54 +369,43 @@ class DataExtractor:
         """
         vacancies = {}
         
-        # Padrão para identificar número de vagas
-        vagas_pattern = re.compile(r'(\d+)\s+(?:vagas|vaga)', re.IGNORECASE)
-        vagas_matches = vagas_pattern.finditer(text)
+        # Títulos de cargo: as posições de início e de fim crescem juntas, pois
+        # as ocorrências não se sobrepõem
+        cargo_matches = _cargo_matches(text)
+        cargo_starts = [match.start() for match in cargo_matches]
+        cargo_ends = [match.end() for match in cargo_matches]
         
-        for match in vagas_matches:
-            # Procurar o cargo associado a essas vagas
-            start_pos = max(0, match.start() - 200)  # Olhar até 200 caracteres antes
-            context = text[start_pos:match.start()]
+        # Contagens de vagas e cotas (AC, PcD e negros) em uma única passagem
+        counts = _count_matches(text, ['vagas'] + [name for _, name in self.QUOTA_PATTERNS])
+        quotas = {field: counts[name] for field, name in self.QUOTA_PATTERNS}
             
-            # Procurar por um nome de cargo no contexto
-            cargo_pattern = re.compile(r'(?:CARGO|FUNÇÃO)(?:\s*:|\s+DE|\s+)\s*([A-ZÁÀÂÃÉÈÊÍÏÓÔÕÖÚÇÑ\s]+)(?:\s*-|\s*:|\s*\n)', re.IGNORECASE)
-            cargo_match = cargo_pattern.search(context)
+        for position, _, num_vagas in zip(*counts['vagas']):
+            # Título de cargo mais próximo que termina antes da contagem de vagas
+            index = bisect_right(cargo_ends, position) - 1
+            if index < 0 or cargo_starts[index] < position - self.VACANCY_CARGO_WINDOW:
+                continue
             
-            if cargo_match:
-                cargo_nome = cargo_match.group(1).strip()
-                num_vagas = int(match.group(1))
-                
-                # Verificar se já temos este cargo
-                if cargo_nome in vacancies:
-                    # Atualizar apenas se o novo número for maior
-                    if num_vagas > vacancies[cargo_nome]['total']:
-                        vacancies[cargo_nome]['total'] = num_vagas
-                else:
-                    vacancies[cargo_nome] = {
-                        'total': num_vagas,
-                        'ampla_concorrencia': 0,
-                        'pcd': 0,
-                        'negros': 0
-                    }
+            cargo_nome = cargo_matches[index].group(1).strip()
                 
-                # Procurar distribuição de vagas (AC, PCD, Negros)
-                # Ampla Concorrência
-                ac_pattern = re.compile(r'(\d+)\s+(?:vaga|vagas)?\s*(?:para)?\s*(?:ampla\s+concorrência|AC)', re.IGNORECASE)
-                ac_match = ac_pattern.search(text[match.start():match.start() + 500])
-                if ac_match:
-                    vacancies[cargo_nome]['ampla_concorrencia'] = int(ac_match.group(1))
+            # Verificar se já temos este cargo
+            if cargo_nome in vacancies:
+                # Atualizar apenas se o novo número for maior
+                if num_vagas > vacancies[cargo_nome]['total']:
+                    vacancies[cargo_nome]['total'] = num_vagas
+            else:
+                vacancies[cargo_nome] = {
+                    'total': num_vagas,
+                    'ampla_concorrencia': 0,
+                    'pcd': 0,
+                    'negros': 0
+                }
                 
-                # PCD
-                pcd_pattern = re.compile(r'(\d+)\s+(?:vaga|vagas)?\s*(?:para)?\s*(?:pessoa|candidato)?\s*(?:com)?\s*(?:deficiência|PCD|PcD)', re.IGNORECASE)
-                pcd_match = pcd_pattern.search(text[match.start():match.start() + 500])
-                if pcd_match:
-                    vacancies[cargo_nome]['pcd'] = int(pcd_match.group(1))
-                
-                # Negros
-                negros_pattern = re.compile(r'(\d+)\s+(?:vaga|vagas)?\s*(?:para)?\s*(?:pessoa|candidato)?\s*(?:negra|negro|preta|preto|parda|pardo)', re.IGNORECASE)
-                negros_match = negros_pattern.search(text[match.start():match.start() + 500])
-                if negros_match:
-                    vacancies[cargo_nome]['negros'] = int(negros_match.group(1))
+            # Distribuição das vagas: primeira cota de cada tipo após a contagem
+            limit = position + self.VACANCY_QUOTA_WINDOW
+            for field, (starts, ends, values) in quotas.items():
+                quota_index = bisect_left(starts, position)
+                if quota_index < len(starts) and ends[quota_index] <= limit:
+                    vacancies[cargo_nome][field] = values[quota_index]
         
         self.extracted_data['vagas'] = vacancies
         return vacancies
@@ -332,11 +436,11 @@ class DataExtractor:
         
         # Padrões para identificar seções e disciplinas
         section_patterns = {
-            'basicos': re.compile(r'\b(CONHECIMENTOS\s+B[ÁA]SICOS|CONHECIMENTOS\s+GERAIS)\b', re.IGNORECASE),
-            'especificos': re.compile(r'\b(CONHECIMENTOS\s+ESPEC[ÍI]FICOS)(?:\s*(?:PARA|DO|DE|-)?\s*(.+))?\b', re.IGNORECASE)
+            'basicos': DATA_PATTERNS['conhecimentos_basicos'],
+            'especificos': DATA_PATTERNS['conhecimentos_especificos']
         }
         
-        discipline_pattern = re.compile(r'^[A-ZÁÀÂÃÉÈÊÍÏÓÔÕÖÚÇÑ\s]{3,50}:?$')
+        discipline_pattern = DATA_PATTERNS['disciplina']
         
         for line in lines:
             line = line.strip()
@@ -414,7 +518,7 @@ class DataExtractor:
             # Se não é seção nem disciplina, é um tópico
             if current_section and current_discipline:
                 # Limpar marcadores de lista
-                clean_line = re.sub(r'^\s*[\d\.\)\-•*]+\s*', '', line)
+                clean_line = DATA_PATTERNS['marcador_topico'].sub('', line)
                 if clean_line:
                     current_topics.append(clean_line)
         
@@ -444,3 +548,178 @@ class DataExtractor:
             dict: Todos os dados extraídos.
         """
         return self.extracted_data
+
+
+def _group_dates(dates, text):
+    """
+    Agrupa as datas pela linha do texto em que estão.
+    
+    Returns:
+        list: Pares (início da linha, datas da linha), na ordem do texto.
+    """
+    groups = []
+    for date in dates:
+        line_start = text.rfind('\n', 0, date.start) + 1
+        if groups and groups[-1][0] == line_start:
+            groups[-1][1].append(date)
+        else:
+            groups.append((line_start, [date]))
+    return groups
+
+
+def _pick_date(dates):
+    """Escolhe a data de um evento: o primeiro intervalo ou, se não houver, a primeira data."""
+    for date in dates:
+        if date.kind == 'intervalo':
+            return date
+    return dates[0]
+
+
+def _date_period(text, dates):
+    """
+    Encontra o primeiro período (par de datas) entre as datas de um trecho.
+    
+    Um período é um intervalo ("01/03/2025 a 31/03/2025") ou duas datas ligadas
+    por "a", "até" ou "e".
+    
+    Args:
+        text (str): Texto analisado.
+        dates (list): Datas do trecho (DateSpan), na ordem do texto.
+        
+    Returns:
+        tuple: (data inicial, data final) ou None.
+    """
+    for index, date in enumerate(dates):
+        if date.kind == 'intervalo':
+            return date.parts
+        if index + 1 < len(dates):
+            following = dates[index + 1]
+            if (following.kind != 'intervalo'
+                    and DATA_PATTERNS['conector_periodo'].fullmatch(text, date.end, following.start)):
+                return date, following
+    return None
+
+
+def _event_key(description):
+    """Chave de comparação de descrições de eventos (sem diferenças de espaços e maiúsculas)."""
+    return ' '.join(description.split()).lower()
+
+
+def _cargo_matches(text, lower=None):
+    """
+    Encontra os títulos de cargo, com o mesmo resultado de
+    DATA_PATTERNS['cargo'].finditer(text).
+    
+    Com IGNORECASE, o módulo re tenta o padrão em cada posição do texto; aqui
+    ele é tentado apenas onde "cargo" ou "função" aparece, localizados com
+    str.find sobre o texto em minúsculas.
+    
+    Args:
+        text (str): Texto a ser analisado.
+        lower (str): Texto em minúsculas (ver _lower_preserving_offsets), se já calculado.
+        
+    Returns:
+        list: Ocorrências (re.Match), na ordem do texto e sem sobreposição.
+    """
+    pattern = DATA_PATTERNS['cargo']
+    if lower is None:
+        lower = _lower_preserving_offsets(text)
+    candidates = sorted(_find_all(lower, 'cargo') + _find_all(lower, 'função'))
+    
+    matches = []
+    end = 0
+    for position in candidates:
+        if position < end:
+            continue
+        match = pattern.match(text, position)
+        if match:
+            matches.append(match)
+            end = match.end()
+    
+    return matches
+
+
+def _lower_preserving_offsets(text):
+    """
+    Converte o texto para minúsculas mantendo as posições de cada caractere.
+    
+    Alguns caracteres (como "İ") mudam de tamanho em minúsculas; eles são
+    mantidos como estão para que as posições no texto convertido valham no
+    texto original.
+    """
+    lower = text.lower()
+    if len(lower) != len(text):
+        lower = ''.join(char if len(char.lower()) != 1 else char.lower() for char in text)
+    return lower
+
+
+def _first_within(positions, start, last):
+    """
+    Obtém a primeira posição da lista ordenada entre start e last (inclusive).
+    
+    Returns:
+        int: Posição encontrada ou None.
+    """
+    index = bisect_left(positions, start)
+    if index < len(positions) and positions[index] <= last:
+        return positions[index]
+    return None
+
+
+def _closest(positions, first, last, target):
+    """
+    Obtém o índice da posição mais próxima de target entre positions[first:last].
+    
+    Em caso de empate, vale a posição anterior.
+    
+    Returns:
+        int: Índice em positions.
+    """
+    index = bisect_left(positions, target, first, last)
+    if index == last:
+        return last - 1
+    if index > first and target - positions[index - 1] <= positions[index] - target:
+        return index - 1
+    return index
+
+
+def _find_all(text, word):
+    """Posições de todas as ocorrências de uma palavra no texto."""
+    positions = []
+    position = text.find(word)
+    while position != -1:
+        positions.append(position)
+        position = text.find(word, position + 1)
+    return positions
+
+
+def _count_matches(text, pattern_names):
+    """
+    Encontra as ocorrências de padrões de contagem ("N vagas", "N para ampla
+    concorrência" etc.), com o mesmo resultado de finditer para cada padrão.
+    
+    Todos esses padrões começam por um número e não têm outros dígitos, então
+    só podem começar no início de uma sequência de dígitos: o texto é percorrido
+    uma única vez em busca de números e cada padrão é tentado apenas ali.
+    
+    Args:
+        text (str): Texto a ser analisado.
+        pattern_names (list): Nomes dos padrões em DATA_PATTERNS.
+        
+    Returns:
+        dict: Nome do padrão -> (inícios, fins, números), na ordem do texto.
+    """
+    patterns = [DATA_PATTERNS[name] for name in pattern_names]
+    found = {name: ([], [], []) for name in pattern_names}
+    
+    for number in DATA_PATTERNS['numero'].finditer(text):
+        position = number.start()
+        for name, pattern in zip(pattern_names, patterns):
+            match = pattern.match(text, position)
+            if match:
+                starts, ends, values = found[name]
+                starts.append(position)
+                ends.append(match.end())
+                values.append(int(match.group(1)))
+    
+    return found
@@ -3,9 +3,10 @@ Extrator de seções de editais.
 """
 
 import logging
+import os
 import re
 from collections import defaultdict
-from ..utils.regex_patterns import SECTION_PATTERNS, find_section_by_keywords
+from ..utils.regex_patterns import SECTION_CLASSIFIER, find_section_by_keywords
 
 # Configuração de logging
 logging.basicConfig(
@@ -17,19 +18,39 @@ logger = logging.getLogger(__name__)
 class SectionExtractor:
     """Classe para extrair e identificar seções de editais."""
     
-    def __init__(self):
-        """Inicializa o extrator de seções."""
+    # Diferença mínima (em pontos) para um span ser considerado maior que o corpo do texto
+    HEADING_SIZE_DELTA = 1.0
+    
+    def __init__(self, font_stats=None, spool_dir=None):
+        """
+        Inicializa o extrator de seções.
+        
+        Args:
+            font_stats (FontStatistics): Estilo do corpo do texto do documento (ver
+                document_model.compute_font_statistics). Se None, títulos são
+                reconhecidos por fonte maior que 12pt ou em negrito.
+            spool_dir (str): Diretório para gravar o texto das seções (opcional). Se
+                informado, o texto de cada bloco é gravado no arquivo da sua seção
+                assim que a página é processada e nenhuma referência aos blocos é
+                mantida, de modo que a memória não cresce com o número de páginas.
+        """
         self.sections = defaultdict(list)
         self.section_boundaries = {}
+        self.font_stats = font_stats
+        self.spool_dir = spool_dir
+        self._spool_files = {}
     
     def extract_sections_from_blocks(self, blocks, page_num=0):
         """
         Extrai seções de uma lista de blocos de texto.
         
+        As seções guardam referências aos blocos da página (ver document_model)
+        e seus limites guardam apenas as posições dos blocos.
+        
         Args:
-            blocks (list): Lista de blocos de texto com informações de layout.
+            blocks (list): Blocos de texto da página (document_model.Block).
             page_num (int): Número da página (para referência).
-            
+        
         Returns:
             dict: Mapeamento de seções identificadas.
         """
@@ -38,36 +59,32 @@ class SectionExtractor:
         
         # Analisar cada bloco para identificar possíveis cabeçalhos de seção
         for block_idx, block in enumerate(blocks):
-            if block['type'] == 0:  # Bloco de texto
-                block_text = self._get_block_text(block)
-                
-                # Verificar se é um potencial título de seção
-                section_type = self._identify_section_type(block_text, block)
-                
-                if section_type:
-                    # Salvar a seção anterior
-                    if current_blocks:
-                        self.sections[current_section].extend(current_blocks)
-                        
-                        # Registrar limites da seção (para referência)
-                        if current_section not in self.section_boundaries:
-                            self.section_boundaries[current_section] = []
-                        self.section_boundaries[current_section].append({
-                            'page': page_num,
-                            'start_block': block_idx - len(current_blocks),
-                            'end_block': block_idx - 1,
-                            'blocks': current_blocks
-                        })
+            # Verificar se é um potencial título de seção
+            section_type = self._identify_section_type(block.text, block)
+            
+            if section_type:
+                # Salvar a seção anterior
+                if current_blocks:
+                    self._add_blocks(current_section, current_blocks)
                     
-                    # Iniciar nova seção
-                    current_section = section_type
-                    current_blocks = [block]
-                else:
-                    current_blocks.append(block)
+                    # Registrar limites da seção (para referência)
+                    if current_section not in self.section_boundaries:
+                        self.section_boundaries[current_section] = []
+                    self.section_boundaries[current_section].append({
+                        'page': page_num,
+                        'start_block': block_idx - len(current_blocks),
+                        'end_block': block_idx - 1
+                    })
+                
+                # Iniciar nova seção
+                current_section = section_type
+                current_blocks = [block]
+            else:
+                current_blocks.append(block)
         
         # Adicionar a última seção
         if current_blocks:
-            self.sections[current_section].extend(current_blocks)
+            self._add_blocks(current_section, current_blocks)
             
             # Registrar limites da última seção
             if current_section not in self.section_boundaries:
@@ -75,31 +92,31 @@ class SectionExtractor:
             self.section_boundaries[current_section].append({
                 'page': page_num,
                 'start_block': len(blocks) - len(current_blocks),
-                'end_block': len(blocks) - 1,
-                'blocks': current_blocks
+                'end_block': len(blocks) - 1
             })
         
         return dict(self.sections)
     
-    def _get_block_text(self, block):
+    def _add_blocks(self, section_type, blocks):
         """
-        Extrai o texto de um bloco.
+        Acrescenta blocos a uma seção, em memória ou no arquivo da seção.
         
         Args:
-            block (dict): Bloco de texto.
-            
-        Returns:
-            str: Texto do bloco.
-        """
-        try:
-            text = ""
-            for line in block.get('lines', []):
-                for span in line.get('spans', []):
-                    text += span.get('text', '')
-            return text.strip()
-        except Exception as e:
-            logger.error(f"Erro ao extrair texto do bloco: {e}")
-            return ""
+            section_type (str): Tipo de seção.
+            blocks (list): Blocos de texto (document_model.Block).
+        """
+        if self.spool_dir is None:
+            self.sections[section_type].extend(blocks)
+            return
+        
+        spool_file = self._spool_files.get(section_type)
+        if spool_file is None:
+            path = os.path.join(self.spool_dir, f"{len(self._spool_files)}.txt")
+            spool_file = self._spool_files[section_type] = open(path, 'w+', encoding='utf-8')
+        
+        for block in blocks:
+            spool_file.write(block.text)
+            spool_file.write("\n")
     
     def _identify_section_type(self, text, block):
         """
@@ -107,56 +124,58 @@ class SectionExtractor:
         
         Args:
             text (str): Texto do bloco.
-            block (dict): Bloco de texto com informações de layout.
-            
+            block (Block): Bloco de texto com informações de layout.
+        
         Returns:
             str: Tipo de seção identificado ou None.
         """
         # Verificar se o texto é curto (potencial título)
-        if len(text) > 150:
+        if len(text) >= 100:
             return None
         
-        # Verificar se o texto está em maiúsculas (comum em títulos)
+        # Verificar se o texto está em maiúsculas (comum em títulos) ou se o bloco
+        # tem características de título; os demais blocos são descartados sem regex
         is_uppercase = text.isupper() or text.upper() == text
+        if not is_uppercase and not self._check_title_format(block):
+            return None
         
-        # Verificar se o bloco tem características de título (fonte maior, negrito, etc.)
-        is_title_format = self._check_title_format(block)
-        
-        # Se tem características de título, verificar padrões de seção conhecidos
-        if (is_uppercase or is_title_format) and len(text) < 100:
-            for section_type, pattern in SECTION_PATTERNS.items():
-                if pattern.search(text):
-                    logger.info(f"Seção identificada: {section_type} - '{text}'")
-                    return section_type
+        # Verificar padrões de seção conhecidos em uma única passagem pelo texto
+        section_type = SECTION_CLASSIFIER.classify(text)
+        if section_type:
+            logger.info(f"Seção identificada: {section_type} - '{text}'")
         
-        return None
+        return section_type
     
     def _check_title_format(self, block):
         """
         Verifica se um bloco tem características de formatação de título.
         
         Args:
-            block (dict): Bloco de texto com informações de layout.
-            
+            block (Block): Bloco de texto com informações de layout.
+        
         Returns:
             bool: True se o bloco tem características de título, False caso contrário.
         """
-        try:
-            # Verificar se há informações de fonte
-            for line in block.get('lines', []):
-                for span in line.get('spans', []):
-                    # Verificar se a fonte é maior que o normal ou em negrito
-                    font_size = span.get('size', 0)
-                    font_name = span.get('font', '').lower()
-                    
-                    # Tamanho de fonte maior que 12 ou contém 'bold' no nome da fonte
-                    if font_size > 12 or 'bold' in font_name or 'negrito' in font_name:
-                        return True
-            
-            return False
-        except Exception as e:
-            logger.error(f"Erro ao verificar formato de título: {e}")
+        stats = self.font_stats
+        
+        if stats is None:
+            # Sem estatísticas do documento: tamanho de fonte maior que 12 ou
+            # 'bold' no nome da fonte
+            for span in block.spans:
+                font_name = span.font.lower()
+                if span.size > 12 or 'bold' in font_name or 'negrito' in font_name:
+                    return True
             return False
+        
+        # Comparar cada span com o estilo do corpo do texto do documento
+        heading_size = stats.body_size + self.HEADING_SIZE_DELTA
+        for span in block.spans:
+            if span.size >= heading_size:
+                return True
+            if not stats.body_bold and span.is_bold:
+                return True
+        
+        return False
     
     def get_section_text(self, section_type):
         """
@@ -164,18 +183,24 @@ class SectionExtractor:
         
         Args:
             section_type (str): Tipo de seção.
-            
+        
         Returns:
             str: Texto completo da seção.
         """
+        if self.spool_dir is not None:
+            spool_file = self._spool_files.get(section_type)
+            if spool_file is None:
+                return ""
+            spool_file.seek(0)
+            text = spool_file.read().strip()
+            spool_file.seek(0, os.SEEK_END)
+            return text
+        
         if section_type not in self.sections:
             return ""
         
-        text = ""
-        for block in self.sections[section_type]:
-            text += self._get_block_text(block) + "\n"
-        
-        return text.strip()
+        # O texto de cada bloco já foi calculado na leitura da página
+        return "\n".join(block.text for block in self.sections[section_type]).strip()
     
     def get_all_sections(self):
         """
@@ -184,8 +209,33 @@ class SectionExtractor:
         Returns:
             dict: Mapeamento de tipos de seção para seus textos.
         """
-        result = {}
-        for section_type in self.sections:
-            result[section_type] = self.get_section_text(section_type)
+        return dict(self.iter_sections())
+    
+    def section_types(self):
+        """
+        Obtém os tipos de seção identificados, na ordem em que apareceram.
+        
+        Returns:
+            list: Tipos de seção.
+        """
+        if self.spool_dir is not None:
+            return list(self._spool_files)
+        return list(self.sections)
+    
+    def iter_sections(self):
+        """
+        Percorre as seções identificadas, uma de cada vez.
+        
+        Com spool_dir, apenas o texto da seção atual fica em memória.
         
-        return result
+        Yields:
+            tuple: (tipo de seção, texto da seção).
+        """
+        for section_type in self.section_types():
+            yield section_type, self.get_section_text(section_type)
+    
+    def close(self):
+        """Fecha os arquivos de seção abertos em spool_dir."""
+        for spool_file in self._spool_files.values():
+            spool_file.close()
+        self._spool_files = {}
@@ -3,9 +3,16 @@ Extrator de tabelas de editais.
 """
 
 import logging
-import pandas as pd
-import pdfplumber
+import numpy as np
+import fitz  # PyMuPDF
 import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from ..utils.pdf_loader import split_page_ranges
+
+# O pandas e o pdfplumber são importados no primeiro uso (ver _get_document,
+# table_to_dataframe e _flag_terms): documentos sem tabelas candidatas não
+# pagam as importações
 
 # Configuração de logging
 logging.basicConfig(
@@ -14,17 +21,167 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+def _count_ruling_edges(page):
+    """
+    Conta as arestas horizontais e verticais desenhadas em uma página.
+    
+    Segue o que o pdfplumber considera arestas: segmentos de reta e os quatro
+    lados de retângulos. Curvas são tratadas de forma conservadora, como se
+    pudessem formar uma grade.
+    
+    Args:
+        page (fitz.Page): Página do PyMuPDF.
+    
+    Returns:
+        tuple: (arestas horizontais, arestas verticais).
+    """
+    horizontal = 0
+    vertical = 0
+    
+    for path in page.get_cdrawings():
+        for item in path['items']:
+            kind = item[0]
+            if kind == 'l':
+                (x0, y0), (x1, y1) = item[1], item[2]
+                if abs(y1 - y0) < 1:
+                    horizontal += 1
+                elif abs(x1 - x0) < 1:
+                    vertical += 1
+            elif kind == 're':
+                horizontal += 2
+                vertical += 2
+            elif kind in ('qu', 'c'):
+                horizontal += 1
+                vertical += 1
+    
+    return horizontal, vertical
+
+
+def _fill_ratio(tables):
+    """
+    Calcula a fração de células não vazias de uma lista de tabelas.
+    
+    Args:
+        tables (list): Tabelas como listas de linhas.
+    
+    Returns:
+        float: Fração entre 0 e 1.
+    """
+    total = 0
+    filled = 0
+    for table in tables:
+        for row in table:
+            total += len(row)
+            filled += sum(1 for cell in row if cell not in (None, ''))
+    return filled / total if total else 0.0
+
+
+def _extract_page_list(pdf_path, page_nums, settings, fallback=False, engine='pdfplumber'):
+    """
+    Extrai tabelas de uma lista de páginas em um processo separado.
+    
+    Args:
+        pdf_path (str): Caminho para o arquivo PDF.
+        page_nums (list): Páginas (0-based) a processar.
+        settings (dict): Configurações para extração de tabelas.
+        fallback (bool): Se True, usa as configurações alternativas quando a padrão falha.
+        engine (str): Motor de extração ("pdfplumber" ou "fitz").
+    
+    Returns:
+        list: Tabelas extraídas no formato {'page', 'data'}.
+    """
+    extractor = TableExtractor(pdf_path, engine=engine)
+    tables = []
+    
+    try:
+        for page_num in page_nums:
+            for table in extractor.extract_tables_from_page(page_num, settings=settings, fallback=fallback):
+                tables.append({
+                    'page': page_num + 1,
+                    'data': table
+                })
+    finally:
+        extractor.close()
+    
+    return tables
+
+
 class TableExtractor:
     """Classe para extrair tabelas de editais."""
     
-    def __init__(self, pdf_path):
+    # Estratégias do pdfplumber que dependem de linhas de grade desenhadas na página
+    LINE_STRATEGIES = ('lines', 'lines_strict')
+    
+    # Configurações alternativas, em ordem de preferência
+    ALTERNATIVE_SETTINGS = [
+        # Estratégia baseada em texto
+        {
+            "vertical_strategy": "text",
+            "horizontal_strategy": "text",
+            "snap_tolerance": 5,
+            "join_tolerance": 5
+        },
+        # Estratégia mista
+        {
+            "vertical_strategy": "lines",
+            "horizontal_strategy": "text",
+            "snap_tolerance": 3,
+            "join_tolerance": 3
+        },
+        # Estratégia com tolerância maior
+        {
+            "vertical_strategy": "lines",
+            "horizontal_strategy": "lines",
+            "snap_tolerance": 10,
+            "join_tolerance": 10,
+            "edge_min_length": 5
+        }
+    ]
+    
+    # Motores de extração de tabelas disponíveis
+    ENGINES = ('pdfplumber', 'fitz')
+    
+    # Termos (normalizados: minúsculos e sem acentos) usados na classificação de tabelas
+    HEADER_TERMS = {
+        'cargo': 'cargo',
+        'vaga': 'vaga',
+        'data': 'data',
+        'evento': 'atividade|evento',
+        'remuneracao': 'remuneracao|salario|vencimento',
+    }
+    CELL_TERMS = {
+        'vaga': 'vaga',
+        'concorrencia': 'ampla|concorrencia',
+        'prazo': 'data|periodo|prazo',
+        'etapa': 'atividade|evento|etapa',
+    }
+    
+    def __init__(self, pdf_path, plumber_doc=None, fitz_doc=None, prefilter=True, engine='pdfplumber'):
         """
         Inicializa o extrator de tabelas.
         
         Args:
             pdf_path (str): Caminho para o arquivo PDF.
+            plumber_doc (pdfplumber.PDF): Documento pdfplumber já aberto (por exemplo,
+                PDFLoader.plumber_doc). Se None, o PDF é aberto uma única vez no primeiro uso.
+            fitz_doc (fitz.Document): Documento PyMuPDF já aberto (por exemplo,
+                PDFLoader.doc), usado pelo pré-filtro de páginas e pelo motor "fitz".
+            prefilter (bool): Se True, apenas páginas com linhas de grade suficientes
+                para formar uma tabela passam pelo extrator.
+            engine (str): Motor de extração: "pdfplumber" ou "fitz" (page.find_tables
+                do PyMuPDF, que dispensa um segundo parser do PDF).
         """
+        if engine not in self.ENGINES:
+            raise ValueError(f"Motor de tabelas desconhecido: {engine}. Use um de {self.ENGINES}.")
+        
         self.pdf_path = pdf_path
+        self.plumber_doc = plumber_doc
+        self._owns_doc = False
+        self.fitz_doc = fitz_doc
+        self._owns_fitz_doc = False
+        self.prefilter = prefilter
+        self.prefilter_report = None
+        self.engine = engine
         self.tables = []
         self.table_settings = {
             "vertical_strategy": "lines",
@@ -36,7 +193,84 @@ class TableExtractor:
             "min_words_horizontal": 1
         }
     
-    def extract_tables_from_page(self, page_num, bbox=None, settings=None):
+    @property
+    def tables(self):
+        """list: Tabelas extraídas no formato {'page', 'data'}."""
+        return self._tables
+    
+    @tables.setter
+    def tables(self, tables):
+        # Uma nova lista de tabelas invalida os DataFrames já convertidos
+        self._tables = tables
+        self._dataframes = None
+    
+    def _get_document(self):
+        """Obtém o documento pdfplumber compartilhado, abrindo-o se necessário."""
+        if self.plumber_doc is None:
+            import pdfplumber
+            self.plumber_doc = pdfplumber.open(self.pdf_path)
+            self._owns_doc = True
+        return self.plumber_doc
+    
+    def _get_fitz_document(self):
+        """Obtém o documento PyMuPDF usado pelo pré-filtro, abrindo-o se necessário."""
+        if self.fitz_doc is None:
+            self.fitz_doc = fitz.open(self.pdf_path)
+            self._owns_fitz_doc = True
+        return self.fitz_doc
+    
+    def close(self):
+        """Fecha os documentos abertos por este extrator."""
+        if self._owns_doc and self.plumber_doc is not None:
+            self.plumber_doc.close()
+        if self._owns_fitz_doc and self.fitz_doc is not None:
+            self.fitz_doc.close()
+        self.plumber_doc = None
+        self._owns_doc = False
+        self.fitz_doc = None
+        self._owns_fitz_doc = False
+    
+    def find_table_candidates(self, page_nums, min_edges=2):
+        """
+        Seleciona as páginas que podem conter tabelas com linhas de grade.
+        
+        Usa os desenhos vetoriais da página (PyMuPDF), muito mais baratos que a
+        detecção de tabelas do pdfplumber. A estratégia "lines" só encontra uma
+        tabela quando há ao menos duas arestas horizontais e duas verticais, então
+        as demais páginas podem ser descartadas sem perda.
+        
+        Args:
+            page_nums (list): Páginas (0-based) a verificar.
+            min_edges (int): Mínimo de arestas horizontais e verticais.
+        
+        Returns:
+            list: Páginas candidatas, em ordem.
+        """
+        doc = self._get_fitz_document()
+        candidates = []
+        
+        for page_num in page_nums:
+            try:
+                horizontal, vertical = _count_ruling_edges(doc[page_num])
+            except Exception as e:
+                logger.warning(f"Erro no pré-filtro de tabelas da página {page_num + 1}: {e}")
+                candidates.append(page_num)
+                continue
+            
+            if horizontal >= min_edges and vertical >= min_edges:
+                candidates.append(page_num)
+        
+        return candidates
+    
+    def _prefilter_applies(self, settings):
+        """Verifica se as configurações dependem apenas de linhas de grade."""
+        current_settings = settings if settings else self.table_settings
+        return all(
+            current_settings.get(key, 'lines') in self.LINE_STRATEGIES
+            for key in ('vertical_strategy', 'horizontal_strategy')
+        )
+    
+    def extract_tables_from_page(self, page_num, bbox=None, settings=None, fallback=False):
         """
         Extrai tabelas de uma página específica.
         
@@ -44,72 +278,200 @@ class TableExtractor:
             page_num (int): Número da página (0-based).
             bbox (tuple): Coordenadas da área de recorte (x0, top, x1, bottom).
             settings (dict): Configurações para extração de tabelas.
-            
+            fallback (bool): Se True e nenhuma tabela for encontrada, tenta as
+                configurações alternativas sobre os mesmos objetos da página.
+        
         Returns:
             list: Lista de tabelas extraídas.
         """
-        tables = []
-        
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                if page_num >= len(pdf.pages):
-                    logger.warning(f"Número de página {page_num} fora do intervalo (0-{len(pdf.pages)-1}).")
-                    return tables
-                
-                page = pdf.pages[page_num]
-                target_page = page
+            with self._open_page(page_num) as page:
+                if page is None:
+                    return []
                 
-                if bbox:
-                    # Recortar a página para a área especificada
-                    target_page = page.crop(bbox)
+                target_page = self._target_page(page, bbox)
+                tables = self._extract_from_page(target_page, page_num, settings)
                 
-                # Usar configurações personalizadas ou padrão
-                current_settings = settings if settings else self.table_settings
-                
-                # Extrair tabelas
-                extracted = target_page.extract_tables(table_settings=current_settings)
-                
-                if extracted:
-                    for table in extracted:
-                        # Filtrar tabelas vazias ou muito pequenas
-                        if table and len(table) > 1 and len(table[0]) > 1:
-                            tables.append(table)
-                            logger.info(f"Tabela extraída da página {page_num + 1}: {len(table)}x{len(table[0])}")
+                if not tables and fallback:
+                    tables = self._search_strategies(target_page, page_num, self.ALTERNATIVE_SETTINGS)
                 
+                return tables
+        
         except Exception as e:
             logger.error(f"Erro ao extrair tabelas da página {page_num + 1}: {e}")
+            return []
+    
+    @contextmanager
+    def _open_page(self, page_num):
+        """
+        Fornece uma página do documento compartilhado e libera seus objetos ao final.
+        
+        Com o pdfplumber, os caracteres, linhas e retângulos da página são
+        interpretados uma única vez e reaproveitados por todas as extrações feitas
+        dentro do bloco. Com o motor "fitz", a página do PyMuPDF é carregada uma vez.
+        """
+        if self.engine == 'fitz':
+            doc = self._get_fitz_document()
+            if page_num >= len(doc):
+                logger.warning(f"Número de página {page_num} fora do intervalo (0-{len(doc)-1}).")
+                yield None
+            else:
+                yield doc[page_num]
+            return
+        
+        pdf = self._get_document()
+        if page_num >= len(pdf.pages):
+            logger.warning(f"Número de página {page_num} fora do intervalo (0-{len(pdf.pages)-1}).")
+            yield None
+            return
+        
+        page = pdf.pages[page_num]
+        try:
+            yield page
+        finally:
+            # Liberar os objetos da página já processada
+            page.flush_cache()
+    
+    def _target_page(self, page, bbox):
+        """
+        Aplica o recorte à página.
+        
+        Returns:
+            Página recortada (pdfplumber) ou tupla (página, recorte) para o motor "fitz".
+        """
+        if self.engine == 'fitz':
+            return page, bbox
+        return page.crop(bbox) if bbox else page
+    
+    def _extract_from_page(self, page, page_num, settings=None):
+        """
+        Extrai tabelas de uma página já aberta (e, se for o caso, recortada).
+        
+        Args:
+            page: Página pdfplumber ou tupla (página PyMuPDF, recorte) para o motor "fitz".
+            page_num (int): Número da página (0-based).
+            settings (dict): Configurações para extração de tabelas.
+        
+        Returns:
+            list: Lista de tabelas extraídas.
+        """
+        tables = []
+        
+        # Usar configurações personalizadas ou padrão
+        current_settings = settings if settings else self.table_settings
+        
+        # Extrair tabelas
+        if self.engine == 'fitz':
+            fitz_page, clip = page
+            # page.find_tables aceita as mesmas chaves de configuração do pdfplumber
+            finder = fitz_page.find_tables(clip=clip, **current_settings)
+            extracted = [table.extract() for table in finder.tables]
+        else:
+            extracted = page.extract_tables(table_settings=current_settings)
+        
+        if extracted:
+            for table in extracted:
+                # Filtrar tabelas vazias ou muito pequenas
+                if table and len(table) > 1 and len(table[0]) > 1:
+                    tables.append(table)
+                    logger.info(f"Tabela extraída da página {page_num + 1}: {len(table)}x{len(table[0])}")
         
         return tables
     
-    def extract_all_tables(self, page_range=None, settings=None):
+    def _search_strategies(self, page, page_num, candidate_settings, stop_fill_ratio=0.9):
+        """
+        Executa várias configurações sobre a mesma página e escolhe o melhor resultado.
+        
+        Args:
+            page (pdfplumber.page.Page): Página do documento (já recortada, se for o caso).
+            page_num (int): Número da página (0-based).
+            candidate_settings (list): Configurações a testar, em ordem de preferência.
+            stop_fill_ratio (float): Interrompe a busca quando uma configuração encontra
+                tabelas com pelo menos essa fração de células preenchidas. None desativa.
+        
+        Returns:
+            list: Melhor lista de tabelas encontrada.
+        """
+        best_tables = []
+        best_score = None
+        
+        for settings in candidate_settings:
+            tables = self._extract_from_page(page, page_num, settings)
+            if not tables:
+                continue
+            
+            # Mais tabelas e, em caso de empate, mais linhas
+            score = (len(tables), sum(len(t) for t in tables))
+            if best_score is None or score > best_score:
+                best_tables = tables
+                best_score = score
+            
+            if stop_fill_ratio is not None and _fill_ratio(tables) >= stop_fill_ratio:
+                break
+        
+        return best_tables
+    
+    def extract_all_tables(self, page_range=None, settings=None, skip_pages=None, workers=1,
+                           fallback=False):
         """
         Extrai todas as tabelas do documento.
         
+        O documento é aberto uma única vez e compartilhado por todas as páginas.
+        No modo paralelo, cada processo abre sua própria cópia para o seu
+        intervalo de páginas.
+        
         Args:
             page_range (tuple): Intervalo de páginas (início, fim) ou None para todas.
             settings (dict): Configurações para extração de tabelas.
-            
+            skip_pages (list): Páginas (0-based) a ignorar, como as digitalizadas.
+            workers (int): Número de processos para a extração.
+            fallback (bool): Se True, páginas sem tabelas na configuração padrão são
+                reexaminadas com as configurações alternativas (mais útil com o
+                pré-filtro ativo, que limita o fallback às páginas com linhas de grade).
+        
         Returns:
             list: Lista de tabelas extraídas.
         """
         all_tables = []
         
         try:
-            with pdfplumber.open(self.pdf_path) as pdf:
-                total_pages = len(pdf.pages)
-                
-                # Determinar o intervalo de páginas
-                start_page = 0
-                end_page = total_pages
-                
-                if page_range:
-                    start_page = max(0, page_range[0])
-                    end_page = min(total_pages, page_range[1] + 1)
-                
-                logger.info(f"Extraindo tabelas das páginas {start_page + 1} a {end_page}...")
+            # O número de páginas vem do documento PyMuPDF (já aberto pelo carregador):
+            # o pdfplumber só abre o PDF se alguma página passar pelo pré-filtro
+            total_pages = len(self._get_fitz_document())
                 
-                for page_num in range(start_page, end_page):
-                    tables = self.extract_tables_from_page(page_num, settings=settings)
+            # Determinar o intervalo de páginas
+            start_page = 0
+            end_page = total_pages
+            
+            if page_range:
+                start_page = max(0, page_range[0])
+                end_page = min(total_pages, page_range[1] + 1)
+            
+            logger.info(f"Extraindo tabelas das páginas {start_page + 1} a {end_page}...")
+            
+            skip_pages = set(skip_pages or [])
+            page_nums = [page_num for page_num in range(start_page, end_page)
+                         if page_num not in skip_pages]
+            
+            if self.prefilter and self._prefilter_applies(settings):
+                candidates = self.find_table_candidates(page_nums)
+                self.prefilter_report = {
+                    'pages': len(page_nums),
+                    'candidates': len(candidates),
+                    'skipped': len(page_nums) - len(candidates),
+                    'candidate_pages': [page_num + 1 for page_num in candidates],
+                }
+                logger.info(f"Pré-filtro de tabelas: {len(candidates)} de {len(page_nums)} páginas "
+                            f"candidatas, {len(page_nums) - len(candidates)} ignoradas.")
+                page_nums = candidates
+            else:
+                self.prefilter_report = None
+            
+            if workers and workers > 1 and len(page_nums) > 1:
+                all_tables = self._extract_parallel(page_nums, settings, workers, fallback)
+            else:
+                for page_num in page_nums:
+                    tables = self.extract_tables_from_page(page_num, settings=settings, fallback=fallback)
                     
                     for table in tables:
                         all_tables.append({
@@ -123,102 +485,158 @@ class TableExtractor:
         self.tables = all_tables
         return all_tables
     
-    def try_alternative_settings(self, page_num, bbox=None):
+    def iter_tables(self, page_nums, settings=None, fallback=False):
+        """
+        Extrai as tabelas página a página, sem acumulá-las em self.tables.
+        
+        Com o pré-filtro ativo, cada página é verificada antes de passar pelo
+        extrator, como em extract_all_tables.
+        
+        Args:
+            page_nums (iterable): Páginas (0-based) a processar, em ordem.
+            settings (dict): Configurações para extração de tabelas.
+            fallback (bool): Se True, usa as configurações alternativas quando a padrão falha.
+        
+        Yields:
+            dict: Tabela extraída no formato {'page', 'data'}.
+        """
+        use_prefilter = self.prefilter and self._prefilter_applies(settings)
+        
+        for page_num in page_nums:
+            if use_prefilter and not self.find_table_candidates([page_num]):
+                continue
+            
+            for table in self.extract_tables_from_page(page_num, settings=settings, fallback=fallback):
+                yield {
+                    'page': page_num + 1,
+                    'data': table
+                }
+    
+    def _extract_parallel(self, page_nums, settings, workers, fallback=False, chunks_per_worker=4):
+        """
+        Extrai tabelas de várias páginas em processos paralelos.
+        
+        Args:
+            page_nums (list): Páginas (0-based) a processar, em ordem.
+            settings (dict): Configurações para extração de tabelas.
+            workers (int): Número de processos.
+            fallback (bool): Se True, usa as configurações alternativas quando a padrão falha.
+            chunks_per_worker (int): Intervalos por processo.
+        
+        Returns:
+            list: Tabelas extraídas, em ordem de página.
+        """
+        chunks = [page_nums[start:end]
+                  for start, end in split_page_ranges(len(page_nums), workers * chunks_per_worker)]
+        
+        all_tables = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_extract_page_list, self.pdf_path, chunk,
+                                       settings or self.table_settings, fallback, self.engine)
+                       for chunk in chunks]
+            for future in futures:
+                all_tables.extend(future.result())
+        
+        return all_tables
+    
+    def try_alternative_settings(self, page_num, bbox=None, stop_fill_ratio=0.9):
         """
         Tenta extrair tabelas com configurações alternativas.
         
+        A página é interpretada uma única vez; todas as configurações são
+        executadas sobre os mesmos objetos.
+        
         Args:
             page_num (int): Número da página (0-based).
             bbox (tuple): Coordenadas da área de recorte (x0, top, x1, bottom).
-            
+            stop_fill_ratio (float): Interrompe a busca quando uma configuração encontra
+                tabelas bem preenchidas (fração de células não vazias). None testa todas.
+        
         Returns:
             list: Lista de tabelas extraídas.
         """
-        # Lista de configurações alternativas para tentar
-        alternative_settings = [
-            # Estratégia baseada em texto
-            {
-                "vertical_strategy": "text",
-                "horizontal_strategy": "text",
-                "snap_tolerance": 5,
-                "join_tolerance": 5
-            },
-            # Estratégia mista
-            {
-                "vertical_strategy": "lines",
-                "horizontal_strategy": "text",
-                "snap_tolerance": 3,
-                "join_tolerance": 3
-            },
-            # Estratégia com tolerância maior
-            {
-                "vertical_strategy": "lines",
-                "horizontal_strategy": "lines",
-                "snap_tolerance": 10,
-                "join_tolerance": 10,
-                "edge_min_length": 5
-            }
-        ]
-        
-        best_tables = []
-        
-        for settings in alternative_settings:
-            tables = self.extract_tables_from_page(page_num, bbox, settings)
-            
-            # Se encontrou tabelas, verificar se são melhores que as anteriores
-            if tables and (not best_tables or len(tables) > len(best_tables) or 
-                          (len(tables) == len(best_tables) and 
-                           sum(len(t) for t in tables) > sum(len(t) for t in best_tables))):
-                best_tables = tables
+        try:
+            with self._open_page(page_num) as page:
+                if page is None:
+                    return []
+                
+                target_page = self._target_page(page, bbox)
+                return self._search_strategies(target_page, page_num, self.ALTERNATIVE_SETTINGS,
+                                               stop_fill_ratio)
         
-        return best_tables
+        except Exception as e:
+            logger.error(f"Erro ao extrair tabelas da página {page_num + 1}: {e}")
+            return []
     
     def tables_to_dataframes(self):
         """
         Converte as tabelas extraídas em DataFrames do pandas.
         
+        A conversão é feita uma vez por extração e reaproveitada até que
+        self.tables seja substituída.
+        
         Returns:
             list: Lista de DataFrames.
         """
+        if self._dataframes is not None:
+            return self._dataframes
+        
         dataframes = []
         
         for table_info in self.tables:
-            table = table_info['data']
-            page = table_info['page']
-            
-            if table and len(table) > 0:
-                # Usar a primeira linha como cabeçalho
-                header = table[0]
-                
-                # Verificar se o cabeçalho tem células vazias
-                has_empty_headers = any(not h for h in header)
-                
-                if has_empty_headers:
-                    # Gerar cabeçalhos genéricos
-                    header = [f"Col{i}" if not h else h for i, h in enumerate(header)]
-                
-                # Criar DataFrame
-                df = pd.DataFrame(table[1:], columns=header)
-                
-                # Adicionar informação da página
-                df_with_info = {
-                    'page': page,
-                    'dataframe': df,
-                    'rows': len(df),
-                    'columns': len(df.columns)
-                }
-                
-                dataframes.append(df_with_info)
+            df_info = self.table_to_dataframe(table_info)
+            if df_info is not None:
+                dataframes.append(df_info)
         
+        self._dataframes = dataframes
         return dataframes
     
+    def table_to_dataframe(self, table_info):
+        """
+        Converte uma tabela extraída em DataFrame do pandas.
+        
+        Args:
+            table_info (dict): Tabela no formato {'page', 'data'}.
+        
+        Returns:
+            dict: DataFrame com a página e as dimensões, ou None se a tabela está vazia.
+        """
+        import pandas as pd
+        
+        table = table_info['data']
+        page = table_info['page']
+        
+        if not table:
+            return None
+        
+        # Usar a primeira linha como cabeçalho
+        header = table[0]
+        
+        # Verificar se o cabeçalho tem células vazias
+        has_empty_headers = any(not h for h in header)
+        
+        if has_empty_headers:
+            # Gerar cabeçalhos genéricos
+            header = [f"Col{i}" if not h else h for i, h in enumerate(header)]
+        
+        # Criar DataFrame
+        df = pd.DataFrame(table[1:], columns=header)
+        
+        # Adicionar informação da página
+        return {
+            'page': page,
+            'dataframe': df,
+            'rows': len(df),
+            'columns': len(df.columns)
+        }
+    
     def save_tables_to_csv(self, output_dir):
         """
         Salva as tabelas extraídas como arquivos CSV.
         
         Args:
             output_dir (str): Diretório de saída.
-            
+        
         Returns:
             list: Lista de caminhos para os arquivos CSV salvos.
         """
@@ -229,56 +647,114 @@ class TableExtractor:
         dataframes = self.tables_to_dataframes()
         
         for i, df_info in enumerate(dataframes):
-            df = df_info['dataframe']
-            page = df_info['page']
-            
-            # Criar nome de arquivo
-            filename = f"tabela_pagina_{page}_num_{i+1}.csv"
-            filepath = os.path.join(output_dir, filename)
-            
-            # Salvar como CSV
-            df.to_csv(filepath, index=False, encoding='utf-8-sig')
-            csv_files.append(filepath)
-            
-            logger.info(f"Tabela salva em: {filepath}")
+            csv_files.append(self.save_dataframe_to_csv(df_info, i + 1, output_dir))
         
         return csv_files
     
+    def save_dataframe_to_csv(self, df_info, number, output_dir):
+        """
+        Salva uma tabela convertida como arquivo CSV.
+        
+        Args:
+            df_info (dict): Tabela convertida (ver table_to_dataframe).
+            number (int): Número da tabela no documento (1-based).
+            output_dir (str): Diretório de saída, que já deve existir.
+        
+        Returns:
+            str: Caminho do arquivo CSV salvo.
+        """
+        # Criar nome de arquivo
+        filename = f"tabela_pagina_{df_info['page']}_num_{number}.csv"
+        filepath = os.path.join(output_dir, filename)
+        
+        # Salvar como CSV
+        df_info['dataframe'].to_csv(filepath, index=False, encoding='utf-8-sig')
+        
+        logger.info(f"Tabela salva em: {filepath}")
+        
+        return filepath
+    
     def identify_table_type(self, dataframe):
         """
         Tenta identificar o tipo de tabela com base no conteúdo.
         
         Args:
             dataframe (pandas.DataFrame): DataFrame a ser analisado.
-            
+        
         Returns:
             str: Tipo de tabela identificado ou "desconhecido".
         """
-        # Converter todas as colunas para string para facilitar a busca
-        df_str = dataframe.astype(str)
-        
-        # Verificar se é uma tabela de cargos/vagas
-        if any('cargo' in col.lower() for col in df_str.columns):
-            if any('vaga' in col.lower() for col in df_str.columns):
-                return "cargos_vagas"
-            return "cargos"
+        return self.classify_tables([dataframe])[0]
+    
+    def classify_tables(self, dataframes):
+        """
+        Identifica o tipo de várias tabelas de uma só vez.
         
-        # Verificar se é uma tabela de cronograma
-        if any('data' in col.lower() for col in df_str.columns) and any('atividade' in col.lower() or 'evento' in col.lower() for col in df_str.columns):
-            return "cronograma"
+        Cabeçalhos e células de todas as tabelas são pesquisados em conjunto
+        (ver _flag_terms) e as regras são aplicadas sobre os resultados por tabela.
         
-        # Verificar se é uma tabela de remuneração
-        if any('remuneração' in col.lower() or 'salário' in col.lower() or 'vencimento' in col.lower() for col in df_str.columns):
-            return "remuneracao"
+        Args:
+            dataframes (list): DataFrames a classificar.
         
-        # Verificar conteúdo das células
-        all_text = ' '.join([' '.join(df_str[col].tolist()) for col in df_str.columns])
+        Returns:
+            list: Tipo de cada tabela, na mesma ordem ("desconhecido" quando
+                nenhuma regra se aplica).
+        """
+        count = len(dataframes)
+        if count == 0:
+            return []
         
-        if 'vaga' in all_text.lower() and ('ampla' in all_text.lower() or 'concorrência' in all_text.lower()):
-            return "vagas"
+        header_has = _flag_terms([df.columns for df in dataframes], self.HEADER_TERMS)
+        cell_has = _flag_terms([df.to_numpy(dtype=object).ravel() for df in dataframes], self.CELL_TERMS)
         
-        if any(date_term in all_text.lower() for date_term in ['data', 'período', 'prazo']):
-            if any(event_term in all_text.lower() for event_term in ['atividade', 'evento', 'etapa']):
-                return "cronograma"
+        # Regras em ordem de prioridade: a primeira que se aplica define o tipo
+        conditions = [
+            header_has['cargo'] & header_has['vaga'],
+            header_has['cargo'],
+            header_has['data'] & header_has['evento'],
+            header_has['remuneracao'],
+            cell_has['vaga'] & cell_has['concorrencia'],
+            cell_has['prazo'] & cell_has['etapa'],
+        ]
+        choices = ['cargos_vagas', 'cargos', 'cronograma', 'remuneracao', 'vagas', 'cronograma']
         
-        return "desconhecido"
+        return np.select(conditions, choices, default='desconhecido').tolist()
+
+
+def _flag_terms(values_per_table, terms):
+    """
+    Indica, para cada tabela, se algum de seus textos contém cada grupo de termos.
+    
+    Os textos de todas as tabelas são reunidos em um único array; apenas os
+    valores distintos são normalizados (minúsculos e sem acentos) e pesquisados
+    com operações vetorizadas do pandas.
+    
+    Args:
+        values_per_table (list): Sequência de valores (cabeçalhos ou células) de cada tabela.
+        terms (dict): Nome do grupo -> expressão regular com os termos alternativos.
+    
+    Returns:
+        dict: Nome do grupo -> array booleano com uma posição por tabela.
+    """
+    import pandas as pd
+    
+    count = len(values_per_table)
+    lengths = [len(values) for values in values_per_table]
+    table_index = np.repeat(np.arange(count), lengths)
+    values = np.concatenate([np.asarray(values, dtype=object) for values in values_per_table])
+    
+    # Células vazias (None/NaN) não contêm nenhum termo
+    values[pd.isna(values)] = ''
+    codes, uniques = pd.factorize(values)
+    normalized = (pd.Series(uniques, dtype=object).astype(str)
+                    .str.normalize('NFKD')
+                    .str.encode('ascii', errors='ignore')
+                    .str.decode('ascii')
+                    .str.lower())
+    
+    flags = {}
+    for name, pattern in terms.items():
+        unique_matches = normalized.str.contains(pattern, regex=True).to_numpy(dtype=bool)
+        matched_tables = table_index[unique_matches[codes]]
+        flags[name] = np.bincount(matched_tables, minlength=count) > 0
+    return flags
@@ -2,11 +2,21 @@
 Processador principal de PDFs de editais.
 """
 
+import itertools
 import logging
 import os
 import json
+import tempfile
+import time
+from collections import deque
+from collections.abc import Mapping
+from contextlib import contextmanager
 from ..utils.pdf_loader import PDFLoader
-from ..utils.ocr_processor import OCRProcessor
+from ..utils.document_model import Document, compute_font_statistics
+from ..utils.ocr_pool import OCRPool, limit_threads
+from ..utils.ocr_cache import OCRCache
+from ..utils.stage_cache import StageCache, file_sha256, stage_version
+from ..utils.gazetteer import gazetteer_version
 from ..extractors.section_extractor import SectionExtractor
 from ..extractors.data_extractor import DataExtractor
 from ..extractors.table_extractor import TableExtractor
@@ -21,7 +31,19 @@ logger = logging.getLogger(__name__)
 class PDFProcessor:
     """Classe principal para processamento de PDFs de editais."""
     
-    def __init__(self, pdf_path, output_dir=None, use_ocr=True):
+    # Páginas usadas para estimar o estilo do corpo do texto no modo streaming
+    FONT_STATS_SAMPLE_PAGES = 30
+    
+    # Páginas digitalizadas reconhecidas de uma vez, por processo OCR, no modo streaming
+    STREAM_OCR_PAGES_PER_WORKER = 4
+    
+    # Máximo de páginas cujo texto aguarda o OCR de uma página anterior no modo streaming
+    STREAM_PENDING_PAGES = 200
+    
+    def __init__(self, pdf_path, output_dir=None, use_ocr=True, workers=1,
+                 ocr_workers=1, ocr_threads=None, ocr_cache_dir=None, ocr_cache_size_mb=1024,
+                 cache_dir=None, table_prefilter=True, table_fallback=False,
+                 table_engine='pdfplumber', streaming=False, ocr_processor=None):
         """
         Inicializa o processador de PDF.
         
@@ -29,10 +51,40 @@ class PDFProcessor:
             pdf_path (str): Caminho para o arquivo PDF.
             output_dir (str): Diretório de saída para arquivos gerados.
             use_ocr (bool): Se True, usa OCR para páginas digitalizadas.
+            workers (int): Número de processos para a extração de texto e tabelas das páginas.
+            ocr_workers (int): Número de processos OCR. Com mais de um, as páginas
+                digitalizadas são reconhecidas em um pool de processos.
+            ocr_threads (int): Limite de threads (torch/OpenMP) por processo OCR.
+            ocr_cache_dir (str): Diretório do cache de resultados de OCR (opcional).
+            ocr_cache_size_mb (int): Tamanho máximo do cache de OCR em MB.
+            cache_dir (str): Diretório do cache de etapas (opcional). Cada etapa é
+                reaproveitada enquanto o PDF e o código da etapa não mudarem.
+            table_prefilter (bool): Se True, apenas páginas com linhas de grade passam
+                pela extração de tabelas.
+            table_fallback (bool): Se True, páginas candidatas sem tabelas na configuração
+                padrão são reexaminadas com configurações alternativas.
+            table_engine (str): Motor de extração de tabelas: "pdfplumber" ou "fitz".
+            streaming (bool): Se True, processa o PDF em uma única passagem, página a
+                página, com memória limitada (ver _process_streaming). O cache de
+                etapas e os processos paralelos de páginas não são usados neste modo.
+            ocr_processor (OCRProcessor): Processador OCR já inicializado (opcional),
+                reaproveitado entre documentos; com ele, ocr_threads, ocr_cache_dir e
+                ocr_cache_size_mb não são usados. Sem ele, o processador (e o modelo
+                OCR) só é criado na primeira página digitalizada (ver _get_ocr_processor).
         """
         self.pdf_path = pdf_path
         self.output_dir = output_dir or os.path.dirname(pdf_path)
         self.use_ocr = use_ocr
+        self.workers = max(1, workers or 1)
+        self.ocr_workers = max(1, ocr_workers or 1)
+        self.ocr_threads = ocr_threads
+        self.ocr_cache_dir = ocr_cache_dir
+        self.ocr_cache_size_mb = ocr_cache_size_mb
+        self.table_fallback = table_fallback
+        self.streaming = streaming
+        self.stage_cache = StageCache(cache_dir) if cache_dir else None
+        self.pdf_hash = None
+        self.stage_versions = {}
         
         # Criar diretório de saída se não existir
         if not os.path.exists(self.output_dir):
@@ -40,17 +92,25 @@ class PDFProcessor:
         
         # Inicializar componentes
         self.pdf_loader = PDFLoader(pdf_path)
-        self.ocr_processor = OCRProcessor() if use_ocr else None
+        self.ocr_processor = ocr_processor
+        self.ocr_pool = None
         self.section_extractor = SectionExtractor()
         self.data_extractor = DataExtractor()
-        self.table_extractor = TableExtractor(pdf_path)
+        # O pdfplumber só abre o documento na primeira página candidata a ter
+        # tabelas; com o motor "fitz", nunca
+        self.table_extractor = TableExtractor(pdf_path, fitz_doc=self.pdf_loader.doc,
+                                              prefilter=table_prefilter, engine=table_engine)
         
         # Armazenar dados extraídos
         self.document_info = None
+        self.document = Document()
         self.extracted_text = {}
         self.extracted_sections = {}
         self.extracted_data = {}
         self.extracted_tables = []
+        self.schedule_tables = []
+        # Tempo de cada etapa em segundos (ver _timed), na ordem de execução
+        self.stage_timings = {}
     
     def process(self):
         """
@@ -60,25 +120,34 @@ class PDFProcessor:
             dict: Dados extraídos do edital.
         """
         try:
-            # Analisar o documento
-            self.document_info = self.pdf_loader.analyze_document()
-            logger.info(f"Análise do documento concluída: {self.document_info}")
+            if self.streaming:
+                return self._process_streaming()
+            
+            if self.stage_cache:
+                self.pdf_hash = file_sha256(self.pdf_path)
+                self.stage_versions = self._compute_stage_versions()
             
-            # Extrair texto de todas as páginas
-            self._extract_text_from_all_pages()
+            # Analisar o documento e extrair texto de todas as páginas
+            self._run_stage('text', self._analyze_and_extract_text,
+                            ['document_info', 'document', 'extracted_text'])
+            self.pdf_loader.scanned_pages = self.document_info['scanned_pages']
             
             # Extrair seções
-            self._extract_sections()
+            self._run_stage('sections', self._extract_sections, ['extracted_sections'])
             
             # Extrair tabelas
-            self._extract_tables()
+            self._run_stage('tables', self._extract_tables, ['extracted_tables'])
+            with self._timed('table_classification'):
+                self._classify_and_save_tables()
             
             # Extrair dados estruturados
-            self._extract_structured_data()
+            self._run_stage('data', self._extract_structured_data, ['extracted_data'])
             
             # Salvar resultados
-            self._save_results()
+            with self._timed('output'):
+                self._save_results()
             
+            self._log_stage_timings()
             return self.extracted_data
         
         except Exception as e:
@@ -86,58 +155,406 @@ class PDFProcessor:
             raise
         finally:
             # Fechar o PDF
+            self.table_extractor.close()
             self.pdf_loader.close()
+            
+            # Encerrar o pool OCR
+            if self.ocr_pool:
+                self.ocr_pool.close()
+                self.ocr_pool = None
+    
+    def _process_streaming(self):
+        """
+        Processa o PDF em uma única passagem, página a página.
+        
+        Cada página é lida, escrita em texto_extraido.txt, repassada ao extrator de
+        seções (que grava o texto dos blocos em arquivos temporários) e examinada
+        em busca de tabelas, salvas imediatamente como CSV. As páginas
+        digitalizadas são reconhecidas em lotes de STREAM_OCR_PAGES_PER_WORKER
+        páginas por processo OCR; enquanto um lote se forma, apenas o texto das
+        páginas seguintes (no máximo STREAM_PENDING_PAGES) aguarda para ser escrito
+        em ordem. Nenhuma outra estrutura da página é mantida depois de consumida;
+        a memória só cresce com as tabelas de objetos dos leitores de PDF (cerca
+        de 40 KiB por página, ver benchmarks.bench_memory). O estilo do corpo do
+        texto é estimado a partir das primeiras FONT_STATS_SAMPLE_PAGES páginas.
+        Ao final, extracted_text, document e extracted_sections ficam vazios; os
+        resultados estão nos arquivos de saída.
+        
+        Returns:
+            dict: Dados extraídos do edital.
+        """
+        if self.stage_cache:
+            logger.warning("O cache de etapas não é usado no modo streaming.")
+        
+        logger.info("Processando o documento em modo streaming...")
+        
+        records = self.pdf_loader.walk_pages()
+        
+        # Estilo do corpo do texto estimado sobre as primeiras páginas
+        head = deque(itertools.islice(records, self.FONT_STATS_SAMPLE_PAGES))
+        font_stats = compute_font_statistics(
+            record.page for record in head
+            if record.page is not None and not (record.is_scanned and self.use_ocr)
+        )
+        if font_stats:
+            logger.info(f"Corpo do texto: {font_stats.body_font} {font_stats.body_size}pt"
+                        f"{' (negrito)' if font_stats.body_bold else ''}")
+        
+        with tempfile.TemporaryDirectory(dir=self.output_dir) as spool_dir:
+            self.section_extractor = SectionExtractor(font_stats=font_stats, spool_dir=spool_dir)
+            try:
+                with self._timed('pages'):
+                    scanned_pages, page_count = self._stream_pages(_drain(head, records))
+                
+                self.document_info = {
+                    "total_pages": self.pdf_loader.page_count,
+                    "scanned_pages": scanned_pages,
+                    "scanned_percentage": (len(scanned_pages) / self.pdf_loader.page_count * 100
+                                           if self.pdf_loader.page_count > 0 else 0)
+                }
+                self.pdf_loader.scanned_pages = scanned_pages
+                logger.info(f"Texto extraído de {page_count} páginas.")
+                logger.info(f"Seções extraídas: {self.section_extractor.section_types()}")
+                
+                # Cada seção é lida do seu arquivo apenas quando necessária
+                self.extracted_sections = _SpooledSections(self.section_extractor)
+                with self._timed('data'):
+                    self._extract_structured_data()
+                
+                with self._timed('output'):
+                    self._save_results(write_text=False)
+            finally:
+                self.section_extractor.close()
+        
+        self.extracted_sections = {}
+        self._log_stage_timings()
+        return self.extracted_data
+    
+    def _stream_pages(self, records):
+        """
+        Consome os registros de página, gravando texto, seções e tabelas.
+        
+        Args:
+            records (iterable): Registros das páginas (PageRecord), em ordem.
+        
+        Returns:
+            tuple: (páginas digitalizadas, número de páginas com texto).
+        """
+        scanned_pages = []
+        page_count = 0
+        table_count = 0
+        csv_dir = os.path.join(self.output_dir, 'tabelas')
+        
+        # Lote de páginas digitalizadas a reconhecer e páginas à espera de serem
+        # escritas, em ordem, como (página, texto); o texto das páginas do lote é
+        # None até o OCR
+        ocr_batch = self.ocr_workers * self.STREAM_OCR_PAGES_PER_WORKER
+        ocr_records = []
+        pending = []
+        
+        text_output = os.path.join(self.output_dir, 'texto_extraido.txt')
+        with open(text_output, 'w', encoding='utf-8') as text_file:
+            for record in records:
+                page_num = record.page_num
+                
+                if record.is_scanned:
+                    scanned_pages.append(page_num)
+                    logger.info(f"Página {page_num + 1} parece ser digitalizada.")
+                
+                if record.is_scanned and self.use_ocr:
+                    ocr_records.append(record)
+                    pending.append((page_num, None))
+                elif record.page is not None:
+                    pending.append((page_num, record.page.text))
+                    if record.page.blocks:
+                        self.section_extractor.extract_sections_from_blocks(record.page.blocks, page_num)
+                
+                # Páginas digitalizadas não têm tabelas vetoriais
+                if not record.is_scanned:
+                    for table_info in self.table_extractor.iter_tables([page_num],
+                                                                       fallback=self.table_fallback):
+                        table_count = self._save_streamed_table(table_info, table_count, csv_dir)
+                
+                if (not ocr_records or len(ocr_records) >= ocr_batch
+                        or len(pending) >= self.STREAM_PENDING_PAGES):
+                    page_count += self._write_streamed_pages(text_file, pending, ocr_records)
+            
+            page_count += self._write_streamed_pages(text_file, pending, ocr_records)
+        
+        return scanned_pages, page_count
+    
+    def _write_streamed_pages(self, text_file, pending, ocr_records):
+        """
+        Reconhece o lote de páginas digitalizadas e escreve as páginas pendentes.
+        
+        As duas listas são esvaziadas.
+        
+        Args:
+            text_file (file): Arquivo texto_extraido.txt.
+            pending (list): Páginas à espera, em ordem, como (página, texto ou None
+                para as páginas do lote de OCR).
+            ocr_records (list): Registros das páginas digitalizadas do lote.
+            
+        Returns:
+            int: Páginas escritas.
+        """
+        ocr_texts = self._ocr_pages(ocr_records)
+        written = 0
+        for page_num, text in pending:
+            if text is None:
+                text = ocr_texts.get(page_num)
+            if text is not None:
+                text_file.write(f"=== PÁGINA {page_num + 1} ===\n")
+                text_file.write(text)
+                text_file.write("\n\n")
+                written += 1
+        
+        pending.clear()
+        ocr_records.clear()
+        return written
+    
+    def _save_streamed_table(self, table_info, table_count, csv_dir):
+        """
+        Classifica uma tabela lida no modo streaming e a salva como CSV.
+        
+        Apenas as tabelas de cronograma, pequenas, são mantidas em memória
+        (schedule_tables), para a extração dos eventos ao final.
+        
+        Args:
+            table_info (dict): Tabela no formato {'page', 'data'}.
+            table_count (int): Tabelas já salvas.
+            csv_dir (str): Diretório dos arquivos CSV.
+            
+        Returns:
+            int: Tabelas salvas, incluindo esta.
+        """
+        df_info = self.table_extractor.table_to_dataframe(table_info)
+        if df_info is None:
+            return table_count
+        
+        table_type = self.table_extractor.classify_tables([df_info['dataframe']])[0]
+        logger.info(f"Tabela na página {df_info['page']} identificada como: {table_type}")
+        if table_type == 'cronograma':
+            self.schedule_tables.append(df_info['dataframe'])
+        
+        if table_count == 0:
+            os.makedirs(csv_dir, exist_ok=True)
+        self.table_extractor.save_dataframe_to_csv(df_info, table_count + 1, csv_dir)
+        
+        return table_count + 1
+    
+    def _compute_stage_versions(self):
+        """
+        Calcula a versão de cada etapa a partir do código que a implementa.
+        
+        Cada etapa também depende da versão das etapas cujos resultados consome,
+        de modo que uma alteração em data_extractor.py invalida apenas a etapa de
+        dados estruturados, enquanto uma alteração em pdf_loader.py invalida todas.
+        
+        Returns:
+            dict: Mapeamento de etapa para versão.
+        """
+        package = __name__.rsplit('.', 2)[0]
+        
+        # Módulos pelo nome: os que ainda não foram importados (como o de OCR)
+        # são localizados sem importação
+        def module(name):
+            return f"{package}.{name}"
+        
+        text = stage_version(
+            [module('utils.pdf_loader'), module('utils.document_model'), module('utils.ocr_processor'),
+             __name__],
+            params={'use_ocr': self.use_ocr}
+        )
+        sections = stage_version(
+            [module('extractors.section_extractor'), module('utils.regex_patterns')],
+            upstream=[text]
+        )
+        # As páginas digitalizadas, ignoradas na extração de tabelas, vêm da etapa de texto
+        tables = stage_version(
+            [module('extractors.table_extractor')],
+            upstream=[text],
+            params={
+                'prefilter': self.table_extractor.prefilter,
+                'fallback': self.table_fallback,
+                'engine': self.table_extractor.engine,
+            }
+        )
+        data = stage_version(
+            [module('extractors.data_extractor'), module('utils.regex_patterns'), module('utils.gazetteer')],
+            upstream=[sections, tables],
+            params={'gazetteers': gazetteer_version()}
+        )
+        
+        return {'text': text, 'sections': sections, 'tables': tables, 'data': data}
+    
+    def _run_stage(self, stage, run, attributes):
+        """
+        Executa uma etapa ou carrega seu resultado do cache de etapas.
+        
+        Args:
+            stage (str): Nome da etapa.
+            run (callable): Função que executa a etapa.
+            attributes (list): Atributos do processador que formam o resultado da etapa.
+        """
+        with self._timed(stage):
+            if self.stage_cache:
+                version = self.stage_versions[stage]
+                found, result = self.stage_cache.load(self.pdf_hash, stage, version)
+                if found:
+                    for attribute, value in result.items():
+                        setattr(self, attribute, value)
+                    logger.info(f"Etapa '{stage}' carregada do cache (versão {version}).")
+                    return
+            
+            run()
+            
+            if self.stage_cache:
+                result = {attribute: getattr(self, attribute) for attribute in attributes}
+                self.stage_cache.save(self.pdf_hash, stage, self.stage_versions[stage], result)
+    
+    @contextmanager
+    def _timed(self, stage):
+        """
+        Mede o tempo de um trecho do processamento e o soma ao da etapa em stage_timings.
+        
+        Etapas carregadas do cache de etapas registram o tempo da leitura do cache.
+        
+        Args:
+            stage (str): Nome da etapa.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.stage_timings[stage] = self.stage_timings.get(stage, 0.0) + time.perf_counter() - start
+    
+    def _log_stage_timings(self):
+        """Registra no log o tempo de cada etapa."""
+        timings = ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in self.stage_timings.items())
+        logger.info(f"Tempo por etapa: {timings}")
+    
+    def _analyze_and_extract_text(self):
+        """Analisa o documento e extrai texto de todas as páginas."""
+        self.document_info = self.pdf_loader.analyze_document(workers=self.workers)
+        logger.info(f"Análise do documento concluída: {self.document_info}")
+        
+        self._extract_text_from_all_pages()
     
     def _extract_text_from_all_pages(self):
         """Extrai texto de todas as páginas do PDF."""
         logger.info("Extraindo texto de todas as páginas...")
         
-        for page_num in range(self.pdf_loader.page_count):
-            is_scanned = page_num in self.pdf_loader.scanned_pages
+        # Registros produzidos na leitura única feita por analyze_document
+        records = [self.pdf_loader.get_page_record(page_num)
+                   for page_num in range(self.pdf_loader.page_count)]
+        
+        # Reconhecer todas as páginas digitalizadas de uma vez
+        ocr_texts = {}
+        if self.use_ocr:
+            ocr_texts = self._ocr_pages([r for r in records if r and r.is_scanned])
+        
+        for page_num, record in enumerate(records):
+            if record is None:
+                continue
             
-            if is_scanned and self.use_ocr:
-                # Usar OCR para páginas digitalizadas
-                logger.info(f"Usando OCR para a página {page_num + 1}...")
-                img = self.pdf_loader.get_page_as_image(page_num)
-                if img:
-                    text = self.ocr_processor.perform_ocr(img)
+            if record.is_scanned and self.use_ocr:
+                # Usar o texto do OCR para páginas digitalizadas
+                text = ocr_texts.get(page_num)
+                if text is not None:
                     self.extracted_text[page_num] = {
                         'text': text,
-                        'method': 'ocr',
-                        'blocks': None
+                        'method': 'ocr'
                     }
-            else:
-                # Extrair texto com layout para páginas baseadas em texto
+            elif record.page is not None:
+                # Reaproveitar a página compacta da leitura única para páginas baseadas em texto
                 logger.info(f"Extraindo texto com layout da página {page_num + 1}...")
-                page_dict = self.pdf_loader.extract_text_with_layout(page_num)
+                self.document.add(record.page)
                 
-                if page_dict:
-                    # Extrair texto plano para referência
-                    text = ""
-                    for block in page_dict.get('blocks', []):
-                        if block.get('type') == 0:  # Bloco de texto
-                            for line in block.get('lines', []):
-                                for span in line.get('spans', []):
-                                    text += span.get('text', '')
-                                text += "\n"
-                    
-                    self.extracted_text[page_num] = {
-                        'text': text,
-                        'method': 'layout',
-                        'blocks': page_dict.get('blocks', [])
-                    }
+                # O texto da página já foi montado uma única vez na leitura
+                self.extracted_text[page_num] = {
+                    'text': record.page.text,
+                    'method': 'layout'
+                }
         
         logger.info(f"Texto extraído de {len(self.extracted_text)} páginas.")
     
+    def _ocr_pages(self, records):
+        """
+        Realiza OCR nas páginas digitalizadas.
+        
+        Args:
+            records (list): Registros das páginas digitalizadas.
+        
+        Returns:
+            dict: Mapeamento de página para texto reconhecido.
+        """
+        if not records:
+            return {}
+        
+        if self.ocr_workers > 1:
+            logger.info(f"Usando OCR em {len(records)} páginas com {self.ocr_workers} processos...")
+            if self.ocr_pool is None:
+                self.ocr_pool = OCRPool(workers=self.ocr_workers,
+                                        threads_per_worker=self.ocr_threads or 1,
+                                        cache_dir=self.ocr_cache_dir,
+                                        cache_size_mb=self.ocr_cache_size_mb)
+            hits = self.ocr_pool.cache_hits
+            ocr_texts = self.ocr_pool.ocr_pages(self.pdf_path, [r.page_num for r in records])
+            if self.ocr_cache_dir:
+                logger.info(f"Cache de OCR: {self.ocr_pool.cache_hits - hits} de "
+                            f"{len(ocr_texts)} páginas reaproveitadas.")
+            return ocr_texts
+        
+        ocr_processor = self._get_ocr_processor()
+        ocr_texts = {}
+        cache = ocr_processor.cache
+        hits = cache.hits if cache else 0
+        for record in records:
+            logger.info(f"Usando OCR para a página {record.page_num + 1}...")
+            img = self.pdf_loader.get_page_as_image(record.page_num, grayscale=True)
+            if img:
+                ocr_texts[record.page_num] = ocr_processor.perform_ocr(img)
+        
+        if cache:
+            logger.info(f"Cache de OCR: {cache.hits - hits} de {len(ocr_texts)} páginas reaproveitadas.")
+        
+        return ocr_texts
+    
+    def _get_ocr_processor(self):
+        """
+        Obtém o processador OCR, criando-o no primeiro uso.
+        
+        O EasyOCR (e o torch) só é importado e o modelo só é carregado quando o
+        documento tem uma página digitalizada.
+        
+        Returns:
+            OCRProcessor: Processador OCR deste documento.
+        """
+        if self.ocr_processor is None:
+            from ..utils.ocr_processor import OCRProcessor
+            
+            limit_threads(self.ocr_threads)
+            cache = OCRCache(self.ocr_cache_dir, self.ocr_cache_size_mb) if self.ocr_cache_dir else None
+            self.ocr_processor = OCRProcessor(cache=cache)
+        return self.ocr_processor
+    
     def _extract_sections(self):
         """Extrai seções do texto extraído."""
         logger.info("Extraindo seções do documento...")
         
+        # Estilo do corpo do texto, calculado uma vez para o documento inteiro
+        font_stats = compute_font_statistics(self.document)
+        if font_stats:
+            logger.info(f"Corpo do texto: {font_stats.body_font} {font_stats.body_size}pt"
+                        f"{' (negrito)' if font_stats.body_bold else ''}")
+        self.section_extractor.font_stats = font_stats
+        
         # Processar páginas com informações de layout
-        for page_num, page_info in self.extracted_text.items():
-            if page_info['method'] == 'layout' and page_info['blocks']:
-                logger.info(f"Extraindo seções da página {page_num + 1}...")
-                self.section_extractor.extract_sections_from_blocks(page_info['blocks'], page_num)
+        for page in self.document:
+            if page.blocks:
+                logger.info(f"Extraindo seções da página {page.number + 1}...")
+                self.section_extractor.extract_sections_from_blocks(page.blocks, page.number)
         
         # Obter todas as seções identificadas
         self.extracted_sections = self.section_extractor.get_all_sections()
@@ -148,20 +565,30 @@ class PDFProcessor:
         """Extrai tabelas do documento."""
         logger.info("Extraindo tabelas do documento...")
         
-        # Extrair todas as tabelas
-        self.extracted_tables = self.table_extractor.extract_all_tables()
+        # Extrair todas as tabelas (páginas digitalizadas não têm tabelas vetoriais)
+        self.extracted_tables = self.table_extractor.extract_all_tables(
+            skip_pages=self.pdf_loader.scanned_pages,
+            workers=self.workers,
+            fallback=self.table_fallback
+        )
+    
+    def _classify_and_save_tables(self):
+        """Identifica os tipos das tabelas extraídas e as salva como CSV."""
+        # Tabelas carregadas do cache também passam por aqui
+        self.table_extractor.tables = self.extracted_tables
         
         # Converter para DataFrames
         table_dfs = self.table_extractor.tables_to_dataframes()
         
-        # Identificar tipos de tabelas
-        for df_info in table_dfs:
-            df = df_info['dataframe']
-            table_type = self.table_extractor.identify_table_type(df)
+        # Identificar tipos de tabelas (todas em um único lote)
+        table_types = self.table_extractor.classify_tables([df_info['dataframe'] for df_info in table_dfs])
+        for df_info, table_type in zip(table_dfs, table_types):
             df_info['type'] = table_type
             
             logger.info(f"Tabela na página {df_info['page']} identificada como: {table_type}")
         
+        self.schedule_tables = [df_info['dataframe'] for df_info in table_dfs if df_info['type'] == 'cronograma']
+        
         # Salvar tabelas como CSV
         if table_dfs:
             csv_dir = os.path.join(self.output_dir, 'tabelas')
@@ -179,6 +606,10 @@ class PDFProcessor:
         if 'cronograma' in self.extracted_sections:
             self.data_extractor.extract_schedule(self.extracted_sections['cronograma'])
         
+        # Acrescentar os eventos das tabelas de cronograma
+        if self.schedule_tables:
+            self.data_extractor.extract_schedule_from_tables(self.schedule_tables)
+        
         # Extrair informações de inscrição
         if 'inscricao' in self.extracted_sections:
             self.data_extractor.extract_registration_info(self.extracted_sections['inscricao'])
@@ -200,15 +631,22 @@ class PDFProcessor:
         
         logger.info("Extração de dados estruturados concluída.")
     
-    def _save_results(self):
-        """Salva os resultados da extração."""
+    def _save_results(self, write_text=True):
+        """
+        Salva os resultados da extração.
+        
+        Args:
+            write_text (bool): Se False, texto_extraido.txt não é reescrito (no modo
+                streaming ele é gravado durante a leitura das páginas).
+        """
         # Salvar texto extraído
         text_output = os.path.join(self.output_dir, 'texto_extraido.txt')
-        with open(text_output, 'w', encoding='utf-8') as f:
-            for page_num in sorted(self.extracted_text.keys()):
-                f.write(f"=== PÁGINA {page_num + 1} ===\n")
-                f.write(self.extracted_text[page_num]['text'])
-                f.write("\n\n")
+        if write_text:
+            with open(text_output, 'w', encoding='utf-8') as f:
+                for page_num in sorted(self.extracted_text.keys()):
+                    f.write(f"=== PÁGINA {page_num + 1} ===\n")
+                    f.write(self.extracted_text[page_num]['text'])
+                    f.write("\n\n")
         
         # Salvar seções extraídas
         sections_output = os.path.join(self.output_dir, 'secoes_extraidas.txt')
@@ -230,3 +668,40 @@ class PDFProcessor:
             'sections_file': sections_output,
             'data_file': data_output
         }
+
+
+def _drain(head, rest):
+    """
+    Percorre os registros já lidos e depois os restantes.
+    
+    Os registros de head são removidos à medida que são consumidos, para que
+    não permaneçam em memória até o fim da passagem.
+    
+    Args:
+        head (deque): Registros lidos antecipadamente.
+        rest (iterator): Registros restantes.
+    
+    Yields:
+        PageRecord: Registros em ordem.
+    """
+    while head:
+        yield head.popleft()
+    yield from rest
+
+
+class _SpooledSections(Mapping):
+    """Seções gravadas em disco pelo SectionExtractor, lidas uma de cada vez por tipo."""
+    
+    def __init__(self, section_extractor):
+        self.section_extractor = section_extractor
+    
+    def __getitem__(self, section_type):
+        if section_type not in self.section_extractor.section_types():
+            raise KeyError(section_type)
+        return self.section_extractor.get_section_text(section_type)
+    
+    def __iter__(self):
+        return iter(self.section_extractor.section_types())
+    
+    def __len__(self):
+        return len(self.section_extractor.section_types())
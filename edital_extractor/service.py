@@ -0,0 +1,581 @@
+"""
+Serviço HTTP local de extração de editais.
+
+O serviço mantém uma fila de trabalhos em memória e processos de extração
+com os módulos, o modelo OCR e os dicionários já carregados (os mesmos
+processos do modo em lote), de modo que cada edital enviado paga apenas o
+próprio processamento. Usa apenas a biblioteca padrão e escuta, por padrão,
+apenas em 127.0.0.1.
+
+Rotas (respostas em JSON):
+    POST   /jobs                PDF no corpo (application/pdf) ou em um campo de
+                                arquivo (multipart/form-data). 202 com o id do
+                                trabalho; 400 se o Content-Length é inválido;
+                                503 se a fila está cheia ou se nenhum processo
+                                de extração pôde ser iniciado.
+    GET    /jobs/<id>           Status do trabalho (na_fila, processando, ok,
+                                erro ou tempo_esgotado) e posição na fila.
+    GET    /jobs/<id>/resultado Dados extraídos (dados_extraidos.json); 409 se o
+                                trabalho ainda não terminou com sucesso.
+    DELETE /jobs/<id>           Cancela o trabalho na fila ou remove o concluído.
+    GET    /saude               Ocupação da fila e dos processos.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from email import policy
+from email.parser import BytesParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Full
+from . import __version__
+from .batch import STATUS_ERROR, STATUS_OK, STATUS_TIMEOUT, WorkerProcess
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Status dos trabalhos antes de terminar (os finais são os do lote)
+STATUS_QUEUED = 'na_fila'
+STATUS_RUNNING = 'processando'
+
+
+class Job:
+    """Trabalho de extração de um edital enviado ao serviço."""
+    
+    __slots__ = ('id', 'filename', 'directory', 'status', 'created', 'started', 'finished', 'summary')
+    
+    def __init__(self, job_id, filename, directory):
+        """
+        Inicializa o trabalho.
+        
+        Args:
+            job_id (str): Identificador do trabalho.
+            filename (str): Nome original do arquivo enviado.
+            directory (str): Diretório do trabalho (PDF enviado e arquivos de saída).
+        """
+        self.id = job_id
+        self.filename = filename
+        self.directory = directory
+        self.status = STATUS_QUEUED
+        self.created = datetime.now().isoformat(timespec='seconds')
+        self.started = None
+        self.finished = None
+        self.summary = {}
+    
+    @property
+    def pdf_path(self):
+        return os.path.join(self.directory, 'edital.pdf')
+    
+    @property
+    def result_path(self):
+        return os.path.join(self.directory, 'dados_extraidos.json')
+    
+    def to_dict(self, position=None):
+        """
+        Resume o trabalho para as respostas do serviço.
+        
+        Args:
+            position (int): Posição na fila (1 = o próximo), se o trabalho está na fila.
+            
+        Returns:
+            dict: Status, horários e, ao terminar, o resumo do processamento.
+        """
+        info = {
+            'id': self.id,
+            'arquivo': self.filename,
+            'status': self.status,
+            'criado_em': self.created,
+            'iniciado_em': self.started,
+            'concluido_em': self.finished
+        }
+        if position is not None:
+            info['posicao'] = position
+        info.update(self.summary)
+        if self.status == STATUS_OK:
+            info['resultado'] = f"/jobs/{self.id}/resultado"
+        return info
+
+
+class ExtractionService:
+    """Fila de trabalhos de extração atendida por processos com os modelos carregados."""
+    
+    # Tentativas de iniciar cada processo de extração e espera inicial entre elas
+    # (dobrada a cada falha), em segundos
+    WORKER_START_ATTEMPTS = 3
+    WORKER_RETRY_DELAY = 2
+    
+    def __init__(self, work_dir=None, workers=1, max_queue=16, timeout=600, max_upload_mb=100,
+                 keep_jobs=200, debug=False, **processor_options):
+        """
+        Inicializa o serviço (os processos são iniciados por start).
+        
+        Args:
+            work_dir (str): Diretório dos trabalhos. Padrão: diretório temporário,
+                removido ao encerrar o serviço.
+            workers (int): Número de processos de extração (trabalhos simultâneos).
+            max_queue (int): Número máximo de trabalhos aguardando na fila.
+            timeout (float): Tempo limite por trabalho em segundos (0 ou None: sem limite).
+            max_upload_mb (int): Tamanho máximo do PDF enviado, em MB.
+            keep_jobs (int): Número de trabalhos concluídos mantidos (os mais antigos
+                são removidos, com seus arquivos).
+            debug (bool): Se True, os processos mostram os logs de cada documento.
+            **processor_options: Opções repassadas ao PDFProcessor (use_ocr,
+                ocr_threads, ocr_cache_dir, cache_dir, table_engine, streaming etc.).
+        """
+        self.temporary = work_dir is None
+        self.work_dir = os.path.abspath(work_dir) if work_dir else tempfile.mkdtemp(prefix='edital_service_')
+        self.workers = max(1, workers or 1)
+        self.max_queue = max(1, max_queue)
+        self.timeout = timeout or None
+        self.max_upload_bytes = max_upload_mb * 1024 * 1024
+        self.keep_jobs = keep_jobs
+        self.debug = debug
+        self.processor_options = processor_options
+        
+        self.jobs = {}
+        self.pending = deque()
+        self.finished = deque()
+        self.condition = threading.Condition()
+        self.worker_processes = set()
+        self.ready_workers = 0
+        self.lost_workers = 0
+        self.running = 0
+        self.closing = False
+        self.threads = []
+    
+    def start(self):
+        """Inicia os processos de extração, cada um atendido por uma thread da fila."""
+        os.makedirs(self.work_dir, exist_ok=True)
+        context = multiprocessing.get_context('spawn')
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._serve_queue, args=(context,),
+                                      name=f"extracao-{index}", daemon=True)
+            thread.start()
+            self.threads.append(thread)
+    
+    def submit(self, data, filename='edital.pdf'):
+        """
+        Coloca um edital na fila.
+        
+        Args:
+            data (bytes): Conteúdo do PDF.
+            filename (str): Nome original do arquivo.
+            
+        Returns:
+            dict: Status do trabalho criado (ver Job.to_dict).
+            
+        Raises:
+            ValueError: Se o conteúdo não é um PDF.
+            queue.Full: Se a fila está cheia.
+            RuntimeError: Se nenhum processo de extração pôde ser iniciado.
+        """
+        if not data.startswith(b'%PDF-'):
+            raise ValueError("O arquivo enviado não é um PDF.")
+        
+        job_id = uuid.uuid4().hex
+        job = Job(job_id, os.path.basename(filename or 'edital.pdf'), os.path.join(self.work_dir, job_id))
+        os.makedirs(job.directory)
+        with open(job.pdf_path, 'wb') as f:
+            f.write(data)
+        
+        with self.condition:
+            if self.lost_workers >= self.workers:
+                shutil.rmtree(job.directory, ignore_errors=True)
+                raise RuntimeError("Nenhum processo de extração disponível.")
+            if len(self.pending) >= self.max_queue:
+                shutil.rmtree(job.directory, ignore_errors=True)
+                raise Full(f"Fila cheia ({self.max_queue} trabalhos aguardando).")
+            
+            self.jobs[job_id] = job
+            self.pending.append(job)
+            self.condition.notify()
+            logger.info(f"Trabalho {job_id} na fila: {job.filename} ({len(data) / 1024:.0f} KiB).")
+            return job.to_dict(len(self.pending))
+    
+    def status(self, job_id):
+        """
+        Obtém o status de um trabalho.
+        
+        Args:
+            job_id (str): Identificador do trabalho.
+            
+        Returns:
+            dict: Status do trabalho (ver Job.to_dict) ou None se ele não existe.
+        """
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            position = self.pending.index(job) + 1 if job.status == STATUS_QUEUED else None
+            return job.to_dict(position)
+    
+    def result_path(self, job_id):
+        """
+        Obtém o arquivo de dados extraídos de um trabalho concluído.
+        
+        Args:
+            job_id (str): Identificador do trabalho.
+            
+        Returns:
+            tuple: (status do trabalho ou None se ele não existe, caminho do
+                dados_extraidos.json ou None se o trabalho não terminou com sucesso)
+        """
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None, None
+            return job.status, job.result_path if job.status == STATUS_OK else None
+    
+    def cancel(self, job_id):
+        """
+        Cancela um trabalho na fila ou remove um trabalho concluído.
+        
+        Args:
+            job_id (str): Identificador do trabalho.
+            
+        Returns:
+            str: Status do trabalho antes da remoção, ou None se ele não existe.
+                Trabalhos em processamento não são removidos.
+        """
+        with self.condition:
+            job = self.jobs.get(job_id)
+            if job is None:
+                return None
+            if job.status == STATUS_RUNNING:
+                return job.status
+            
+            if job.status == STATUS_QUEUED:
+                self.pending.remove(job)
+            else:
+                self.finished.remove(job)
+            del self.jobs[job_id]
+        
+        shutil.rmtree(job.directory, ignore_errors=True)
+        logger.info(f"Trabalho {job_id} removido ({job.status}).")
+        return job.status
+    
+    def stats(self):
+        """
+        Resume a ocupação do serviço.
+        
+        Returns:
+            dict: Trabalhos na fila e em processamento, limites, processos ativos
+                e prontos e processos perdidos (que não puderam ser iniciados).
+        """
+        with self.condition:
+            finished = {STATUS_OK: 0, STATUS_ERROR: 0, STATUS_TIMEOUT: 0}
+            for job in self.finished:
+                finished[job.status] += 1
+            return {
+                'versao': __version__,
+                'fila': len(self.pending),
+                'fila_max': self.max_queue,
+                'processando': self.running,
+                'processos': self.workers - self.lost_workers,
+                'processos_prontos': self.ready_workers,
+                'processos_perdidos': self.lost_workers,
+                'concluidos': finished
+            }
+    
+    def close(self):
+        """Encerra os processos de extração (os trabalhos em andamento são interrompidos)."""
+        with self.condition:
+            self.closing = True
+            self.condition.notify_all()
+            workers = list(self.worker_processes)
+        for worker in workers:
+            if worker.process.is_alive():
+                worker.process.terminate()
+        for thread in self.threads:
+            thread.join()
+        self.threads = []
+        
+        if self.temporary:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+    
+    def _serve_queue(self, context):
+        """Atende a fila com um processo de extração, substituído se travar ou terminar."""
+        worker = None
+        try:
+            while not self.closing:
+                if worker is None:
+                    worker = self._start_worker(context)
+                    if worker is None:
+                        if not self.closing:
+                            self._lose_worker()
+                        break
+                
+                with self.condition:
+                    while not self.pending and not self.closing:
+                        self.condition.wait()
+                    if self.closing:
+                        break
+                    job = self.pending.popleft()
+                    job.status = STATUS_RUNNING
+                    job.started = datetime.now().isoformat(timespec='seconds')
+                    self.running += 1
+                
+                summary, healthy = self._run_job(worker, job)
+                
+                with self.condition:
+                    self.running -= 1
+                    self._finish(job, summary)
+                    if not healthy:
+                        self.ready_workers -= 1
+                        self.worker_processes.discard(worker)
+                
+                if not healthy:
+                    worker.stop(graceful=False)
+                    worker = None
+        except Exception as e:
+            if not self.closing:
+                logger.error(f"Erro no processo de extração: {e}")
+        finally:
+            if worker is not None:
+                worker.stop(graceful=False)
+    
+    def _start_worker(self, context):
+        """
+        Inicia um processo de extração e aguarda o carregamento dos modelos.
+        
+        Uma falha na inicialização é repetida até WORKER_START_ATTEMPTS vezes, com
+        espera crescente entre as tentativas.
+        
+        Returns:
+            WorkerProcess: Processo pronto, ou None se todas as tentativas falharam
+                ou o serviço está sendo encerrado.
+        """
+        delay = self.WORKER_RETRY_DELAY
+        for attempt in range(1, self.WORKER_START_ATTEMPTS + 1):
+            worker = None
+            try:
+                worker = WorkerProcess(context, self.processor_options, self.debug)
+                with self.condition:
+                    self.worker_processes.add(worker)
+                worker.wait_ready()
+            except Exception as e:
+                if worker is not None:
+                    with self.condition:
+                        self.worker_processes.discard(worker)
+                    worker.stop(graceful=False)
+                if self.closing:
+                    return None
+                logger.error(f"Falha ao iniciar processo de extração "
+                             f"(tentativa {attempt} de {self.WORKER_START_ATTEMPTS}): {e}")
+                if attempt < self.WORKER_START_ATTEMPTS:
+                    with self.condition:
+                        if self.condition.wait_for(lambda: self.closing, delay):
+                            return None
+                    delay *= 2
+                continue
+            
+            with self.condition:
+                self.ready_workers += 1
+            return worker
+        return None
+    
+    def _lose_worker(self):
+        """
+        Registra um processo que não pôde ser iniciado.
+        
+        Sem nenhum processo restante, os trabalhos na fila terminam com erro e
+        submit passa a recusar novos trabalhos.
+        """
+        with self.condition:
+            self.lost_workers += 1
+            logger.error(f"Processo de extração perdido ({self.lost_workers} de {self.workers}).")
+            if self.lost_workers < self.workers:
+                return
+            while self.pending:
+                job = self.pending.popleft()
+                self._finish(job, {'status': STATUS_ERROR, 'segundos': 0.0,
+                                   'erro': "nenhum processo de extração disponível"})
+    
+    def _run_job(self, worker, job):
+        """
+        Envia o trabalho ao processo e aguarda o resumo (ou o tempo limite).
+        
+        Returns:
+            tuple: (resumo do processamento, False se o processo travou ou terminou
+                e precisa ser substituído)
+        """
+        worker.assign({'pdf': job.pdf_path, 'saida': job.directory})
+        if worker.conn.poll(self.timeout):
+            try:
+                summary = worker.conn.recv()
+                worker.task = None
+                return summary, True
+            except EOFError:
+                worker.process.join()
+                return {
+                    'status': STATUS_ERROR,
+                    'segundos': round(time.perf_counter() - worker.started, 3),
+                    'erro': f"processo encerrado (código {worker.process.exitcode})"
+                }, False
+        return {
+            'status': STATUS_TIMEOUT,
+            'segundos': round(time.perf_counter() - worker.started, 3)
+        }, False
+    
+    def _finish(self, job, summary):
+        """Registra o fim do trabalho e remove os concluídos mais antigos (com self.condition)."""
+        job.status = summary.pop('status')
+        job.finished = datetime.now().isoformat(timespec='seconds')
+        job.summary = summary
+        self.finished.append(job)
+        log = logger.info if job.status == STATUS_OK else logger.error
+        log(f"Trabalho {job.id} {job.status} em {summary['segundos']:.1f}s: {job.filename}"
+            + (f" ({summary['erro']})" if 'erro' in summary else ''))
+        
+        while len(self.finished) > self.keep_jobs:
+            old = self.finished.popleft()
+            del self.jobs[old.id]
+            shutil.rmtree(old.directory, ignore_errors=True)
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Rotas HTTP do serviço (ver o docstring do módulo)."""
+    
+    server_version = f"EditalExtractor/{__version__}"
+    
+    def do_GET(self):
+        service = self.server.service
+        parts = self._path_parts()
+        
+        if parts == ['saude']:
+            return self._send_json(200, service.stats())
+        
+        if len(parts) == 2 and parts[0] == 'jobs':
+            status = service.status(parts[1])
+            if status is None:
+                return self._send_error(404, "Trabalho não encontrado.")
+            return self._send_json(200, status)
+        
+        if len(parts) == 3 and parts[0] == 'jobs' and parts[2] == 'resultado':
+            status, path = service.result_path(parts[1])
+            if status is None:
+                return self._send_error(404, "Trabalho não encontrado.")
+            if path is None:
+                return self._send_error(409, f"Trabalho sem resultado (status: {status}).")
+            with open(path, 'rb') as f:
+                return self._send_body(200, f.read(), 'application/json; charset=utf-8')
+        
+        self._send_error(404, "Rota não encontrada.")
+    
+    def do_POST(self):
+        service = self.server.service
+        if self._path_parts() != ['jobs']:
+            return self._send_error(404, "Rota não encontrada.")
+        
+        length = self.headers.get('Content-Length')
+        if length is None:
+            return self._send_error(411, "Content-Length obrigatório.")
+        try:
+            length = int(length)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return self._send_error(400, "Content-Length inválido.")
+        if length > service.max_upload_bytes:
+            return self._send_error(413, f"Arquivo maior que {service.max_upload_bytes // (1024 * 1024)} MB.")
+        body = self.rfile.read(length)
+        
+        data, filename = body, self.headers.get('X-Filename', 'edital.pdf')
+        content_type = self.headers.get('Content-Type', '')
+        if content_type.startswith('multipart/form-data'):
+            data, filename = _read_multipart(content_type, body)
+            if data is None:
+                return self._send_error(400, "Nenhum arquivo no formulário.")
+        
+        try:
+            job = service.submit(data, filename)
+        except ValueError as e:
+            return self._send_error(415, str(e))
+        except Full as e:
+            return self._send_error(503, str(e), {'Retry-After': '30'})
+        except RuntimeError as e:
+            return self._send_error(503, str(e))
+        
+        self._send_json(202, job, {'Location': f"/jobs/{job['id']}"})
+    
+    def do_DELETE(self):
+        parts = self._path_parts()
+        if len(parts) != 2 or parts[0] != 'jobs':
+            return self._send_error(404, "Rota não encontrada.")
+        
+        status = self.server.service.cancel(parts[1])
+        if status is None:
+            return self._send_error(404, "Trabalho não encontrado.")
+        if status == STATUS_RUNNING:
+            return self._send_error(409, "Trabalho em processamento.")
+        self._send_json(200, {'id': parts[1], 'status': status, 'removido': True})
+    
+    def log_message(self, format, *args):
+        logger.debug(f"{self.address_string()} - {format % args}")
+    
+    def _path_parts(self):
+        """Divide o caminho da requisição (sem a query string) em partes."""
+        return [part for part in self.path.split('?', 1)[0].split('/') if part]
+    
+    def _send_json(self, code, payload, headers=None):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self._send_body(code, body, 'application/json; charset=utf-8', headers)
+    
+    def _send_error(self, code, message, headers=None):
+        self._send_json(code, {'erro': message}, headers)
+    
+    def _send_body(self, code, body, content_type, headers=None):
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def _read_multipart(content_type, body):
+    """
+    Obtém o primeiro arquivo de um formulário multipart/form-data.
+    
+    Returns:
+        tuple: (conteúdo, nome do arquivo) ou (None, None) se não há arquivo.
+    """
+    message = BytesParser(policy=policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode('latin-1') + body
+    )
+    for part in message.iter_parts():
+        filename = part.get_filename()
+        if filename:
+            return part.get_payload(decode=True), filename
+    return None, None
+
+
+def make_server(service, host='127.0.0.1', port=8765):
+    """
+    Cria o servidor HTTP do serviço (cada requisição em uma thread).
+    
+    Args:
+        service (ExtractionService): Serviço que atende os trabalhos.
+        host (str): Endereço de escuta.
+        port (int): Porta (0 escolhe uma porta livre).
+        
+    Returns:
+        ThreadingHTTPServer: Servidor pronto para serve_forever.
+    """
+    server = ThreadingHTTPServer((host, port), _RequestHandler)
+    server.daemon_threads = True
+    server.service = service
+    return server
@@ -0,0 +1,254 @@
+"""
+Modelo compacto de documento compartilhado pelos extratores.
+
+Em vez do dicionário "dict" do PyMuPDF (blocos, linhas e spans como
+dicionários aninhados), cada página guarda um único texto; blocos e spans
+guardam apenas deslocamentos nesse texto e os atributos de layout e fonte
+usados pelos extratores.
+"""
+
+import sys
+import numpy as np
+
+# Indicador de negrito nos spans do PyMuPDF (fitz.TEXT_FONT_BOLD)
+BOLD_FLAG = 16
+
+
+class Span:
+    """Trecho de texto com a mesma fonte. O texto fica no texto da página."""
+    
+    __slots__ = ('start', 'end', 'size', 'font', 'flags')
+    
+    def __init__(self, start, end, size, font, flags):
+        """
+        Inicializa o span.
+        
+        Args:
+            start (int): Posição inicial do span no texto da página.
+            end (int): Posição final (exclusiva) do span no texto da página.
+            size (float): Tamanho da fonte.
+            font (str): Nome da fonte.
+            flags (int): Indicadores de estilo do PyMuPDF (negrito, itálico etc.).
+        """
+        self.start = start
+        self.end = end
+        self.size = size
+        self.font = font
+        self.flags = flags
+    
+    @property
+    def is_bold(self):
+        """bool: True se o span está em negrito (pelo indicador ou pelo nome da fonte)."""
+        return bool(self.flags & BOLD_FLAG) or _is_bold_font_name(self.font)
+
+
+class Block:
+    """Bloco de texto de uma página."""
+    
+    __slots__ = ('index', 'start', 'end', 'bbox', 'text', 'spans')
+    
+    def __init__(self, index, start, end, bbox, text, spans):
+        """
+        Inicializa o bloco.
+        
+        Args:
+            index (int): Posição do bloco na página.
+            start (int): Posição inicial das linhas do bloco no texto da página.
+            end (int): Posição final (exclusiva) das linhas do bloco no texto da página.
+            bbox (tuple): Coordenadas do bloco (x0, y0, x1, y1).
+            text (str): Texto do bloco (spans concatenados, sem espaços nas pontas).
+            spans (tuple): Spans do bloco, em ordem de leitura.
+        """
+        self.index = index
+        self.start = start
+        self.end = end
+        self.bbox = bbox
+        self.text = text
+        self.spans = spans
+
+
+class Page:
+    """Página de texto: um único texto e os blocos que apontam para ele."""
+    
+    __slots__ = ('number', 'text', 'blocks')
+    
+    def __init__(self, number, text, blocks):
+        """
+        Inicializa a página.
+        
+        Args:
+            number (int): Número da página (0-based).
+            text (str): Texto da página, com uma quebra de linha ao fim de cada linha.
+            blocks (list): Blocos de texto da página.
+        """
+        self.number = number
+        self.text = text
+        self.blocks = blocks
+    
+    def span_text(self, span):
+        """
+        Obtém o texto de um span da página.
+        
+        Args:
+            span (Span): Span de um dos blocos da página.
+        
+        Returns:
+            str: Texto do span.
+        """
+        return self.text[span.start:span.end]
+
+
+class Document:
+    """Páginas de texto de um documento, em ordem."""
+    
+    __slots__ = ('pages',)
+    
+    def __init__(self, pages=None):
+        """
+        Inicializa o documento.
+        
+        Args:
+            pages (list): Páginas iniciais (opcional).
+        """
+        self.pages = {}
+        for page in pages or []:
+            self.add(page)
+    
+    def add(self, page):
+        """Adiciona (ou substitui) uma página."""
+        self.pages[page.number] = page
+    
+    def get(self, page_num):
+        """
+        Obtém uma página pelo número.
+        
+        Args:
+            page_num (int): Número da página (0-based).
+        
+        Returns:
+            Page: Página ou None se ela não tem texto (por exemplo, se é digitalizada).
+        """
+        return self.pages.get(page_num)
+    
+    def __iter__(self):
+        return iter(self.pages.values())
+    
+    def __len__(self):
+        return len(self.pages)
+
+
+class FontStatistics:
+    """Estilo do corpo do texto de um documento, obtido dos histogramas de fontes."""
+    
+    __slots__ = ('body_size', 'body_font', 'body_bold', 'size_histogram', 'font_histogram')
+    
+    def __init__(self, body_size, body_font, body_bold, size_histogram, font_histogram):
+        """
+        Inicializa as estatísticas.
+        
+        Args:
+            body_size (float): Tamanho de fonte mais usado (em caracteres), arredondado a 0,5pt.
+            body_font (str): Fonte mais usada (em caracteres).
+            body_bold (bool): True se a maior parte do texto está em negrito.
+            size_histogram (dict): Tamanho de fonte -> número de caracteres.
+            font_histogram (dict): Nome da fonte -> número de caracteres.
+        """
+        self.body_size = body_size
+        self.body_font = body_font
+        self.body_bold = body_bold
+        self.size_histogram = size_histogram
+        self.font_histogram = font_histogram
+
+
+def compute_font_statistics(pages):
+    """
+    Calcula o estilo do corpo do texto a partir de todos os spans das páginas.
+    
+    Os atributos dos spans são reunidos em arrays e os histogramas de tamanho
+    e de fonte, ponderados pelo número de caracteres, são calculados com NumPy.
+    
+    Args:
+        pages (iterable): Páginas (Page) a considerar.
+        
+    Returns:
+        FontStatistics: Estatísticas do documento ou None se não há texto.
+    """
+    spans = [span for page in pages for block in page.blocks for span in block.spans]
+    if not spans:
+        return None
+    
+    font_ids = {}
+    sizes = np.fromiter((span.size for span in spans), dtype=np.float64, count=len(spans))
+    lengths = np.fromiter((span.end - span.start for span in spans), dtype=np.int64, count=len(spans))
+    fonts = np.fromiter((font_ids.setdefault(span.font, len(font_ids)) for span in spans),
+                        dtype=np.int64, count=len(spans))
+    flags = np.fromiter((span.flags for span in spans), dtype=np.int64, count=len(spans))
+    font_names = list(font_ids)
+    
+    # Histograma de tamanhos, arredondados a 0,5pt
+    unique_sizes, size_index = np.unique(np.round(sizes * 2) / 2, return_inverse=True)
+    size_chars = np.bincount(size_index, weights=lengths)
+    
+    # Histograma de fontes
+    font_chars = np.bincount(fonts, weights=lengths, minlength=len(font_names))
+    
+    # Negrito pelo indicador do PyMuPDF ou pelo nome da fonte
+    bold_names = np.array([_is_bold_font_name(name) for name in font_names])
+    bold = ((flags & BOLD_FLAG) != 0) | bold_names[fonts]
+    
+    return FontStatistics(
+        body_size=float(unique_sizes[np.argmax(size_chars)]),
+        body_font=font_names[int(np.argmax(font_chars))],
+        body_bold=bool(lengths[bold].sum() * 2 > lengths.sum()),
+        size_histogram={float(size): int(chars) for size, chars in zip(unique_sizes, size_chars)},
+        font_histogram={name: int(chars) for name, chars in zip(font_names, font_chars)}
+    )
+
+
+def _is_bold_font_name(font_name):
+    """Verifica se o nome da fonte indica negrito."""
+    font_name = font_name.lower()
+    return 'bold' in font_name or 'negrito' in font_name
+
+
+def build_page(page_num, page_dict):
+    """
+    Constrói uma página compacta a partir do layout do PyMuPDF.
+    
+    O texto da página segue o formato usado na saída de texto: os spans de cada
+    linha concatenados, seguidos de uma quebra de linha.
+    
+    Args:
+        page_num (int): Número da página (0-based).
+        page_dict (dict): Dicionário de layout (formato "dict" do PyMuPDF).
+    
+    Returns:
+        Page: Página compacta.
+    """
+    parts = []
+    blocks = []
+    position = 0
+    
+    for block in page_dict.get('blocks', []):
+        if block.get('type') != 0:  # Apenas blocos de texto
+            continue
+        
+        block_start = position
+        span_texts = []
+        spans = []
+        for line in block.get('lines', []):
+            for span in line.get('spans', []):
+                span_text = span.get('text', '')
+                spans.append(Span(position, position + len(span_text), span.get('size', 0),
+                                  sys.intern(span.get('font', '')), span.get('flags', 0)))
+                span_texts.append(span_text)
+                parts.append(span_text)
+                position += len(span_text)
+            parts.append('\n')
+            position += 1
+        
+        # Texto do bloco: spans concatenados sem as quebras de linha
+        text = ''.join(span_texts).strip()
+        blocks.append(Block(len(blocks), block_start, position, tuple(block['bbox']), text, tuple(spans)))
+    
+    return Page(page_num, ''.join(parts), blocks)
@@ -0,0 +1,350 @@
+"""
+Dicionários de entidades (bancas, órgãos, cargos) reconhecidas em uma única
+passagem pelo texto.
+
+Cada dicionário é um autômato de Aho-Corasick sobre palavras: o texto é
+normalizado (minúsculas e sem acentos, mantendo as posições), dividido em
+palavras e percorrido uma única vez, qualquer que seja o número de nomes.
+Como os nomes são sequências de palavras, só há ocorrências com palavras
+inteiras ("FCC" não é encontrado em "FCCX"). Os nomes alternativos escritos
+só em maiúsculas (siglas como "MEC" ou "ANA") são reconhecidos apenas quando
+escritos em maiúsculas no texto, para não confundir siglas com palavras ou
+nomes de pessoas ("Ana Maria").
+"""
+
+import hashlib
+import logging
+import os
+import unicodedata
+from functools import lru_cache
+from itertools import islice
+from .regex_patterns import WORD_PATTERN
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Diretório dos arquivos de dicionários (um nome por linha, ver Gazetteer.from_file)
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+
+
+def _build_fold_table():
+    """
+    Monta a tabela de normalização: cada letra latina vira a letra minúscula sem
+    acento. Apenas caracteres que viram exatamente um caractere entram na
+    tabela, de modo que as posições no texto normalizado valem no original.
+    """
+    table = {}
+    for code in range(0x250):
+        char = chr(code)
+        base = ''.join(c for c in unicodedata.normalize('NFKD', char) if not unicodedata.combining(c)).lower()
+        if len(base) == 1 and base != char:
+            table[code] = base
+    return table
+
+
+FOLD_TABLE = _build_fold_table()
+
+
+def fold(text):
+    """
+    Normaliza o texto para comparação: minúsculas e sem acentos.
+    
+    Args:
+        text (str): Texto original.
+        
+    Returns:
+        str: Texto normalizado, com o mesmo tamanho do original.
+    """
+    return _lower(text).translate(FOLD_TABLE)
+
+
+def _lower(text):
+    """
+    Converte o texto para minúsculas mantendo as posições de cada caractere.
+    
+    Alguns caracteres (como "İ") mudam de tamanho em minúsculas; eles são
+    mantidos como estão.
+    """
+    lower = text.lower()
+    if len(lower) != len(text):
+        lower = ''.join(char.lower() if len(char.lower()) == 1 else char for char in text)
+    return lower
+
+
+class Mention:
+    """Ocorrência de uma entidade do dicionário em um texto."""
+    
+    __slots__ = ('name', 'priority', 'start', 'end', 'text')
+    
+    def __init__(self, name, priority, start, end, text):
+        """
+        Inicializa a ocorrência.
+        
+        Args:
+            name (str): Nome canônico da entidade.
+            priority (int): Posição da entidade no dicionário (menor = mais prioritária).
+            start (int): Posição inicial no texto.
+            end (int): Posição final (exclusiva) no texto.
+            text (str): Trecho do texto, como escrito.
+        """
+        self.name = name
+        self.priority = priority
+        self.start = start
+        self.end = end
+        self.text = text
+    
+    def __repr__(self):
+        return f"Mention({self.name!r}, {self.start}, {self.end}, {self.text!r})"
+
+
+class Gazetteer:
+    """Dicionário de entidades, com nomes alternativos, reconhecidas por um autômato de palavras."""
+    
+    def __init__(self, entries=()):
+        """
+        Inicializa o dicionário.
+        
+        Args:
+            entries (iterable): Entidades iniciais, como (nome canônico, nomes alternativos).
+        """
+        self.names = []
+        self._goto = [{}]       # Nó -> {palavra: próximo nó}
+        self._fail = [0]        # Nó -> nó do maior sufixo próprio que também está no autômato
+        self._outputs = [[]]    # Nó -> [(entidade, número de palavras, só em maiúsculas)] dos nomes que terminam no nó
+        self._matches = [[]]    # Nó -> nomes que terminam no nó ou em um de seus sufixos
+        self._vocabulary = set()
+        self._ready = True
+        
+        for name, aliases in entries:
+            self.add(name, aliases)
+    
+    @classmethod
+    def from_file(cls, path):
+        """
+        Carrega um dicionário de um arquivo de texto.
+        
+        Cada linha traz o nome canônico e, opcionalmente, nomes alternativos,
+        separados por "|". Linhas vazias e iniciadas por "#" são ignoradas. A
+        ordem das linhas define a prioridade das entidades. Nomes alternativos
+        escritos só em maiúsculas são siglas, reconhecidas apenas em maiúsculas.
+        
+        Args:
+            path (str): Caminho do arquivo (UTF-8).
+            
+        Returns:
+            Gazetteer: Dicionário carregado.
+        """
+        gazetteer = cls()
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line or line.startswith('#'):
+                    continue
+                names = [name.strip() for name in line.split('|')]
+                gazetteer.add(names[0], [name for name in names[1:] if name])
+        gazetteer._build()
+        
+        logger.debug(f"Dicionário {os.path.basename(path)}: {len(gazetteer)} entidades.")
+        return gazetteer
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def add(self, name, aliases=()):
+        """
+        Adiciona uma entidade.
+        
+        Args:
+            name (str): Nome canônico, também reconhecido no texto.
+            aliases (iterable): Nomes alternativos (siglas, grafias). Os escritos só
+                em maiúsculas são reconhecidos apenas em maiúsculas.
+            
+        Returns:
+            int: Prioridade da entidade (posição no dicionário).
+        """
+        entity = len(self.names)
+        self.names.append(name)
+        
+        for alias in [name, *aliases]:
+            words = WORD_PATTERN.findall(fold(alias))
+            if not words:
+                continue
+            match_case = alias is not name and alias.isupper()
+            
+            node = 0
+            for word in words:
+                next_node = self._goto[node].get(word)
+                if next_node is None:
+                    next_node = len(self._goto)
+                    self._goto[node][word] = next_node
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._outputs.append([])
+                node = next_node
+            self._outputs[node].append((entity, len(words), match_case))
+            self._vocabulary.update(words)
+        
+        self._ready = False
+        return entity
+    
+    def _build(self):
+        """Calcula as transições de falha (busca em largura a partir da raiz)."""
+        matches = [list(output) for output in self._outputs]
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for word, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and word not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(word, 0)
+                # Os nomes que terminam no sufixo também terminam aqui; a fila
+                # processa os nós em ordem de profundidade, então as saídas do
+                # nó de falha já estão completas
+                matches[child].extend(matches[self._fail[child]])
+        
+        self._matches = matches
+        self._ready = True
+    
+    def find_all(self, text, pos=0, endpos=None):
+        """
+        Encontra as entidades citadas no texto, em uma única passagem.
+        
+        Entre ocorrências sobrepostas vale a que começa antes e, depois, a mais
+        longa; em caso de empate, a entidade de maior prioridade.
+        
+        Args:
+            text (str): Texto a ser analisado.
+            pos (int): Posição onde a busca começa.
+            endpos (int): Posição onde a busca termina (opcional).
+            
+        Returns:
+            list: Ocorrências (Mention), na ordem do texto e sem sobreposição.
+        """
+        if not self._ready:
+            self._build()
+        
+        goto = self._goto
+        fail = self._fail
+        matches = self._matches
+        vocabulary = self._vocabulary
+        
+        # O trecho é convertido para minúsculas de uma vez; os acentos são
+        # removidos palavra a palavra, apenas das palavras fora do ASCII. As
+        # posições no trecho são deslocadas por pos.
+        segment = _lower(text[pos:endpos])
+        
+        candidates = []
+        node = 0
+        for index, word in enumerate(WORD_PATTERN.findall(segment)):
+            if not word.isascii():
+                word = word.translate(FOLD_TABLE)
+            
+            # Palavras fora do dicionário levam sempre de volta à raiz
+            if word not in vocabulary:
+                node = 0
+                continue
+            
+            while node and word not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(word, 0)
+            for entity, length, match_case in matches[node]:
+                candidates.append((index - length + 1, -length, entity, match_case))
+        
+        # Siglas só valem escritas em maiúsculas no texto original
+        if any(candidate[3] for candidate in candidates):
+            candidates = _check_case(candidates, text, pos, segment)
+        
+        # Ocorrências sem sobreposição, como (primeira palavra, última palavra, entidade)
+        selected = []
+        next_free = 0
+        for first, negative_length, entity, _ in sorted(candidates):
+            if first < next_free:
+                continue
+            last = first - negative_length - 1
+            selected.append((first, last, entity))
+            next_free = last + 1
+        
+        # Posições das palavras escolhidas: o trecho é percorrido de novo, sem
+        # criar objetos em Python para as palavras intermediárias
+        word_matches = WORD_PATTERN.finditer(segment)
+        consumed = 0
+        mentions = []
+        for first, last, entity in selected:
+            first_match = next(islice(word_matches, first - consumed, None))
+            last_match = first_match if last == first else next(islice(word_matches, last - first - 1, None))
+            consumed = last + 1
+            start, end = pos + first_match.start(), pos + last_match.end()
+            mentions.append(Mention(self.names[entity], entity, start, end, text[start:end]))
+        
+        return mentions
+
+
+def _check_case(candidates, text, pos, segment):
+    """
+    Descarta as ocorrências de siglas que não estão em maiúsculas no texto.
+    
+    Args:
+        candidates (list): Ocorrências, como (primeira palavra, -número de
+            palavras, entidade, só em maiúsculas).
+        text (str): Texto original.
+        pos (int): Posição do trecho no texto.
+        segment (str): Trecho convertido para minúsculas.
+        
+    Returns:
+        list: Ocorrências mantidas.
+    """
+    # Posições da primeira e da última palavra de cada sigla; o trecho é
+    # percorrido uma única vez, até a última palavra necessária
+    indices = sorted({index for first, negative_length, _, match_case in candidates if match_case
+                      for index in (first, first - negative_length - 1)})
+    word_matches = WORD_PATTERN.finditer(segment)
+    spans = {}
+    consumed = 0
+    for index in indices:
+        spans[index] = next(islice(word_matches, index - consumed, None)).span()
+        consumed = index + 1
+    
+    kept = []
+    for candidate in candidates:
+        first, negative_length, _, match_case = candidate
+        if match_case:
+            start, end = spans[first][0], spans[first - negative_length - 1][1]
+            if not text[pos + start:pos + end].isupper():
+                continue
+        kept.append(candidate)
+    return kept
+
+
+@lru_cache(maxsize=None)
+def load_gazetteer(name):
+    """
+    Carrega (uma única vez por processo) um dicionário de DATA_DIR.
+    
+    Args:
+        name (str): Nome do dicionário ("bancas", "orgaos" ou "cargos").
+        
+    Returns:
+        Gazetteer: Dicionário carregado.
+    """
+    return Gazetteer.from_file(os.path.join(DATA_DIR, f"{name}.txt"))
+
+
+def gazetteer_version():
+    """
+    Calcula a versão dos arquivos de dicionários (usada no cache de etapas).
+    
+    Returns:
+        str: Hash hexadecimal do conteúdo de todos os arquivos.
+    """
+    digest = hashlib.sha256()
+    for filename in sorted(os.listdir(DATA_DIR)):
+        if filename.endswith('.txt'):
+            digest.update(filename.encode('utf-8'))
+            with open(os.path.join(DATA_DIR, filename), 'rb') as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:16]
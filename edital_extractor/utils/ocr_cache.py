@@ -0,0 +1,184 @@
+"""
+Cache em disco de resultados de OCR, endereçado pelo conteúdo das páginas.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+class OCRCache:
+    """Cache de OCR com chave pelo hash dos pixels e despejo LRU limitado por tamanho."""
+    
+    def __init__(self, cache_dir, max_size_mb=1024):
+        """
+        Inicializa o cache de OCR.
+        
+        Args:
+            cache_dir (str): Diretório onde os resultados são armazenados.
+            max_size_mb (int): Tamanho máximo do cache em MB. Ao ultrapassá-lo,
+                as entradas usadas há mais tempo são removidas.
+        """
+        self.cache_dir = cache_dir
+        self.max_size = int(max_size_mb * 1024 * 1024)
+        self.hits = 0
+        self.misses = 0
+        
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+        
+        self.current_size = sum(size for _, _, size in self._entries())
+    
+    def make_key(self, image, engine, lang, settings=None):
+        """
+        Calcula a chave de uma imagem para um motor e configuração de OCR.
+        
+        Args:
+            image (PIL.Image): Imagem da página, antes do pré-processamento.
+            engine (str): Identificação do motor OCR (incluindo versão).
+            lang (str): Idioma(s) do reconhecimento.
+            settings (dict): Parâmetros de pré-processamento.
+            
+        Returns:
+            str: Chave hexadecimal SHA-256.
+        """
+        digest = hashlib.sha256()
+        header = {
+            'engine': engine,
+            'lang': lang,
+            'settings': settings or {},
+            'mode': image.mode,
+            'size': image.size,
+        }
+        digest.update(json.dumps(header, sort_keys=True).encode('utf-8'))
+        digest.update(image.tobytes())
+        return digest.hexdigest()
+    
+    def _path(self, key):
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+    
+    def get(self, key):
+        """
+        Obtém o texto armazenado para uma chave.
+        
+        Args:
+            key (str): Chave calculada por make_key.
+            
+        Returns:
+            str: Texto reconhecido ou None se não estiver no cache.
+        """
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                text = f.read()
+        except OSError:
+            self.misses += 1
+            return None
+        
+        # Atualizar a data de acesso para o despejo LRU
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        
+        self.hits += 1
+        return text
+    
+    def put(self, key, text):
+        """
+        Armazena o texto reconhecido para uma chave.
+        
+        A escrita é atômica, de modo que vários processos podem compartilhar o
+        mesmo diretório de cache.
+        
+        Args:
+            key (str): Chave calculada por make_key.
+            text (str): Texto reconhecido.
+        """
+        path = self._path(key)
+        directory = os.path.dirname(path)
+        data = text.encode('utf-8')
+        tmp_path = None
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            # Uma entrada substituída deixa de contar no tamanho do cache
+            try:
+                previous_size = os.path.getsize(path)
+            except OSError:
+                previous_size = 0
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Erro ao gravar no cache de OCR: {e}")
+            if tmp_path:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+            return
+        
+        # O tamanho vem dos bytes gravados: outro processo pode remover a
+        # entrada logo depois da substituição
+        self.current_size += len(data) - previous_size
+        if self.current_size > self.max_size:
+            self._evict()
+    
+    def _entries(self):
+        """Lista as entradas do cache como tuplas (caminho, último acesso, tamanho)."""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.txt'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+    
+    def _evict(self):
+        """Remove as entradas usadas há mais tempo até o cache voltar a 90% do limite."""
+        entries = sorted(self._entries(), key=lambda entry: entry[1])
+        total = sum(size for _, _, size in entries)
+        target = self.max_size * 0.9
+        removed = 0
+        
+        for path, _, size in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+        
+        self.current_size = total
+        logger.info(f"Cache de OCR: {removed} entradas removidas (LRU).")
+    
+    def stats(self):
+        """
+        Obtém as estatísticas de uso do cache.
+        
+        Returns:
+            dict: Acertos, falhas e tamanho atual em bytes.
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'size_bytes': self.current_size,
+        }
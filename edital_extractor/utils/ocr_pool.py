@@ -0,0 +1,207 @@
+"""
+Pool de processos OCR com o modelo carregado uma única vez por processo.
+"""
+
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Variáveis de ambiente que controlam o número de threads das bibliotecas
+# numéricas usadas pelo EasyOCR (torch/OpenMP/BLAS) e pelo Tesseract
+THREAD_ENV_VARS = (
+    'OMP_NUM_THREADS',
+    'MKL_NUM_THREADS',
+    'OPENBLAS_NUM_THREADS',
+    'NUMEXPR_NUM_THREADS',
+    'OMP_THREAD_LIMIT',
+)
+
+# Estado de cada processo do pool
+_worker_ocr = None
+_worker_docs = {}
+
+
+def limit_threads(threads):
+    """
+    Limita o número de threads usadas pelas bibliotecas de OCR no processo atual.
+    
+    Deve ser chamada antes de carregar o modelo para que as variáveis de ambiente
+    tenham efeito; se o torch já estiver carregado, o limite é aplicado diretamente.
+    
+    Args:
+        threads (int): Número máximo de threads.
+    """
+    if not threads or threads < 1:
+        return
+    
+    for var in THREAD_ENV_VARS:
+        os.environ[var] = str(threads)
+    
+    try:
+        import torch
+        torch.set_num_threads(threads)
+    except ImportError:
+        pass
+
+
+def _init_worker(use_easyocr, threads, cache_dir, cache_size_mb):
+    """Inicializa um processo do pool: limita threads e carrega o modelo OCR."""
+    global _worker_ocr
+    
+    limit_threads(threads)
+    
+    from .ocr_processor import OCRProcessor
+    cache = None
+    if cache_dir:
+        from .ocr_cache import OCRCache
+        cache = OCRCache(cache_dir, cache_size_mb)
+    _worker_ocr = OCRProcessor(use_easyocr=use_easyocr, cache=cache)
+
+
+def _recognize(image):
+    """Reconhece uma imagem e indica se o resultado veio do cache."""
+    cache = _worker_ocr.cache
+    hits = cache.hits if cache else 0
+    text = _worker_ocr.perform_ocr(image)
+    return text, bool(cache and cache.hits > hits)
+
+
+def _get_worker_doc(pdf_path):
+    """Abre (uma vez por processo) o documento usado para renderizar as páginas."""
+    doc = _worker_docs.get(pdf_path)
+    if doc is None:
+        import fitz  # PyMuPDF
+        # Manter apenas o documento mais recente aberto
+        for old_doc in _worker_docs.values():
+            old_doc.close()
+        _worker_docs.clear()
+        doc = _worker_docs[pdf_path] = fitz.open(pdf_path)
+    return doc
+
+
+def _ocr_page(pdf_path, page_num, dpi):
+    """Renderiza e reconhece uma página no processo do pool."""
+    from .pdf_loader import render_page
+    
+    try:
+        image = render_page(_get_worker_doc(pdf_path)[page_num], dpi, grayscale=True)
+    except Exception as e:
+        logger.error(f"Erro ao converter página {page_num} para imagem: {e}")
+        return page_num, None, False
+    
+    return (page_num,) + _recognize(image)
+
+
+def _ocr_image(index, image):
+    """Reconhece uma imagem no processo do pool."""
+    return (index,) + _recognize(image)
+
+
+class OCRPool:
+    """Pool de processos OCR que mantém o modelo carregado entre páginas e documentos."""
+    
+    def __init__(self, workers=2, threads_per_worker=1, use_easyocr=True,
+                 cache_dir=None, cache_size_mb=1024):
+        """
+        Inicializa o pool de OCR.
+        
+        Os processos são iniciados com o método "spawn" para que cada um carregue
+        o modelo do zero, sem herdar o estado de threads do processo principal.
+        
+        Args:
+            workers (int): Número de processos OCR.
+            threads_per_worker (int): Limite de threads (torch/OpenMP) por processo.
+                O ideal é que workers * threads_per_worker não passe do número de núcleos.
+            use_easyocr (bool): Se True, usa EasyOCR. Se False, usa pytesseract.
+            cache_dir (str): Diretório do cache de OCR compartilhado pelos processos (opcional).
+            cache_size_mb (int): Tamanho máximo do cache de OCR em MB.
+        """
+        self.workers = max(1, workers)
+        self.threads_per_worker = threads_per_worker
+        self.use_easyocr = use_easyocr
+        self.cache_hits = 0
+        self.cache_misses = 0
+        
+        logger.info(f"Iniciando pool OCR com {self.workers} processos "
+                    f"({threads_per_worker} thread(s) por processo)...")
+        self.executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(use_easyocr, threads_per_worker, cache_dir, cache_size_mb)
+        )
+    
+    def ocr_pages(self, pdf_path, page_nums, dpi=300):
+        """
+        Realiza OCR em páginas de um PDF.
+        
+        Cada processo renderiza as páginas a partir da sua própria cópia do
+        documento, evitando enviar imagens grandes entre processos.
+        
+        Args:
+            pdf_path (str): Caminho para o arquivo PDF.
+            page_nums (list): Páginas (0-based) a reconhecer.
+            dpi (int): Resolução da renderização em DPI.
+            
+        Returns:
+            dict: Mapeamento de página para texto reconhecido, em ordem de página.
+                Páginas que não puderam ser renderizadas ficam de fora.
+        """
+        page_nums = sorted(page_nums)
+        futures = [self.executor.submit(_ocr_page, pdf_path, page_num, dpi) for page_num in page_nums]
+        
+        results = {}
+        for future in futures:
+            page_num, text, cache_hit = future.result()
+            if text is not None:
+                results[page_num] = text
+                self._count(cache_hit)
+        
+        return results
+    
+    def ocr_images(self, images):
+        """
+        Realiza OCR em uma lista de imagens.
+        
+        Args:
+            images (list): Imagens PIL.
+            
+        Returns:
+            list: Textos reconhecidos, na mesma ordem das imagens.
+        """
+        futures = [self.executor.submit(_ocr_image, i, image) for i, image in enumerate(images)]
+        
+        texts = []
+        for future in futures:
+            _, text, cache_hit = future.result()
+            texts.append(text)
+            self._count(cache_hit)
+        
+        return texts
+    
+    def _count(self, cache_hit):
+        """Contabiliza acertos e falhas do cache de OCR dos processos."""
+        if cache_hit:
+            self.cache_hits += 1
+        else:
+            self.cache_misses += 1
+    
+    def close(self):
+        """Encerra os processos do pool."""
+        if self.executor:
+            self.executor.shutdown()
+            self.executor = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
@@ -18,25 +18,40 @@ logger = logging.getLogger(__name__)
 class OCRProcessor:
     """Classe para processamento OCR de páginas digitalizadas."""
     
-    def __init__(self, use_easyocr=True):
+    # Idiomas usados pelo EasyOCR
+    EASYOCR_LANGUAGES = ['pt']
+    
+    # Parâmetros do pré-processamento (também fazem parte da chave do cache)
+    CONTRAST_FACTOR = 2.0
+    MEDIAN_FILTER_SIZE = 3
+    
+    def __init__(self, use_easyocr=True, cache=None):
         """
         Inicializa o processador OCR.
         
         Args:
             use_easyocr (bool): Se True, usa EasyOCR. Se False, usa pytesseract.
+            cache (OCRCache): Cache de resultados de OCR (opcional).
         """
         self.use_easyocr = use_easyocr
         self.ocr_engine = None
+        self.engine_id = None
+        self.cache = cache
         
         try:
             if use_easyocr:
                 import easyocr
                 logger.info("Inicializando EasyOCR (pode levar alguns segundos)...")
-                self.ocr_engine = easyocr.Reader(['pt'], gpu=False)
+                self.ocr_engine = easyocr.Reader(self.EASYOCR_LANGUAGES, gpu=False)
+                self.engine_id = f"easyocr-{getattr(easyocr, '__version__', 'unknown')}"
                 logger.info("EasyOCR inicializado com sucesso.")
             else:
                 import pytesseract
                 self.ocr_engine = pytesseract
+                try:
+                    self.engine_id = f"tesseract-{pytesseract.get_tesseract_version()}"
+                except Exception:
+                    self.engine_id = "tesseract-unknown"
                 logger.info("Pytesseract configurado.")
         except ImportError as e:
             logger.error(f"Erro ao importar biblioteca OCR: {e}")
@@ -57,15 +72,15 @@ class OCRProcessor:
             PIL.Image: Imagem pré-processada.
         """
         try:
-            # Converter para escala de cinza
-            img_gray = image.convert('L')
+            # Converter para escala de cinza (páginas já renderizadas em cinza dispensam a cópia)
+            img_gray = image if image.mode == 'L' else image.convert('L')
             
             # Aumentar contraste
             enhancer = ImageEnhance.Contrast(img_gray)
-            img_contrast = enhancer.enhance(2.0)
+            img_contrast = enhancer.enhance(self.CONTRAST_FACTOR)
             
             # Aplicar filtro para reduzir ruído
-            img_filtered = img_contrast.filter(ImageFilter.MedianFilter(size=3))
+            img_filtered = img_contrast.filter(ImageFilter.MedianFilter(size=self.MEDIAN_FILTER_SIZE))
             
             # Binarização (opcional, pode ajudar em alguns casos)
             # threshold = 150
@@ -91,6 +106,15 @@ class OCRProcessor:
             logger.error("Motor OCR não inicializado.")
             return ""
         
+        # Páginas repetidas (anexos padrão, retificações) custam apenas uma consulta ao cache
+        cache_key = None
+        if self.cache:
+            cache_key = self.cache.make_key(image, self.engine_id, self._cache_lang(lang),
+                                            self._preprocessing_settings())
+            cached_text = self.cache.get(cache_key)
+            if cached_text is not None:
+                return cached_text
+        
         try:
             # Pré-processar a imagem
             processed_img = self.preprocess_image(image)
@@ -103,8 +127,23 @@ class OCRProcessor:
             else:
                 # Pytesseract
                 text = self.ocr_engine.image_to_string(processed_img, lang=lang)
-            
-            return text
         except Exception as e:
             logger.error(f"Erro durante OCR: {e}")
             return ""
+        
+        if cache_key:
+            self.cache.put(cache_key, text)
+        
+        return text
+    
+    def _cache_lang(self, lang):
+        """Idioma efetivamente usado pelo motor atual."""
+        return ",".join(self.EASYOCR_LANGUAGES) if self.use_easyocr else lang
+    
+    def _preprocessing_settings(self):
+        """Parâmetros de pré-processamento que influenciam o resultado do OCR."""
+        return {
+            'grayscale': True,
+            'contrast': self.CONTRAST_FACTOR,
+            'median_filter': self.MEDIAN_FILTER_SIZE,
+        }
@@ -4,10 +4,13 @@ Utilitários para carregamento e análise inicial de PDFs.
 
 import os
 import logging
+from concurrent.futures import ProcessPoolExecutor
 import fitz  # PyMuPDF
-import pdfplumber
-from PIL import Image
 import io
+from .document_model import build_page
+
+# O pdfplumber e o PIL são importados no primeiro uso (ver plumber_doc e
+# render_page): um edital só de texto e sem tabelas não paga as importações
 
 # Configuração de logging
 logging.basicConfig(
@@ -28,9 +31,11 @@ class PDFLoader:
         """
         self.pdf_path = pdf_path
         self.doc = None
-        self.plumber_doc = None
+        self._plumber_doc = None
+        self._closed = False
         self.page_count = 0
         self.scanned_pages = []
+        self.page_records = {}
         
         if not os.path.exists(pdf_path):
             raise FileNotFoundError(f"Arquivo PDF não encontrado: {pdf_path}")
@@ -41,19 +46,94 @@ class PDFLoader:
             self.page_count = len(self.doc)
             logger.info(f"PDF '{pdf_path}' carregado com {self.page_count} páginas.")
             
-            # Carregar com pdfplumber para extração de tabelas
-            self.plumber_doc = pdfplumber.open(pdf_path)
-            
         except Exception as e:
             logger.error(f"Erro ao carregar PDF {pdf_path}: {e}")
             raise
     
+    @property
+    def plumber_doc(self):
+        """
+        pdfplumber.PDF: Documento pdfplumber, usado na extração de tabelas.
+        
+        Aberto apenas no primeiro acesso, para que o PDF não seja interpretado por
+        um segundo parser quando as tabelas são extraídas com o PyMuPDF.
+        """
+        if self._plumber_doc is None and not self._closed:
+            import pdfplumber
+            self._plumber_doc = pdfplumber.open(self.pdf_path)
+        return self._plumber_doc
+    
     def close(self):
         """Fecha os documentos PDF abertos."""
+        self._closed = True
         if self.doc:
             self.doc.close()
-        if self.plumber_doc:
-            self.plumber_doc.close()
+        if self._plumber_doc:
+            self._plumber_doc.close()
+    
+    def read_page(self, page_num, text_threshold=50, header_margin=50, footer_margin=50):
+        """
+        Lê uma página uma única vez e produz todos os dados usados pelo pipeline.
+        
+        A página é carregada e interpretada pelo PyMuPDF apenas uma vez: da mesma
+        página de texto saem o texto plano, a decisão de página digitalizada, a
+        cobertura de imagens e o dicionário de layout sem cabeçalho e rodapé.
+        
+        Args:
+            page_num (int): Número da página (0-based).
+            text_threshold (int): Limite mínimo de caracteres para considerar uma página como texto.
+            header_margin (int): Margem superior a ignorar no layout (para remover cabeçalhos).
+            footer_margin (int): Margem inferior a ignorar no layout (para remover rodapés).
+            
+        Returns:
+            PageRecord: Dados da página ou None em caso de erro.
+        """
+        if page_num >= self.page_count:
+            logger.warning(f"Número de página {page_num} fora do intervalo (0-{self.page_count-1}).")
+            return None
+        
+        try:
+            return build_page_record(self.doc[page_num], page_num, text_threshold,
+                                     header_margin, footer_margin)
+        except Exception as e:
+            logger.error(f"Erro ao ler a página {page_num}: {e}")
+            return None
+    
+    def walk_pages(self, start_page=0, end_page=None, **kwargs):
+        """
+        Percorre as páginas do documento gerando um registro por página.
+        
+        Args:
+            start_page (int): Primeira página (0-based).
+            end_page (int): Página final (exclusiva) ou None para ir até o fim.
+            **kwargs: Parâmetros repassados para read_page.
+            
+        Yields:
+            PageRecord: Registro de cada página lida com sucesso.
+        """
+        end_page = self.page_count if end_page is None else min(end_page, self.page_count)
+        
+        for page_num in range(start_page, end_page):
+            record = self.read_page(page_num, **kwargs)
+            if record:
+                yield record
+    
+    def get_page_record(self, page_num):
+        """
+        Obtém o registro de uma página, lendo-a apenas se ainda não foi lida.
+        
+        Args:
+            page_num (int): Número da página (0-based).
+            
+        Returns:
+            PageRecord: Registro da página ou None em caso de erro.
+        """
+        record = self.page_records.get(page_num)
+        if record is None:
+            record = self.read_page(page_num)
+            if record:
+                self.page_records[page_num] = record
+        return record
     
     def is_page_scanned(self, page_num, text_threshold=50):
         """
@@ -70,44 +150,43 @@ class PDFLoader:
             logger.warning(f"Número de página {page_num} fora do intervalo (0-{self.page_count-1}).")
             return False
         
-        page = self.doc[page_num]
-        text = page.get_text("text")
-        
-        if len(text.strip()) < text_threshold:
-            # Pouco ou nenhum texto extraído, verificar imagens
-            images = page.get_images(full=True)
-            if images:
-                # Verificar se alguma imagem cobre uma área significativa da página
-                page_area = page.rect.width * page.rect.height
-                for img_info in images:
-                    try:
-                        img_bbox = page.get_image_bbox(img_info[0])
-                        if img_bbox:
-                            img_area = img_bbox.width * img_bbox.height
-                            # Se uma imagem cobre mais de 50% da página, considerar digitalizada
-                            if img_area / page_area > 0.5:
-                                return True
-                    except Exception as e:
-                        logger.warning(f"Erro ao analisar imagem na página {page_num}: {e}")
-            
-            # Se não há texto e não há imagem grande, ainda pode ser digitalizada
-            return True  # Suposição conservadora
+        record = self.get_page_record(page_num)
+        if record is None:
+            return False
         
-        return False
+        if text_threshold != record.text_threshold:
+            return record.char_count < text_threshold
+        
+        return record.is_scanned
     
-    def analyze_document(self):
+    def analyze_document(self, workers=1):
         """
         Analisa o documento para identificar páginas digitalizadas.
         
+        Cada página é lida uma única vez e o registro resultante fica disponível
+        em page_records para as etapas seguintes (layout, seções, tabelas e OCR).
+        
+        Args:
+            workers (int): Número de processos para ler as páginas. Com mais de um,
+                o documento é dividido em intervalos de páginas e cada processo
+                abre sua própria cópia do PDF.
+        
         Returns:
             dict: Informações sobre o documento, incluindo páginas digitalizadas.
         """
         self.scanned_pages = []
+        self.page_records = {}
+        
+        if workers and workers > 1 and self.page_count > 1:
+            records = self._walk_pages_parallel(workers)
+        else:
+            records = self.walk_pages()
         
-        for page_num in range(self.page_count):
-            if self.is_page_scanned(page_num):
-                self.scanned_pages.append(page_num)
-                logger.info(f"Página {page_num + 1} parece ser digitalizada.")
+        for record in records:
+            self.page_records[record.page_num] = record
+            if record.is_scanned:
+                self.scanned_pages.append(record.page_num)
+                logger.info(f"Página {record.page_num + 1} parece ser digitalizada.")
         
         return {
             "total_pages": self.page_count,
@@ -115,13 +194,41 @@ class PDFLoader:
             "scanned_percentage": len(self.scanned_pages) / self.page_count * 100 if self.page_count > 0 else 0
         }
     
-    def get_page_as_image(self, page_num, dpi=300):
+    def _walk_pages_parallel(self, workers, chunks_per_worker=4):
+        """
+        Lê as páginas em paralelo, dividindo o documento em intervalos contíguos.
+        
+        Args:
+            workers (int): Número de processos.
+            chunks_per_worker (int): Intervalos por processo (equilibra a carga
+                entre trechos com densidades de texto diferentes).
+            
+        Returns:
+            list: Registros de todas as páginas, em ordem.
+        """
+        page_ranges = split_page_ranges(self.page_count, workers * chunks_per_worker)
+        logger.info(f"Lendo {self.page_count} páginas com {workers} processos "
+                    f"em {len(page_ranges)} intervalos...")
+        
+        records = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_read_page_range, self.pdf_path, start, end)
+                       for start, end in page_ranges]
+            # Os intervalos são contíguos e submetidos em ordem
+            for future in futures:
+                records.extend(future.result())
+        
+        return records
+    
+    def get_page_as_image(self, page_num, dpi=300, grayscale=False):
         """
         Converte uma página do PDF em imagem.
         
         Args:
             page_num (int): Número da página (0-based).
             dpi (int): Resolução da imagem em DPI.
+            grayscale (bool): Se True, renderiza diretamente em escala de cinza,
+                sem passar por PNG (caminho usado pelo OCR).
             
         Returns:
             PIL.Image: Objeto de imagem PIL ou None em caso de erro.
@@ -131,11 +238,7 @@ class PDFLoader:
             return None
         
         try:
-            page = self.doc[page_num]
-            pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72))
-            img_data = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_data))
-            return img
+            return render_page(self.doc[page_num], dpi, grayscale)
         except Exception as e:
             logger.error(f"Erro ao converter página {page_num} para imagem: {e}")
             return None
@@ -174,3 +277,239 @@ class PDFLoader:
         except Exception as e:
             logger.error(f"Erro ao extrair texto da página {page_num}: {e}")
             return None
+
+
+class PageRecord:
+    """Dados de uma página obtidos em uma única leitura pelo PyMuPDF."""
+    
+    __slots__ = ('page_num', 'char_count', 'page', 'image_coverage', 'text_threshold', 'is_scanned')
+    
+    def __init__(self, page_num, char_count, page, image_coverage, text_threshold=50):
+        """
+        Inicializa o registro da página.
+        
+        Args:
+            page_num (int): Número da página (0-based).
+            char_count (int): Número de caracteres do texto plano da página inteira.
+            page (Page): Página compacta (ver document_model), sem cabeçalho e rodapé.
+            image_coverage (float): Maior fração da página coberta por uma única imagem (0 a 1).
+            text_threshold (int): Limite de caracteres usado na decisão de página digitalizada.
+        """
+        self.page_num = page_num
+        self.char_count = char_count
+        self.page = page
+        self.image_coverage = image_coverage
+        self.text_threshold = text_threshold
+        # Páginas com pouco ou nenhum texto são tratadas como digitalizadas,
+        # com ou sem imagem grande (suposição conservadora)
+        self.is_scanned = self.char_count < text_threshold
+    
+    @property
+    def blocks(self):
+        """list: Blocos de texto da página."""
+        return self.page.blocks if self.page else []
+
+
+def build_page_record(page, page_num, text_threshold=50, header_margin=50, footer_margin=50):
+    """
+    Constrói o registro de uma página a partir de uma única página de texto do PyMuPDF.
+    
+    Args:
+        page (fitz.Page): Página já carregada.
+        page_num (int): Número da página (0-based).
+        text_threshold (int): Limite mínimo de caracteres para considerar uma página como texto.
+        header_margin (int): Margem superior a ignorar no layout.
+        footer_margin (int): Margem inferior a ignorar no layout.
+        
+    Returns:
+        PageRecord: Registro da página.
+    """
+    page_rect = page.rect
+    
+    # Uma única interpretação do conteúdo da página serve a todas as extrações.
+    # Os blocos de imagem ficam de fora do layout: copiar os bytes das imagens
+    # custa caro e nenhuma etapa seguinte os utiliza.
+    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_DICT & ~fitz.TEXT_PRESERVE_IMAGES)
+    text = page.get_text("text", textpage=textpage)
+    page_dict = page.get_text("dict", textpage=textpage, sort=True)
+    
+    # Cobertura de imagens, calculada apenas para páginas com pouco texto
+    image_coverage = 0.0
+    page_area = page_rect.width * page_rect.height
+    if len(text.strip()) < text_threshold and page_area > 0:
+        for img_info in page.get_image_info():
+            x0, y0, x1, y1 = img_info['bbox']
+            image_coverage = max(image_coverage, (x1 - x0) * (y1 - y0) / page_area)
+    
+    # O layout é reduzido ao modelo compacto; o dicionário do PyMuPDF é descartado
+    layout = _clip_layout(page_dict, page_rect.y0 + header_margin, page_rect.y1 - footer_margin)
+    
+    return PageRecord(page_num, len(text.strip()), build_page(page_num, layout),
+                      min(image_coverage, 1.0), text_threshold)
+
+
+def render_page(page, dpi=300, grayscale=False):
+    """
+    Converte uma página já carregada em imagem.
+    
+    Em escala de cinza, o pixmap é gerado diretamente pelo PyMuPDF e sua
+    memória (samples_mv) é usada como buffer da imagem, somente leitura, sem
+    cópias e sem codificar e decodificar PNG. A imagem guarda o pixmap no
+    atributo pixmap, para que a memória continue válida enquanto ela existir.
+    
+    Args:
+        page (fitz.Page): Página do PyMuPDF.
+        dpi (int): Resolução da imagem em DPI.
+        grayscale (bool): Se True, gera a imagem em escala de cinza (modo "L").
+        
+    Returns:
+        PIL.Image: Imagem da página.
+    """
+    from PIL import Image
+    
+    if grayscale:
+        pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72), colorspace=fitz.csGRAY, alpha=False)
+        image = Image.frombuffer("L", (pix.width, pix.height), pix.samples_mv, "raw", "L", pix.stride, 1)
+        image.pixmap = pix
+        return image
+    
+    pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72))
+    img_data = pix.tobytes("png")
+    return Image.open(io.BytesIO(img_data))
+
+
+def render_page_array(page, dpi=300):
+    """
+    Converte uma página já carregada em um array NumPy em escala de cinza.
+    
+    O array é uma visão somente leitura sobre a memória do pixmap, sem cópias;
+    o pixmap é mantido vivo pela base do array.
+    
+    Args:
+        page (fitz.Page): Página do PyMuPDF.
+        dpi (int): Resolução da imagem em DPI.
+        
+    Returns:
+        numpy.ndarray: Array (altura, largura) do tipo uint8.
+    """
+    import numpy as np
+    
+    pix = page.get_pixmap(matrix=fitz.Matrix(dpi/72, dpi/72), colorspace=fitz.csGRAY, alpha=False)
+    array = np.asarray(_PixmapSamples(pix))
+    return array[:, :pix.width]
+
+
+class _PixmapSamples:
+    """Expõe a memória de um pixmap em cinza ao NumPy (somente leitura), mantendo o pixmap vivo."""
+    
+    __slots__ = ('pixmap', '__array_interface__')
+    
+    def __init__(self, pixmap):
+        self.pixmap = pixmap
+        self.__array_interface__ = {
+            'shape': (pixmap.height, pixmap.stride),
+            'typestr': '|u1',
+            'data': (pixmap.samples_ptr, True),
+            'version': 3,
+        }
+
+
+def split_page_ranges(page_count, parts):
+    """
+    Divide as páginas em intervalos contíguos de tamanho aproximadamente igual.
+    
+    Args:
+        page_count (int): Número total de páginas.
+        parts (int): Número desejado de intervalos.
+        
+    Returns:
+        list: Lista de tuplas (início, fim), com fim exclusivo.
+    """
+    parts = max(1, min(parts, page_count))
+    size, remainder = divmod(page_count, parts)
+    
+    ranges = []
+    start = 0
+    for i in range(parts):
+        end = start + size + (1 if i < remainder else 0)
+        if end > start:
+            ranges.append((start, end))
+        start = end
+    
+    return ranges
+
+
+def _read_page_range(pdf_path, start_page, end_page):
+    """
+    Lê um intervalo de páginas em um processo separado.
+    
+    Cada processo abre sua própria cópia do documento, já que objetos do
+    PyMuPDF não podem ser compartilhados entre processos.
+    
+    Args:
+        pdf_path (str): Caminho para o arquivo PDF.
+        start_page (int): Primeira página (0-based).
+        end_page (int): Página final (exclusiva).
+        
+    Returns:
+        list: Registros das páginas lidas com sucesso.
+    """
+    records = []
+    doc = fitz.open(pdf_path)
+    try:
+        for page_num in range(start_page, end_page):
+            try:
+                records.append(build_page_record(doc[page_num], page_num))
+            except Exception as e:
+                logger.error(f"Erro ao ler a página {page_num}: {e}")
+    finally:
+        doc.close()
+    
+    return records
+
+
+def _clip_layout(page_dict, top, bottom):
+    """
+    Remove do layout as linhas fora da faixa vertical [top, bottom].
+    
+    Equivale ao recorte (clip) do PyMuPDF para cabeçalhos e rodapés, mas sem
+    interpretar a página novamente. Uma linha é mantida quando seu centro
+    vertical está dentro da faixa.
+    
+    Args:
+        page_dict (dict): Dicionário de layout da página inteira.
+        top (float): Limite superior da faixa.
+        bottom (float): Limite inferior da faixa.
+        
+    Returns:
+        dict: Dicionário de layout recortado.
+    """
+    clipped_blocks = []
+    
+    for block in page_dict.get('blocks', []):
+        x0, y0, x1, y1 = block['bbox']
+        
+        if block.get('type') != 0:
+            if y0 >= top and y1 <= bottom:
+                clipped_blocks.append(block)
+            continue
+        
+        if y0 >= top and y1 <= bottom:
+            # Bloco inteiramente dentro da faixa
+            clipped_blocks.append(block)
+            continue
+        
+        lines = [line for line in block.get('lines', [])
+                 if top <= (line['bbox'][1] + line['bbox'][3]) / 2 <= bottom]
+        if lines:
+            block['lines'] = lines
+            block['bbox'] = (
+                min(line['bbox'][0] for line in lines),
+                min(line['bbox'][1] for line in lines),
+                max(line['bbox'][2] for line in lines),
+                max(line['bbox'][3] for line in lines)
+            )
+            clipped_blocks.append(block)
+    
+    page_dict['blocks'] = clipped_blocks
+    return page_dict
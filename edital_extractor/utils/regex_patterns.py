@@ -4,11 +4,34 @@ Padrões de expressões regulares para extração de dados de editais.
 
 import re
 
-# Padrões para datas
-DATE_PATTERN_SLASH = re.compile(r'\b(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/(19\d{2}|20\d{2})\b')
-DATE_PATTERN_DASH = re.compile(r'\b(0[1-9]|[12][0-9]|3[01])-(0[1-9]|1[0-2])-(19\d{2}|20\d{2})\b')
-DATE_PATTERN_EXTENSO = re.compile(r'\b(0?[1-9]|[12][0-9]|3[01])\s+de\s+(janeiro|fevereiro|mar[çc]o|abril|maio|junho|julho|agosto|setembro|outubro|novembro|dezembro)\s+de\s+(19\d{2}|20\d{2})\b', re.IGNORECASE)
-DATE_RANGE_PATTERN = re.compile(r'\b(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/(19\d{2}|20\d{2})\s+a\s+(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/(19\d{2}|20\d{2})\b')
+# Padrões para datas: um único padrão reconhece, em cada posição, um intervalo
+# (DD/MM/AAAA a DD/MM/AAAA), uma data com barras ou hífens (DD/MM/AAAA,
+# DD-MM-AAAA) ou uma data por extenso ("12 de março de 2025"). Os espaços
+# dentro de uma data nunca incluem quebras de linha. Toda data começa por um
+# dígito; a verificação inicial (?=\d) descarta rapidamente as demais posições.
+DATE_DAY = r'0?[1-9]|[12][0-9]|3[01]'
+DATE_MONTH = r'0?[1-9]|1[0-2]'
+DATE_YEAR = r'(?:19|20)\d{2}'
+
+# Meses por extenso -> número
+MONTHS = {
+    'janeiro': 1, 'fevereiro': 2, 'março': 3, 'marco': 3, 'abril': 4, 'maio': 5, 'junho': 6,
+    'julho': 7, 'agosto': 8, 'setembro': 9, 'outubro': 10, 'novembro': 11, 'dezembro': 12,
+}
+
+def _numeric_date(n):
+    """Padrão de uma data numérica com grupos nomeados (o separador se repete)."""
+    return (rf'(?P<day{n}>{DATE_DAY})(?P<sep{n}>[/-])(?P<month{n}>{DATE_MONTH})'
+            rf'(?P=sep{n})(?P<year{n}>{DATE_YEAR})')
+
+DATE_PATTERN = re.compile(
+    r'(?=\d)\b(?:'
+    + _numeric_date(1) + r'(?:[^\S\n]+(?:a|até|à)[^\S\n]+' + _numeric_date(2) + r')?'
+    + rf'|(?P<day3>{DATE_DAY})[^\S\n]+de[^\S\n]+(?P<month3>{"|".join(MONTHS)})[^\S\n]+de[^\S\n]+'
+    + rf'(?P<year3>{DATE_YEAR})'
+    + r')\b',
+    re.IGNORECASE
+)
 
 # Padrões para valores monetários
 MONEY_PATTERN = re.compile(r'R\$\s?(\d{1,3}(\.\d{3})*,\d{2})\b')
@@ -25,20 +48,103 @@ LIST_MARKER_ALPHA = re.compile(r'^\s*([a-zA-Z][\.\)])\s+')
 LIST_MARKER_ROMAN = re.compile(r'^\s*([ivxlcdm]+[\.\)])\s+', re.IGNORECASE)
 LIST_MARKER_BULLET = re.compile(r'^\s*([*•-])\s+')
 
+# Regras para identificação de seções comuns em editais, em ordem de prioridade:
+# (seção, padrão, palavras que precisam aparecer no título para o padrão casar).
+# As palavras são escritas em maiúsculas e sem acentos; None indica um padrão
+# que pode casar no meio de uma palavra e por isso é verificado em todo texto.
+SECTION_RULES = [
+    ('identificacao', r'EDITAL\s+(?:N[º°\.])?\s*(\d+[/-]\d{4})', None),
+    ('cronograma', r'\b(CRONOGRAMA|DATAS\s+IMPORTANTES|CALEND[ÁA]RIO)\b', ['CRONOGRAMA', 'DATAS', 'CALENDARIO']),
+    ('inscricao', r'\b(INSCRI[ÇC][ÃA]O|DAS\s+INSCRI[ÇC][ÕO]ES)\b', ['INSCRICAO', 'INSCRICOES']),
+    ('cargos', r'\b(CARGOS|DOS\s+CARGOS|QUADRO\s+DE\s+CARGOS)\b', ['CARGOS']),
+    ('vagas', r'\b(VAGAS|DAS\s+VAGAS|QUADRO\s+DE\s+VAGAS|DISTRIBUI[ÇC][ÃA]O\s+DAS\s+VAGAS)\b', ['VAGAS']),
+    ('requisitos', r'\b(REQUISITOS|DOS\s+REQUISITOS|REQUISITOS\s+M[ÍI]NIMOS)\b', ['REQUISITOS']),
+    ('remuneracao', r'\b(REMUNERA[ÇC][ÃA]O|DA\s+REMUNERA[ÇC][ÃA]O|VENCIMENTOS)\b', ['REMUNERACAO', 'VENCIMENTOS']),
+    ('conteudo_programatico', r'\b(CONTE[ÚU]DO\s+PROGRAM[ÁA]TICO|ANEXO\s+.*CONTE[ÚU]DO|PROGRAMA\s+DE\s+PROVAS)\b', ['CONTEUDO', 'PROGRAMA']),
+    ('conhecimentos_basicos', r'\b(CONHECIMENTOS\s+B[ÁA]SICOS|CONHECIMENTOS\s+GERAIS)\b', ['CONHECIMENTOS']),
+    ('conhecimentos_especificos', r'\b(CONHECIMENTOS\s+ESPEC[ÍI]FICOS)\b', ['CONHECIMENTOS']),
+    ('prova_discursiva', r'\b(PROVA\s+DISCURSIVA|DA\s+PROVA\s+DISCURSIVA|PROVA\s+DE\s+REDA[ÇC][ÃA]O)\b', ['DISCURSIVA', 'REDACAO']),
+    ('recursos', r'\b(RECURSOS|DOS\s+RECURSOS|INTERPOSI[ÇC][ÃA]O\s+DE\s+RECURSOS)\b', ['RECURSOS']),
+    ('heteroidentificacao', r'\b(HETEROIDENTIFICA[ÇC][ÃA]O|DA\s+HETEROIDENTIFICA[ÇC][ÃA]O|PROCEDIMENTO\s+DE\s+HETEROIDENTIFICA[ÇC][ÃA]O)\b', ['HETEROIDENTIFICACAO']),
+]
+
 # Padrões para identificação de seções comuns em editais
 SECTION_PATTERNS = {
-    'identificacao': re.compile(r'EDITAL\s+(?:N[º°\.])?\s*(\d+[/-]\d{4})', re.IGNORECASE),
-    'cronograma': re.compile(r'\b(CRONOGRAMA|DATAS\s+IMPORTANTES|CALEND[ÁA]RIO)\b', re.IGNORECASE),
-    'inscricao': re.compile(r'\b(INSCRI[ÇC][ÃA]O|DAS\s+INSCRI[ÇC][ÕO]ES)\b', re.IGNORECASE),
-    'cargos': re.compile(r'\b(CARGOS|DOS\s+CARGOS|QUADRO\s+DE\s+CARGOS)\b', re.IGNORECASE),
-    'vagas': re.compile(r'\b(VAGAS|DAS\s+VAGAS|QUADRO\s+DE\s+VAGAS|DISTRIBUI[ÇC][ÃA]O\s+DAS\s+VAGAS)\b', re.IGNORECASE),
-    'requisitos': re.compile(r'\b(REQUISITOS|DOS\s+REQUISITOS|REQUISITOS\s+M[ÍI]NIMOS)\b', re.IGNORECASE),
-    'remuneracao': re.compile(r'\b(REMUNERA[ÇC][ÃA]O|DA\s+REMUNERA[ÇC][ÃA]O|VENCIMENTOS)\b', re.IGNORECASE),
-    'conteudo_programatico': re.compile(r'\b(CONTE[ÚU]DO\s+PROGRAM[ÁA]TICO|ANEXO\s+.*CONTE[ÚU]DO|PROGRAMA\s+DE\s+PROVAS)\b', re.IGNORECASE),
-    'conhecimentos_basicos': re.compile(r'\b(CONHECIMENTOS\s+B[ÁA]SICOS|CONHECIMENTOS\s+GERAIS)\b', re.IGNORECASE),
-    'conhecimentos_especificos': re.compile(r'\b(CONHECIMENTOS\s+ESPEC[ÍI]FICOS)\b', re.IGNORECASE),
+    section_type: re.compile(pattern, re.IGNORECASE)
+    for section_type, pattern, _ in SECTION_RULES
 }
 
+# Tabela para remover acentos de texto em maiúsculas
+ACCENT_TABLE = str.maketrans('ÁÀÂÃÄÉÈÊËÍÌÎÏÓÒÔÕÖÚÙÛÜÇ', 'AAAAAEEEEIIIIOOOOOUUUUC')
+WORD_PATTERN = re.compile(r'\w+')
+
+class SectionClassifier:
+    """
+    Classificador de títulos de seção em uma única passagem pelo texto.
+    
+    As palavras do texto são normalizadas e consultadas em um índice
+    palavra -> regras; apenas as regras candidatas têm o padrão completo
+    verificado, em ordem de prioridade. O custo por bloco não cresce com o
+    número de regras registradas.
+    """
+    
+    def __init__(self, rules):
+        """
+        Inicializa o classificador.
+        
+        Args:
+            rules (list): Regras (seção, padrão, palavras-chave) em ordem de prioridade.
+        """
+        self.rules = []
+        self.keyword_index = {}
+        self.unindexed = []
+        for section_type, pattern, keywords in rules:
+            self.add_rule(section_type, pattern, keywords)
+    
+    def add_rule(self, section_type, pattern, keywords):
+        """
+        Registra uma regra com prioridade menor que as já existentes.
+        
+        Args:
+            section_type (str): Tipo de seção.
+            pattern (str): Expressão regular do título (sem distinção de maiúsculas).
+            keywords (list): Palavras, em maiúsculas e sem acentos, das quais ao menos
+                uma aparece em todo título que casa com o padrão, ou None para
+                verificar o padrão em todo texto.
+        """
+        priority = len(self.rules)
+        self.rules.append((section_type, re.compile(pattern, re.IGNORECASE)))
+        if keywords is None:
+            self.unindexed.append(priority)
+            return
+        for keyword in keywords:
+            self.keyword_index.setdefault(keyword, []).append(priority)
+    
+    def classify(self, text):
+        """
+        Identifica a seção de um título.
+        
+        Args:
+            text (str): Texto do bloco.
+            
+        Returns:
+            str: Tipo da seção de maior prioridade cujo padrão casa com o texto, ou None.
+        """
+        candidates = set(self.unindexed)
+        for word in WORD_PATTERN.findall(text.upper().translate(ACCENT_TABLE)):
+            priorities = self.keyword_index.get(word)
+            if priorities:
+                candidates.update(priorities)
+        
+        for priority in sorted(candidates):
+            section_type, pattern = self.rules[priority]
+            if pattern.search(text):
+                return section_type
+        
+        return None
+
+SECTION_CLASSIFIER = SectionClassifier(SECTION_RULES)
+
 # Palavras-chave para informações específicas
 KEYWORDS = {
     'taxa_inscricao': [
@@ -59,29 +165,110 @@ KEYWORDS = {
     ],
 }
 
-def find_all_dates(text):
+# Regras da extração de dados estruturados: (nome, padrão, flags). Os padrões
+# são compilados uma única vez, na importação, e compartilhados por todos os
+# documentos e threads (objetos re.Pattern não guardam estado entre buscas).
+DATA_RULES = [
+    ('numero_edital', r'EDITAL\s+(?:N[º°\.])?\s*(\d+[/-]\d{4})', re.IGNORECASE),
+    ('ano', r'(?:CONCURSO|SELE[ÇC][ÃA]O).*?(\d{4})', re.IGNORECASE),
+    ('numero', r'\d+', 0),
+    ('prefixo_descricao', r'^[:\-–—\s]+', 0),
+    ('conector_periodo', r'\s*(?:a|até|e)\s*', re.IGNORECASE),
+    ('cargo', r'(?:CARGO|FUNÇÃO)(?:\s*:|\s+DE|\s+)\s*([A-ZÁÀÂÃÉÈÊÍÏÓÔÕÖÚÇÑ\s]+)(?:\s*-|\s*:|\s*\n)', re.IGNORECASE),
+    ('vagas', r'(\d+)\s+(?:vagas|vaga)', re.IGNORECASE),
+    ('vagas_ac', r'(\d+)\s+(?:vaga|vagas)?\s*(?:para)?\s*(?:ampla\s+concorrência|AC)', re.IGNORECASE),
+    ('vagas_pcd', r'(\d+)\s+(?:vaga|vagas)?\s*(?:para)?\s*(?:pessoa|candidato)?\s*(?:com)?\s*(?:deficiência|PCD|PcD)', re.IGNORECASE),
+    ('vagas_negros', r'(\d+)\s+(?:vaga|vagas)?\s*(?:para)?\s*(?:pessoa|candidato)?\s*(?:negra|negro|preta|preto|parda|pardo)', re.IGNORECASE),
+    ('conhecimentos_basicos', r'\b(CONHECIMENTOS\s+B[ÁA]SICOS|CONHECIMENTOS\s+GERAIS)\b', re.IGNORECASE),
+    ('conhecimentos_especificos', r'\b(CONHECIMENTOS\s+ESPEC[ÍI]FICOS)(?:\s*(?:PARA|DO|DE|-)?\s*(.+))?\b', re.IGNORECASE),
+    ('disciplina', r'^[A-ZÁÀÂÃÉÈÊÍÏÓÔÕÖÚÇÑ\s]{3,50}:?$', 0),
+    ('marcador_topico', r'^\s*[\d\.\)\-•*]+\s*', 0),
+]
+
+DATA_PATTERNS = {
+    name: re.compile(pattern, flags)
+    for name, pattern, flags in DATA_RULES
+}
+
+# Regras baseadas nas palavras-chave de KEYWORDS: (grupo de palavras-chave,
+# padrão que segue a palavra-chave, flags). Cada palavra-chave gera um padrão,
+# testado na ordem de KEYWORDS.
+KEYWORD_RULES = [
+    ('taxa_inscricao', r'.*?R\$\s?(\d{1,3}(?:\.\d{3})*,\d{2})', re.IGNORECASE),
+    ('requisitos', r'(?:\s*:|\s*-|\s*)\s*(.*?)(?:\n\s*\n|\n(?:[A-Z][a-z]+:))', re.IGNORECASE | re.DOTALL),
+]
+
+KEYWORD_PATTERNS = {
+    group: [re.compile(r'(?:' + re.escape(keyword) + r')' + suffix, flags) for keyword in KEYWORDS[group]]
+    for group, suffix, flags in KEYWORD_RULES
+}
+
+class DateSpan:
+    """Data ou intervalo de datas encontrado em um texto, com o valor em ISO 8601."""
+    
+    __slots__ = ('kind', 'start', 'end', 'text', 'value', 'parts')
+    
+    def __init__(self, kind, start, end, text, value, parts=()):
+        """
+        Inicializa a data.
+        
+        Args:
+            kind (str): "data" (DD/MM/AAAA ou DD-MM-AAAA), "extenso" ou "intervalo".
+            start (int): Posição inicial no texto.
+            end (int): Posição final (exclusiva) no texto.
+            text (str): Trecho do texto.
+            value (str): Data no formato AAAA-MM-DD; nos intervalos, "início/fim".
+            parts (tuple): Nos intervalos, as duas datas (DateSpan) que os delimitam.
+        """
+        self.kind = kind
+        self.start = start
+        self.end = end
+        self.text = text
+        self.value = value
+        self.parts = parts
+    
+    def __repr__(self):
+        return f"DateSpan({self.kind!r}, {self.start}, {self.end}, {self.text!r}, {self.value!r})"
+
+def _iso_date(day, month, year):
+    """Formata a data como AAAA-MM-DD (o calendário não é validado)."""
+    return f"{int(year):04d}-{int(month):02d}-{int(day):02d}"
+
+def find_all_dates(text, pos=0, endpos=None):
     """
-    Encontra todas as datas em um texto.
+    Encontra todas as datas em um texto, em uma única passagem de DATE_PATTERN.
+    
+    Os intervalos são devolvidos como uma única data do tipo "intervalo" (e não
+    também como as duas datas que os formam); as datas não se sobrepõem.
     
     Args:
         text (str): Texto a ser analisado.
+        pos (int): Posição onde a busca começa.
+        endpos (int): Posição onde a busca termina (opcional).
         
     Returns:
-        list: Lista de datas encontradas.
+        list: Datas encontradas (DateSpan), na ordem do texto.
     """
     dates = []
     
-    # Encontrar datas no formato DD/MM/AAAA
-    dates.extend(DATE_PATTERN_SLASH.findall(text))
-    
-    # Encontrar datas no formato DD-MM-AAAA
-    dates.extend(DATE_PATTERN_DASH.findall(text))
-    
-    # Encontrar datas por extenso
-    dates.extend(DATE_PATTERN_EXTENSO.findall(text))
-    
-    # Encontrar intervalos de datas
-    dates.extend(DATE_RANGE_PATTERN.findall(text))
+    for match in DATE_PATTERN.finditer(text, pos, len(text) if endpos is None else endpos):
+        start = match.start()
+        day, month, year, end_day, end_month, end_year, written_day = match.group(
+            'day1', 'month1', 'year1', 'day2', 'month2', 'year2', 'day3')
+        
+        if written_day:
+            value = _iso_date(written_day, MONTHS[match.group('month3').lower()], match.group('year3'))
+            dates.append(DateSpan('extenso', start, match.end(), match.group(), value))
+        elif end_day is None:
+            dates.append(DateSpan('data', start, match.end(), match.group(), _iso_date(day, month, year)))
+        else:
+            first_end = match.end('year1')
+            last_start = match.start('day2')
+            first = DateSpan('data', start, first_end, text[start:first_end], _iso_date(day, month, year))
+            last = DateSpan('data', last_start, match.end(), text[last_start:match.end()],
+                            _iso_date(end_day, end_month, end_year))
+            dates.append(DateSpan('intervalo', start, match.end(), match.group(),
+                                  f"{first.value}/{last.value}", (first, last)))
     
     return dates
 
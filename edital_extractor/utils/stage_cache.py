@@ -0,0 +1,147 @@
+"""
+Cache em disco dos resultados de cada etapa do processamento de um PDF.
+"""
+
+import hashlib
+import importlib.util
+import json
+import logging
+import os
+import pickle
+import tempfile
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# Versão do formato das entradas; alterar invalida todo o cache
+CACHE_FORMAT = 1
+
+
+def file_sha256(path, chunk_size=1024 * 1024):
+    """
+    Calcula o SHA-256 de um arquivo.
+    
+    Args:
+        path (str): Caminho do arquivo.
+        chunk_size (int): Tamanho dos blocos lidos.
+        
+    Returns:
+        str: Hash hexadecimal.
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_version(modules, upstream=None, params=None):
+    """
+    Calcula a versão de uma etapa a partir do código-fonte dos módulos que a implementam.
+    
+    A versão muda quando o código de qualquer um dos módulos muda, quando a
+    versão de uma etapa anterior muda ou quando os parâmetros mudam.
+    
+    Args:
+        modules (list): Módulos Python que implementam a etapa, ou seus nomes
+            completos (localizados sem importar o módulo).
+        upstream (list): Versões das etapas das quais esta depende.
+        params (dict): Parâmetros que influenciam o resultado da etapa.
+        
+    Returns:
+        str: Versão hexadecimal da etapa.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"format={CACHE_FORMAT}".encode('utf-8'))
+    
+    for module in modules:
+        if isinstance(module, str):
+            name, path = module, importlib.util.find_spec(module).origin
+        else:
+            name, path = module.__name__, module.__file__
+        with open(path, 'rb') as f:
+            digest.update(name.encode('utf-8'))
+            digest.update(f.read())
+    
+    for version in upstream or []:
+        digest.update(version.encode('utf-8'))
+    
+    digest.update(json.dumps(params or {}, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+class StageCache:
+    """Cache dos resultados das etapas, com chave pelo hash do PDF e versão da etapa."""
+    
+    def __init__(self, cache_dir):
+        """
+        Inicializa o cache de etapas.
+        
+        Args:
+            cache_dir (str): Diretório onde os resultados são armazenados.
+        """
+        self.cache_dir = cache_dir
+        
+        if not os.path.exists(cache_dir):
+            os.makedirs(cache_dir, exist_ok=True)
+    
+    def _path(self, pdf_hash, stage, version):
+        return os.path.join(self.cache_dir, pdf_hash, f"{stage}-{version}.pkl")
+    
+    def load(self, pdf_hash, stage, version):
+        """
+        Carrega o resultado de uma etapa.
+        
+        Args:
+            pdf_hash (str): SHA-256 do PDF.
+            stage (str): Nome da etapa.
+            version (str): Versão da etapa.
+            
+        Returns:
+            tuple: (encontrado, resultado).
+        """
+        path = self._path(pdf_hash, stage, version)
+        if not os.path.exists(path):
+            return False, None
+        
+        try:
+            with open(path, 'rb') as f:
+                return True, pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Entrada de cache inválida para a etapa '{stage}': {e}")
+            return False, None
+    
+    def save(self, pdf_hash, stage, version, result):
+        """
+        Salva o resultado de uma etapa, removendo versões anteriores da mesma etapa.
+        
+        Args:
+            pdf_hash (str): SHA-256 do PDF.
+            stage (str): Nome da etapa.
+            version (str): Versão da etapa.
+            result: Resultado da etapa (precisa ser serializável com pickle).
+        """
+        path = self._path(pdf_hash, stage, version)
+        directory = os.path.dirname(path)
+        
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Erro ao gravar a etapa '{stage}' no cache: {e}")
+            return
+        
+        # Remover versões anteriores da etapa
+        for name in os.listdir(directory):
+            if name.startswith(f"{stage}-") and name.endswith('.pkl') and name != os.path.basename(path):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass